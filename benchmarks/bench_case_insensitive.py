@@ -0,0 +1,95 @@
+"""Benchmark for attribute access on case insensitive COM interface pointers.
+
+Interface pointer classes of `_case_insensitive_` interfaces resolve other
+spellings of member names with aliases from `comtypes._post_coinit._case_alias`.
+This compares them with the former `__getattr__` and `__setattr__` hooks, which looked up
+`__map_case__` on every access.
+
+Since `comtypes` can only be imported on Windows, the pointer classes are
+stand-ins derived from `c_void_p` and the `_case_alias` module is loaded
+from its file, so this runs on any platform.
+
+    python benchmarks/bench_case_insensitive.py
+"""
+
+import importlib.util
+import timeit
+from ctypes import c_void_p
+from pathlib import Path
+
+NUMBER = 1_000_000
+
+_path = Path(__file__).parent.parent / "comtypes" / "_post_coinit" / "_case_alias.py"
+_spec = importlib.util.spec_from_file_location("_case_alias", _path)
+_case_alias = importlib.util.module_from_spec(_spec)  # type: ignore
+_spec.loader.exec_module(_case_alias)  # type: ignore
+
+
+class _StandIn(c_void_p):
+    # Members defined on classes with an `_iid_` are interface members.
+    _iid_ = None
+    __map_case__ = {"visible": "Visible", "quit": "Quit"}
+
+    def __init__(self):
+        super().__init__()
+        self._visible = False
+
+    @property
+    def Visible(self):
+        return self._visible
+
+    @Visible.setter
+    def Visible(self, value):
+        self._visible = value
+
+    def Quit(self):
+        pass
+
+
+class Hooks(_StandIn):
+    """The former implementation."""
+
+    def __getattr__(self, name):
+        try:
+            fixed_name = self.__map_case__[name.lower()]
+        except KeyError:
+            raise AttributeError(name)
+        if fixed_name != name:
+            return getattr(self, fixed_name)
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, self.__map_case__.get(name.lower(), name), value)
+
+
+class Aliases(_StandIn):
+    """The current implementation."""
+
+    __getattr__ = _case_alias.case_insensitive_getattr
+    __setattr__ = _case_alias.case_insensitive_setattr
+
+
+_case_alias.add_case_aliases(Aliases, Aliases.__map_case__)
+
+
+def main() -> None:
+    for cls in (Hooks, Aliases):
+        obj = cls()
+        cases = [
+            ("get obj.Visible", lambda: obj.Visible),
+            ("get obj.visible", lambda: obj.visible),
+            ("get obj.VISIBLE", lambda: obj.VISIBLE),
+            ("obj.quit()", lambda: obj.quit()),
+            ("set obj.Visible", lambda: setattr(obj, "Visible", True)),
+            ("set obj.visible", lambda: setattr(obj, "visible", True)),
+            ("set obj.VISIBLE", lambda: setattr(obj, "VISIBLE", True)),
+            ("set obj.other", lambda: setattr(obj, "other", True)),
+        ]
+        print(f"{cls.__name__}: {cls.__doc__}")
+        for name, func in cases:
+            elapsed = timeit.timeit(func, number=NUMBER)
+            print(f"  {name:<20} {elapsed / NUMBER * 1e9:10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
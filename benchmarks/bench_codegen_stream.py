@@ -0,0 +1,98 @@
+"""Benchmark for writing large generated wrapper modules.
+
+`CodeGenerator` collects the definitions of a wrapper module in a
+`comtypes.tools.codegenerator.spool.SpooledCodeWriter` and copies them into
+the module file, instead of assembling the module in an `io.StringIO` and
+writing the resulting string.  This compares both for synthetic modules of
+increasing size, in time and in peak memory traced by `tracemalloc`.
+
+Since `comtypes` can only be imported on Windows, the `spool` module is
+loaded from its file, so this runs on any platform.
+
+    python benchmarks/bench_codegen_stream.py
+"""
+
+import importlib.util
+import io
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+_path = Path(__file__).parent.parent / "comtypes/tools/codegenerator/spool.py"
+_spec = importlib.util.spec_from_file_location("spool", _path)
+spool = importlib.util.module_from_spec(_spec)  # type: ignore
+_spec.loader.exec_module(spool)  # type: ignore
+
+HEADER = "from ctypes import *\n\nfrom comtypes import GUID\n"
+
+
+def write_definitions(stream, count, checkpoint=None):
+    # Roughly what the code generator writes for a dispinterface.
+    for i in range(count):
+        if checkpoint is not None:
+            checkpoint()
+        print(file=stream)
+        print(file=stream)
+        print(f"class IInterface{i}(comtypes.gen._stdole.IDispatch):", file=stream)
+        print("    _case_insensitive_ = True", file=stream)
+        print(
+            f"    _iid_ = GUID('{{{i:08X}-0000-0000-C000-000000000046}}')", file=stream
+        )
+        print("    _idlflags_ = ['dual', 'oleautomation']", file=stream)
+        print(file=stream)
+        print(file=stream)
+        print(f"IInterface{i}._disp_methods_ = [", file=stream)
+        for j in range(20):
+            print(
+                f"    DISPMETHOD([dispid({j}), 'propget'], VARIANT, 'Member{j}'),",
+                file=stream,
+            )
+        print("]", file=stream)
+
+
+def assemble(count, ofi):
+    """The former implementation."""
+    stream = io.StringIO()
+    write_definitions(stream, count)
+    output = io.StringIO()
+    print(HEADER, file=output)
+    print(stream.getvalue(), file=output)
+    print(output.getvalue(), file=ofi)
+
+
+def spooled(count, ofi):
+    """The current implementation."""
+    stream = spool.SpooledCodeWriter()
+    write_definitions(stream, count, stream.checkpoint)
+    print(HEADER, file=ofi)
+    stream.copy_to(ofi)
+    print(file=ofi)
+    stream.close()
+
+
+def measure(func, count):
+    with tempfile.TemporaryFile("w") as ofi:
+        tracemalloc.start()
+        start = time.perf_counter()
+        func(count, ofi)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        size = ofi.tell()
+    return elapsed, peak, size
+
+
+def main() -> None:
+    for count in (100, 1_000, 10_000):
+        for func in (assemble, spooled):
+            elapsed, peak, size = measure(func, count)
+            print(
+                f"{count:>6} interfaces, {size / 1e6:6.1f} MB  "
+                f"{func.__name__:<8} {elapsed * 1e3:8.1f} ms  "
+                f"peak {peak / 1e6:7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark for wrapper modules with their type annotations in a stub.
+
+With `comtypes.client.set_stub_files(True)`, the `if TYPE_CHECKING:` blocks
+of the interfaces are written to a `.pyi` file instead of the module.  This
+generates the wrapper module of a typelib both ways, and compares the size
+of the module, the time to compile it, and the time to execute the compiled
+code, which is what importing it from a `.pyc` file costs.
+
+    python benchmarks/bench_codegen_stubs.py [typelib]
+
+The typelib defaults to "scrrun.dll"; larger ones like "msxml6.dll" or
+"mshtml.tlb" show the difference better.
+"""
+
+import io
+import marshal
+import sys
+import time
+from unittest import mock
+
+import comtypes
+from comtypes import typeinfo
+from comtypes.client._generate import _get_known_namespaces
+from comtypes.tools import tlbparser
+from comtypes.tools.codegenerator import CodeGenerator
+
+REPEAT = 5
+
+
+def generate(items, filename, stubs):
+    codegen = CodeGenerator(*_get_known_namespaces(), stubs=stubs)
+    codegen.generate_wrapper(items, filename)
+    output = io.StringIO()
+    codegen.write_wrapper_code(output)
+    return output.getvalue()
+
+
+def measure(code):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        compiled = compile(code, "<wrapper>", "exec")
+    compile_time = (time.perf_counter() - start) / REPEAT
+    pyc_size = len(marshal.dumps(compiled))
+    start = time.perf_counter()
+    # Keep the classes of the registries, which executing would replace.
+    with mock.patch.dict(comtypes._coclass_registry_by_clsid):
+        with mock.patch.dict(comtypes._interface_registry_by_iid):
+            for _ in range(REPEAT):
+                exec(marshal.loads(marshal.dumps(compiled)), {"__name__": "wrapper"})
+    exec_time = (time.perf_counter() - start) / REPEAT
+    return pyc_size, compile_time, exec_time
+
+
+def main() -> None:
+    filename = sys.argv[1] if len(sys.argv) > 1 else "scrrun.dll"
+    tlib = typeinfo.LoadTypeLib(filename)
+    items = list(tlbparser.TypeLibParser(tlib).parse().values())
+    for stubs in (False, True):
+        code = generate(items, filename, stubs)
+        pyc_size, compile_time, exec_time = measure(code)
+        label = "stub" if stubs else "inline"
+        print(
+            f"{label:<7} source {len(code) / 1e3:8.1f} kB  "
+            f"bytecode {pyc_size / 1e3:8.1f} kB  "
+            f"compile {compile_time * 1e3:7.1f} ms  "
+            f"import {exec_time * 1e3:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
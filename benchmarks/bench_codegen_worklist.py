@@ -0,0 +1,115 @@
+"""Benchmark for the driver loop of the code generator.
+
+`CodeGenerator.generate_wrapper` used to generate all items, collect the
+items they require afterwards in a set, subtract the items that are done
+and start over, until nothing was left.  It now takes the items from a
+`comtypes.tools.codegenerator.worklist.Worklist`, in a single pass and in
+the order they were passed or required.
+
+The code generator can only be imported on Windows, so this drives a model
+of it, which requires items in the same way, over synthetic graphs:
+chains of derived interfaces, where each one takes a pointer to the next
+chain as a method argument.  Only the first chain is passed to the
+generator, so the former loop needs a round per chain.
+
+Both scale linearly: CPython subtracts a large set from a small one in
+time proportional to the small one, so the rounds did not add up to
+quadratic time.
+
+    python benchmarks/bench_codegen_worklist.py
+"""
+
+import importlib.util
+import time
+from pathlib import Path
+
+_path = Path(__file__).parent.parent / "comtypes/tools/codegenerator/worklist.py"
+_spec = importlib.util.spec_from_file_location("worklist", _path)
+worklist = importlib.util.module_from_spec(_spec)  # type: ignore
+_spec.loader.exec_module(worklist)  # type: ignore
+
+DEPTH = 20
+
+
+class Interface:
+    def __init__(self, base):
+        self.base = base
+        self.head = ("head", self)
+        self.argument = None  # another interface, referred to by pointer
+
+
+def make_graph(count):
+    chains = []
+    for _ in range(count // DEPTH):
+        itf = None
+        for _ in range(DEPTH):
+            itf = Interface(itf)
+        chains.append(itf)
+    for itf, other in zip(chains, chains[1:]):
+        itf.argument = other
+    return chains
+
+
+class Generator:
+    """Requires items like `CodeGenerator.ComInterface` and its helpers."""
+
+    def __init__(self, more):
+        self.done = set()
+        self.more = more
+
+    def generate(self, item):
+        if item in self.done:
+            return
+        self.done.add(item)
+        if isinstance(item, tuple):
+            base = item[1].base
+            if base is not None:
+                self.generate(base.head)
+                self.more.add(base)
+            return
+        self.generate(item.head)
+        if item.base is not None:
+            self.generate(item.base)
+        if item.argument is not None:
+            # `PointerType` generates the head and requires the interface.
+            self.generate(item.argument.head)
+            self.more.add(item.argument)
+
+
+def fixed_point(items):
+    """The former implementation."""
+    gen = Generator(set())
+    items = set(items)
+    while items:
+        gen.more = set()
+        for item in items:
+            gen.generate(item)
+        items |= gen.more
+        items -= gen.done
+    return gen.done
+
+
+def single_pass(items):
+    """The current implementation."""
+    gen = Generator(None)
+    gen.more = worklist.Worklist()
+    gen.more.extend(items)
+    while gen.more:
+        gen.generate(gen.more.pop())
+    return gen.done
+
+
+def main() -> None:
+    for count in (1_000, 5_000, 10_000):
+        chains = make_graph(count)
+        results = []
+        for func in (fixed_point, single_pass):
+            start = time.perf_counter()
+            results.append(func(chains[:1]))
+            elapsed = time.perf_counter() - start
+            print(f"{count:>6} interfaces  {func.__name__:<12} {elapsed * 1e3:8.1f} ms")
+        assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    main()
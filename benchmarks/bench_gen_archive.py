@@ -0,0 +1,86 @@
+"""Benchmark for importing generated modules from an archive.
+
+With `comtypes.client.set_archive_cache`, generated modules are imported
+from a single SQLite file by `comtypes.client._gen_archive.GenArchive`,
+instead of from one `.py` file (and its `__pycache__` entry) per module in
+the `comtypes.gen` directory.  This compares both for increasing numbers
+of small modules, imported in a fresh `comtypes.gen` package each time.
+
+Since `comtypes` can only be imported on Windows, the `_gen_archive` module
+is loaded from its file and a stand-in `comtypes.gen` package is created,
+so this runs on any platform.  The difference is larger on network drives.
+
+    python benchmarks/bench_gen_archive.py
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_path = Path(__file__).parent.parent / "comtypes/client/_gen_archive.py"
+_spec = importlib.util.spec_from_file_location("_gen_archive", _path)
+_gen_archive = importlib.util.module_from_spec(_spec)  # type: ignore
+_spec.loader.exec_module(_gen_archive)  # type: ignore
+
+SOURCE = "from ctypes import *\n\n" + "".join(
+    f"class Struct{i}(Structure):\n    _fields_ = [('x', c_int)]\n\n" for i in range(20)
+)
+
+
+def make_package(root, count):
+    gen_dir = os.path.join(root, "comtypes", "gen")
+    os.makedirs(gen_dir)
+    for path in (os.path.join(root, "comtypes"), gen_dir):
+        with open(os.path.join(path, "__init__.py"), "w") as ofi:
+            ofi.write("")
+    for i in range(count):
+        with open(os.path.join(gen_dir, f"_module{i}.py"), "w") as ofi:
+            ofi.write(SOURCE)
+    return gen_dir
+
+
+def import_all(root, count):
+    for name in list(sys.modules):
+        if name == "comtypes" or name.startswith("comtypes."):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+    sys.path.insert(0, root)
+    try:
+        start = time.perf_counter()
+        for i in range(count):
+            importlib.import_module(f"comtypes.gen._module{i}")
+        return time.perf_counter() - start
+    finally:
+        sys.path.remove(root)
+
+
+def main() -> None:
+    for count in (100, 1_000):
+        with tempfile.TemporaryDirectory() as root:
+            make_package(root, count)
+            # The first run writes the `__pycache__` files.
+            import_all(root, count)
+            directory = import_all(root, count)
+        with tempfile.TemporaryDirectory() as root:
+            make_package(root, 0)
+            archive = _gen_archive.GenArchive(os.path.join(root, "gen.sqlite"))
+            for i in range(count):
+                archive.store(f"comtypes.gen._module{i}", SOURCE)
+            sys.meta_path.insert(0, archive)
+            try:
+                archived = import_all(root, count)
+            finally:
+                sys.meta_path.remove(archive)
+                archive.close()
+        print(
+            f"{count:>5} modules  directory {directory * 1e3:8.1f} ms  "
+            f"archive {archived * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
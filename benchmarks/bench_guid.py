@@ -0,0 +1,50 @@
+"""Benchmark for formatting, parsing and hashing `comtypes.GUID` instances.
+
+Compares the pure-Python routines used by `GUID` with the ole32 functions
+`StringFromCLSID` and `CLSIDFromString` they replace.
+
+    python benchmarks/bench_guid.py
+"""
+
+import timeit
+from ctypes import byref, c_wchar_p
+
+from comtypes import GUID
+from comtypes.GUID import _CLSIDFromString, _CoTaskMemFree, _StringFromCLSID
+
+NUMBER = 100_000
+
+
+def ole_str(guid: GUID) -> str:
+    p = c_wchar_p()
+    _StringFromCLSID(byref(guid), byref(p))
+    result = p.value
+    _CoTaskMemFree(p)
+    return result  # type: ignore
+
+
+def ole_guid(text: str) -> GUID:
+    guid = GUID()
+    _CLSIDFromString(text, byref(guid))
+    return guid
+
+
+def main() -> None:
+    guid = GUID.create_new()
+    text = str(guid)
+    registry = {text: None}
+    cases = [
+        ("str(GUID)", lambda: str(guid)),
+        ("StringFromCLSID", lambda: ole_str(guid)),
+        ("GUID(str)", lambda: GUID(text)),
+        ("CLSIDFromString", lambda: ole_guid(text)),
+        ("hash(GUID)", lambda: hash(guid)),
+        ("registry lookup", lambda: registry[str(guid)]),
+    ]
+    for name, func in cases:
+        elapsed = timeit.timeit(func, number=NUMBER)
+        print(f"{name:<20} {elapsed / NUMBER * 1e9:10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark for the [in, out] argument handling of COM methods.
+
+`_fix_inout_args` wraps the high level function of methods that have
+[in, out] parameters.  Here it wraps a fake function, which returns its
+output values like a ctypes function prototype does, so only the overhead
+of the wrapper is measured.
+
+    python benchmarks/bench_inout_args.py
+"""
+
+import timeit
+from ctypes import HRESULT, POINTER, c_int, c_ulong
+
+from comtypes import COMMETHOD
+from comtypes._memberspec import _fix_inout_args
+from comtypes.automation import VARIANT
+
+NUMBER = 100_000
+
+# `IEnumVARIANT.Next`-like: [in] celt, [out] rgVar, [in, out] pCeltFetched
+ENUM_NEXT = COMMETHOD(
+    [],
+    HRESULT,
+    "Next",
+    (["in"], c_ulong, "celt"),
+    (["out"], POINTER(VARIANT), "rgVar"),
+    (["in", "out"], POINTER(c_ulong), "pCeltFetched"),
+)
+
+# A single [in, out] parameter, like many `Range` methods of Excel.
+SINGLE_INOUT = COMMETHOD(
+    [],
+    HRESULT,
+    "Find",
+    (["in"], c_int, "What"),
+    (["in", "out"], POINTER(VARIANT), "After"),
+)
+
+
+def fake_function(spec):
+    outs = [
+        typ._type_()  # type: ignore
+        for (flags, *_), typ in zip(spec.paramflags, spec.argtypes)
+        if flags & 2
+    ]
+
+    def func(self, *args, **kw):
+        if len(outs) == 1:
+            return outs[0]
+        return tuple(outs)
+
+    return func
+
+
+def main() -> None:
+    cases = [
+        ("Next(1)", ENUM_NEXT, (1,), {}),
+        ("Next(1, 0)", ENUM_NEXT, (1, 0), {}),
+        ("Find(1)", SINGLE_INOUT, (1,), {}),
+        ("Find(1, After=2)", SINGLE_INOUT, (1,), {"After": 2}),
+    ]
+    for name, spec, args, kw in cases:
+        func = fake_function(spec)
+        wrapped = _fix_inout_args(func, spec.argtypes, spec.paramflags)
+        baseline = timeit.timeit(lambda: func(None, *args, **kw), number=NUMBER)
+        elapsed = timeit.timeit(lambda: wrapped(None, *args, **kw), number=NUMBER)
+        overhead = (elapsed - baseline) / NUMBER * 1e9
+        print(f"{name:<20} {overhead:10.1f} ns/call overhead")
+
+
+if __name__ == "__main__":
+    main()
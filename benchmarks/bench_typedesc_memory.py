@@ -0,0 +1,102 @@
+"""Benchmark for the memory used by parsed type descriptions.
+
+The most numerous classes of `comtypes.tools.typedesc_base` and
+`comtypes.tools.typedesc` have `__slots__` and intern their names, and
+`comtypes.tools.tlbparser.Parser` shares the pointer types of a typelib.
+This builds the same synthetic graph of structures, as parsing a large
+typelib would, with the current classes and with copies of them that
+have a `__dict__` and do not intern names, and compares the memory traced
+by `tracemalloc`.
+
+`comtypes.tools.typedesc` can only be imported on Windows, so this uses
+the classes of `typedesc_base`, which it loads from its file.
+
+    python benchmarks/bench_typedesc_memory.py
+"""
+
+import importlib.util
+import tracemalloc
+import types
+from pathlib import Path
+
+_path = Path(__file__).parent.parent / "comtypes/tools/typedesc_base.py"
+_spec = importlib.util.spec_from_file_location("typedesc_base", _path)
+typedesc_base = importlib.util.module_from_spec(_spec)  # type: ignore
+_spec.loader.exec_module(typedesc_base)  # type: ignore
+
+FIELDS = 20
+# Member names that many structures have in common.
+NAMES = ["cbSize", "dwFlags", "pNext", "hwnd", "lParam", "wParam", "pvData"]
+
+
+def _former(cls):
+    """A copy of 'cls' with a `__dict__` and without name interning."""
+    namespace = {}
+    for key, value in vars(cls).items():
+        if key in ("__slots__", "__dict__", "__weakref__"):
+            continue
+        if key in getattr(cls, "__slots__", ()):
+            continue
+        if isinstance(value, types.FunctionType):
+            env = dict(value.__globals__, sys=types.SimpleNamespace(intern=str))
+            value = types.FunctionType(value.__code__, env, value.__name__)
+        namespace[key] = value
+    return type(cls.__name__, (), namespace)
+
+
+class Layout:
+    def __init__(self, module, former):
+        wrap = _former if former else (lambda cls: cls)
+        self.FundamentalType = wrap(module.FundamentalType)
+        self.PointerType = wrap(module.PointerType)
+        self.Typedef = wrap(module.Typedef)
+        self.Field = wrap(module.Field)
+        self.share_pointers = not former
+
+
+def fresh(name):
+    # Like the strings converted from BSTRs, every name is a new object.
+    return "".join(list(name))
+
+
+def build(layout, count):
+    int_type = layout.FundamentalType("int", 32, 32)
+    structs = [typedesc_base.Structure(f"S{i}", 32, [], [], 0) for i in range(count)]
+    pointers = {}
+    for i, struct in enumerate(structs):
+        for j in range(FIELDS):
+            if j % 2:
+                target = structs[(i + j) % count]
+                if layout.share_pointers:
+                    if target not in pointers:
+                        pointers[target] = layout.PointerType(target, 64, 64)
+                    typ = pointers[target]
+                else:
+                    typ = layout.PointerType(target, 64, 64)
+            else:
+                typ = layout.Typedef(fresh("LONG"), int_type)
+            name = fresh(NAMES[j % len(NAMES)] + str(j // len(NAMES)))
+            struct.members.append(layout.Field(name, typ, None, j * 64))
+    return structs
+
+
+def measure(former, count):
+    layout = Layout(typedesc_base, former)
+    tracemalloc.start()
+    structs = build(layout, count)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structs
+    return current
+
+
+def main() -> None:
+    for count in (1_000, 10_000):
+        for former in (True, False):
+            size = measure(former, count)
+            label = "former" if former else "current"
+            print(f"{count:>6} structures  {label:<8} {size / 1e6:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,20 @@
 """comtypes.GUID module"""
 
-from ctypes import HRESULT, POINTER, OleDLL, Structure, WinDLL, byref, c_wchar_p
+from ctypes import (
+    HRESULT,
+    POINTER,
+    OleDLL,
+    Structure,
+    WinDLL,
+    byref,
+    c_wchar_p,
+    memmove,
+)
 from ctypes.wintypes import BYTE, DWORD, LPVOID, WORD
 from typing import TYPE_CHECKING, Any
 
+from comtypes._guid_text import _format_guid, _parse_guid
+
 if TYPE_CHECKING:
     from comtypes import hints  # type: ignore
 
@@ -23,19 +34,21 @@ class GUID(Structure):
 
     def __init__(self, name=None):
         if name is not None:
-            _CLSIDFromString(str(name), byref(self))
+            name = str(name)
+            data = _parse_guid(name)
+            if data is None:
+                _CLSIDFromString(name, byref(self))
+            else:
+                memmove(byref(self), data, 16)
 
     def __repr__(self):
         return f'GUID("{str(self)}")'
 
     def __str__(self) -> str:
-        p = c_wchar_p()
-        _StringFromCLSID(byref(self), byref(p))
-        result = p.value
-        _CoTaskMemFree(p)
+        # This gives the same result as `StringFromCLSID`, without calling
+        # into ole32 and allocating a string with the task allocator.
         # stringified `GUID_null` would be '{00000000-0000-0000-0000-000000000000}'
-        # Should we do `assert result is not None`?
-        return result  # type: ignore
+        return _format_guid(binary(self))
 
     def __bool__(self) -> bool:
         return self != GUID_null
@@ -45,6 +58,7 @@ class GUID(Structure):
 
     def __hash__(self) -> int:
         # We make GUID instances hashable, although they are mutable.
+        # So the hash cannot be stored on the instance.
         return hash(binary(self))
 
     def copy(self) -> "GUID":
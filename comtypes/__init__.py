@@ -17,6 +17,7 @@ except ImportError as e:
 import atexit
 import logging
 import sys
+from collections.abc import Callable, MutableMapping
 
 if sys.version_info >= (3, 15):
     import warnings
@@ -54,6 +55,7 @@ else:
 from comtypes import patcher  # noqa
 from comtypes._npsupport import interop as npsupport  # noqa
 from comtypes._tlib_version_checker import _check_version  # noqa
+from comtypes._registry import GUIDStringKeyedView
 from comtypes.GUID import GUID
 
 _all_slice = slice(None, None, None)
@@ -179,19 +181,41 @@ CoInitializeEx()
 # We need to have CoUninitialize for multithreaded model where we have
 # to initialize and uninitialize COM for every new thread (except main)
 # in which we are using COM
+#
+# The functions in `_uninitialize_hooks` are called first, so they can
+# release the COM pointers they keep for the apartment of the thread.  Like
+# `atexit` handlers, they are called in the reverse order of registration.
+_uninitialize_hooks: list[Callable[[], None]] = []
+
+
 def CoUninitialize():
     logger.debug("CoUninitialize()")
+    for hook in reversed(_uninitialize_hooks):
+        try:
+            hook()
+        except Exception:
+            logger.exception("Error in CoUninitialize hook %r", hook)
     _CoUninitialize()
 
 
 ################################################################
 # global registries.
 
+# allows to find interface classes by the binary form of guids (iid)
+_interface_registry_by_iid: dict[bytes, type["IUnknown"]] = {}
+
+# allows to find coclasses by the binary form of guids (clsid)
+_coclass_registry_by_clsid: dict[bytes, type["CoClass"]] = {}
+
 # allows to find interface classes by guid strings (iid)
-com_interface_registry: dict[str, type["IUnknown"]] = {}
+com_interface_registry: MutableMapping[str, type["IUnknown"]] = GUIDStringKeyedView(
+    _interface_registry_by_iid
+)
 
 # allows to find coclasses by guid strings (clsid)
-com_coclass_registry: dict[str, type["CoClass"]] = {}
+com_coclass_registry: MutableMapping[str, type["CoClass"]] = GUIDStringKeyedView(
+    _coclass_registry_by_clsid
+)
 
 
 ################################################################
@@ -216,7 +240,17 @@ atexit.register(_shutdown)
 
 ################################################################
 
-from comtypes._post_coinit.bstr import BSTR  # noqa
+from comtypes._post_coinit.bstr import BSTR, BSTRCache, set_bstr_cache  # noqa
+
+################################################################
+
+from comtypes._post_coinit._qi_cache import QueryInterfaceCache  # noqa
+from comtypes._post_coinit._release_queue import ReleaseQueue  # noqa
+from comtypes._post_coinit.unknwn import (  # noqa
+    flush_release_queue,
+    set_query_interface_cache,
+    set_release_queue,
+)
 
 
 ################################################################
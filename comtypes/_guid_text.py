@@ -0,0 +1,40 @@
+"""Formatting and parsing of GUID strings in pure Python.
+
+This module does not use ctypes, so it can be tested on any platform.
+"""
+
+import functools
+import re
+import struct
+from typing import Optional
+
+# The registry format of a GUID, the only format that `StringFromCLSID`
+# produces and the one that `CLSIDFromString` accepts besides ProgIDs.
+_GUID_PATTERN = re.compile(
+    r"\{([0-9A-Fa-f]{8})-([0-9A-Fa-f]{4})-([0-9A-Fa-f]{4})-"
+    r"([0-9A-Fa-f]{4})-([0-9A-Fa-f]{12})\}"
+)
+_GUID_HEAD = struct.Struct("<IHH")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_guid(data: bytes) -> str:
+    """Format the 16 bytes of a GUID like `StringFromCLSID` does."""
+    d1, d2, d3 = _GUID_HEAD.unpack_from(data)
+    d4 = data[8:].hex().upper()
+    return f"{{{d1:08X}-{d2:04X}-{d3:04X}-{d4[:4]}-{d4[4:]}}}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_guid(text: str) -> "Optional[bytes]":
+    """Parse a GUID string in registry format into its 16 bytes.
+
+    Returns None if 'text' is not in registry format; it may still be
+    something `CLSIDFromString` understands, like a ProgID.
+    """
+    m = _GUID_PATTERN.fullmatch(text)
+    if m is None:
+        return None
+    d1, d2, d3, d4a, d4b = m.groups()
+    head = _GUID_HEAD.pack(int(d1, 16), int(d2, 16), int(d3, 16))
+    return head + bytes.fromhex(d4a + d4b)
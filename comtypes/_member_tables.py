@@ -0,0 +1,113 @@
+"""Builds the members of generated modules from data tables.
+
+With `comtypes.client.set_table_modules(True)`, the wrapper module of a
+typelib describes the `_methods_` and `_disp_methods_` of its interfaces
+and the values of its enumerations with a table of plain data instead of
+Python source.  The table is marshalled, compressed and embedded in the
+module as a bytes literal, which is much smaller and faster to load than
+the equivalent `COMMETHOD(...)` calls, both from a `.pyc` file and when
+the module is compiled in memory.
+
+A table is a tuple `(FORMAT_VERSION, constants, interfaces)`:
+
+- 'constants' is a tuple of `(name, value)` pairs.
+- 'interfaces' is a tuple of `(interface_name, attribute, members)`, in
+  the order the attributes must be assigned, so base interfaces come
+  before derived ones.  'attribute' is `"_methods_"` or `"_disp_methods_"`.
+- A member is `(kind, idlflags, doc, type, name, arguments)`, where 'kind'
+  is `"COMMETHOD"`, `"DISPMETHOD"` or `"DISPPROPERTY"`, an int in
+  'idlflags' is the dispid, and 'doc' is the helpstring or None.
+- An argument is `(idlflags, type, name)` or `(idlflags, type, name,
+  default)`.  A default that is a 1-tuple holds the source of an
+  expression instead of a value, like `"_lcid"`.
+
+Types are given as the source of an expression in the namespace of the
+module, like `"POINTER(BSTR)"`.  Each distinct one is evaluated once.
+"""
+
+import base64
+import marshal
+import zlib
+from typing import Any
+
+from comtypes._memberspec import (
+    COMMETHOD,
+    DISPMETHOD,
+    DISPPROPERTY,
+    dispid,
+    helpstring,
+)
+
+# Bump this when the format of the tables changes.
+FORMAT_VERSION = 1
+
+
+def dumps(table: tuple[Any, ...]) -> bytes:
+    """Returns 'table' encoded for embedding in a module."""
+    return base64.b64encode(zlib.compress(marshal.dumps(table), 9))
+
+
+def loads(data: bytes) -> tuple[Any, ...]:
+    """Decodes a table that was encoded with `dumps`."""
+    return marshal.loads(zlib.decompress(base64.b64decode(data)))
+
+
+class _Evaluator:
+    def __init__(self, namespace: dict[str, Any]) -> None:
+        self.namespace = namespace
+        self.cache: dict[str, Any] = {}
+
+    def __call__(self, source: str) -> Any:
+        try:
+            return self.cache[source]
+        except KeyError:
+            result = self.cache[source] = eval(source, self.namespace)
+            return result
+
+
+def _flags(idlflags: tuple[Any, ...], doc: Any) -> list[Any]:
+    flags = [dispid(f) if type(f) is int else f for f in idlflags]
+    if doc is not None:
+        flags.insert(1, helpstring(doc))
+    return flags
+
+
+def _argspec(arg: tuple[Any, ...], evaluate: _Evaluator) -> tuple[Any, ...]:
+    if len(arg) == 3:
+        idlflags, typ, name = arg
+        return (list(idlflags), evaluate(typ), name)
+    idlflags, typ, name, default = arg
+    if type(default) is tuple:
+        default = evaluate(default[0])
+    return (list(idlflags), evaluate(typ), name, default)
+
+
+def _member(member: tuple[Any, ...], evaluate: _Evaluator) -> Any:
+    kind, idlflags, doc, typ, name, arguments = member
+    flags = _flags(idlflags, doc)
+    if kind == "DISPPROPERTY":
+        return DISPPROPERTY(flags, evaluate(typ), name)
+    argspec = [_argspec(arg, evaluate) for arg in arguments]
+    if kind == "COMMETHOD":
+        return COMMETHOD(flags, evaluate(typ), name, *argspec)
+    if kind == "DISPMETHOD":
+        return DISPMETHOD(flags, evaluate(typ), name, *argspec)
+    raise ValueError(f"unknown member kind {kind!r}")
+
+
+def _build_members(namespace: dict[str, Any], data: bytes) -> None:
+    """Defines the constants and interface members described by the table
+    encoded in 'data' in the 'namespace' of a generated module.
+
+    Raises ImportError if the table has another format, so the module is
+    generated again.
+    """
+    table = loads(data)
+    if table[0] != FORMAT_VERSION:
+        raise ImportError("Wrong member table format")
+    _, constants, interfaces = table
+    namespace.update(constants)
+    evaluate = _Evaluator(namespace)
+    for itf_name, attribute, members in interfaces:
+        specs = [_member(m, evaluate) for m in members]
+        setattr(namespace[itf_name], attribute, specs)
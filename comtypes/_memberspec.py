@@ -251,83 +251,87 @@ def _fix_inout_args(
     # TODO: The workaround should be disabled when a ctypes
     # version is used where the bug is fixed.
 
-    def call_with_inout(self, *args, **kw):
-        args = list(args)
-        # Indexed by order in the output
-        outargs: dict[int, "_CDataType"] = {}
-        outnum = 0
-        param_index = 0
-        # Go through all expected arguments and match them to the provided arguments.
-        # `param_index` first counts through the positional and then
-        # through the keyword arguments.
-        for i, info in enumerate(paramflags):
-            direction = info[0]
-            dir_in = bool(direction & PARAMFLAG_FIN)
-            dir_out = bool(direction & PARAMFLAG_FOUT)
-            is_positional = param_index < len(args)
-            if not (dir_in or dir_out):
-                # The original code here did not check for this special case and
-                # effectively treated `(dir_in, dir_out) == (False, False)` and
-                # `(dir_in, dir_out) == (True, False)` the same.
-                # In order not to break legacy code we do the same.
-                # One example of a function that has neither `dir_in` nor `dir_out`
-                # set is `IMFAttributes.GetString`.
-                dir_in = True
-            if dir_in and dir_out:
-                # This is an [in, out] parameter.
-                #
-                # Determine name and required type of the parameter.
-                name = info[1]
-                # [in, out] parameters are passed as pointers,
-                # this is the pointed-to type:
-                atyp: type["_CDataType"] = getattr(argtypes[i], "_type_")
-
-                # Get the actual parameter, either as positional or
-                # keyword arg.
-
-                if is_positional:
-                    v = _prepare_parameter(args[param_index], atyp)
-                    args[param_index] = v
-                elif name in kw:
-                    v = _prepare_parameter(kw[name], atyp)
-                    kw[name] = v
-                else:
-                    # no parameter was passed, make an empty one of the required type
-                    # and pass it as a keyword argument
-                    v = atyp()
-                    if name is not None:
-                        kw[name] = v
-                    else:
-                        raise TypeError("Unnamed inout parameters cannot be omitted")
-                outargs[outnum] = v
-            if dir_out:
-                outnum += 1
-            if dir_in:
-                param_index += 1
-
-        rescode = func(self, *args, **kw)
+    # The parameters are matched to the arguments once, here, instead of on
+    # every call.  `inouts` holds an entry for each [in, out] parameter:
+    # `(param_index, name, atyp, outnum)`.
+    # - `param_index` is the index of the parameter in the positional
+    #   arguments, if it is passed as a positional argument.
+    # - `name` is the name of the parameter when passed as a keyword argument.
+    # - `atyp` is the pointed-to type of the parameter, since [in, out]
+    #   parameters are passed as pointers.
+    # - `outnum` is the index of the parameter in the output.
+    inouts: list[tuple[int, Optional[str], type["_CDataType"], int]] = []
+    outnum = 0
+    param_index = 0
+    for i, info in enumerate(paramflags):
+        direction = info[0]
+        dir_in = bool(direction & PARAMFLAG_FIN)
+        dir_out = bool(direction & PARAMFLAG_FOUT)
+        if not (dir_in or dir_out):
+            # The original code here did not check for this special case and
+            # effectively treated `(dir_in, dir_out) == (False, False)` and
+            # `(dir_in, dir_out) == (True, False)` the same.
+            # In order not to break legacy code we do the same.
+            # One example of a function that has neither `dir_in` nor `dir_out`
+            # set is `IMFAttributes.GetString`.
+            dir_in = True
+        if dir_in and dir_out:
+            atyp: type["_CDataType"] = getattr(argtypes[i], "_type_")
+            inouts.append((param_index, info[1], atyp, outnum))
+        if dir_out:
+            outnum += 1
+        if dir_in:
+            param_index += 1
+    # `num_outs` counts the total number of 'out' and 'inout' arguments.
+    num_outs = outnum
+
+    def prepare_inout_args(args, kw):
+        # Converts the supplied [in, out] arguments in place and returns
+        # them as `(outnum, value)` pairs.
+        outargs: list[tuple[int, "_CDataType"]] = []
+        for param_index, name, atyp, outnum in inouts:
+            # Get the actual parameter, either as positional or
+            # keyword arg.
+            if param_index < len(args):
+                v = args[param_index] = _prepare_parameter(args[param_index], atyp)
+            elif name in kw:
+                v = kw[name] = _prepare_parameter(kw[name], atyp)
+            elif name is not None:
+                # no parameter was passed, make an empty one of the required type
+                # and pass it as a keyword argument
+                v = kw[name] = atyp()
+            else:
+                raise TypeError("Unnamed inout parameters cannot be omitted")
+            outargs.append((outnum, v))
+        return outargs
+
+    # Our interpretation of the code below
+    # (jonschz, junkmd, see https://github.com/enthought/comtypes/pull/473):
+    # - `outargs` consists of the supplied 'inout' arguments.
+    # - The call to `func()` returns the 'out' and 'inout' arguments.
+    #   Furthermore, it changes the variables in 'outargs' as a "side effect"
+    # - In a perfect world, it should be fine to just return `rescode`.
+    #   But we assume there is a reason why the original authors did not do that.
+    #   Instead, they replace the 'inout' variables in `rescode` by those in
+    #   'outargs', and call `__ctypes_from_outparam__()` on them.
+
+    if num_outs == 1:
         # If there is only a single output value, then do not expect it to
         # be iterable.
 
-        # Our interpretation of this code
-        # (jonschz, junkmd, see https://github.com/enthought/comtypes/pull/473):
-        # - `outnum` counts the total number of 'out' and 'inout' arguments.
-        # - `outargs` is a dict consisting of the supplied 'inout' arguments.
-        # - The call to `func()` returns the 'out' and 'inout' arguments.
-        #   Furthermore, it changes the variables in 'outargs' as a "side effect"
-        # - In a perfect world, it should be fine to just return `rescode`.
-        #   But we assume there is a reason why the original authors did not do that.
-        #   Instead, they replace the 'inout' variables in `rescode` by those in
-        #   'outargs', and call `__ctypes_from_outparam__()` on them.
-
-        if outnum == 1:  # rescode is not iterable
-            # In this case, it is little faster than creating list with
-            # `rescode = [rescode]` and getting item with index from the list.
-            if len(outargs) == 1:
-                rescode = rescode.__ctypes_from_outparam__()
-            return rescode
-        rescode = list(rescode)
-        for outnum, o in outargs.items():
+        def call_with_single_out(self, *args, **kw):
+            args = list(args)
+            if prepare_inout_args(args, kw):
+                return func(self, *args, **kw).__ctypes_from_outparam__()
+            return func(self, *args, **kw)
+
+        return call_with_single_out
+
+    def call_with_inout(self, *args, **kw):
+        args = list(args)
+        outargs = prepare_inout_args(args, kw)
+        rescode = list(func(self, *args, **kw))
+        for outnum, o in outargs:
             rescode[outnum] = o.__ctypes_from_outparam__()
         return rescode
 
@@ -595,6 +599,9 @@ class DispMemberGenerator:
 
 
 class bound_named_property:
+    # Created on every access of a named property, so keep it small.
+    __slots__ = ("name", "fget", "fset", "instance")
+
     def __init__(self, name, fget, fset, instance):
         self.name = name
         self.instance = instance
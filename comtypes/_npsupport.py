@@ -1,5 +1,6 @@
 """Consolidation of numpy support utilities."""
 
+import ctypes
 import sys
 
 is_64bits = sys.maxsize > 2**32
@@ -16,6 +17,7 @@ class Interop:
         self.typecodes = {}
         self.datetime64 = None
         self.com_null_date64 = None
+        self._structure_dtypes = {}
 
     def _make_variant_dtype(self):
         """Create a dtype for VARIANT. This requires support for Unions, which
@@ -108,6 +110,38 @@ class Interop:
                 continue
         return dtypes_to_ctypes
 
+    def structure_dtype(self, struct_type):
+        """Return a structured dtype with the same memory layout as the
+        ctypes Structure subclass 'struct_type', or None.
+
+        Only structures whose fields are numbers, nested structures or
+        arrays of these have an equivalent dtype.  Structures containing
+        strings (BSTR, c_wchar_p) or pointers have not, since their
+        fields need to be decoded one by one.
+        """
+        try:
+            return self._structure_dtypes[struct_type]
+        except KeyError:
+            pass
+        dtype = None
+        if self._is_plain_data(struct_type):
+            try:
+                dtype = self.numpy.dtype(struct_type)
+            except (NotImplementedError, TypeError, ValueError):
+                pass
+            else:
+                if dtype.itemsize != ctypes.sizeof(struct_type):
+                    dtype = None
+        self._structure_dtypes[struct_type] = dtype
+        return dtype
+
+    def _is_plain_data(self, ctype):
+        if issubclass(ctype, (ctypes.Structure, ctypes.Union)):
+            return all(self._is_plain_data(f[1]) for f in ctype._fields_)
+        if issubclass(ctype, ctypes.Array):
+            return self._is_plain_data(ctype._type_)
+        return ctype in self.typecodes.values()
+
     def isndarray(self, value):
         """Check if a value is an ndarray.
 
@@ -0,0 +1,128 @@
+"""Case insensitive member access for COM interface pointers.
+
+This module does not depend on the rest of `comtypes`.
+"""
+
+from typing import Any, Optional
+
+
+class CaseAlias:
+    """Data descriptor for another spelling of a member name.
+
+    Getting, setting and calling the alias is forwarded to the member with
+    the original spelling, so it does not need a `__getattr__` or
+    `__setattr__` hook on the instance.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return getattr(owner, self.name)
+        return getattr(instance, self.name)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        setattr(instance, self.name, value)
+
+    def __repr__(self) -> str:
+        return f"<CaseAlias {self.name!r}>"
+
+
+_MISSING = object()
+
+
+def _lookup(cls: type, name: str) -> tuple[Optional[type], Any]:
+    # Like `getattr(cls, name)`, but without invoking descriptors.  Returns
+    # the class that defines 'name' as well, and `_MISSING` if none does.
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass, vars(klass)[name]
+    return None, _MISSING
+
+
+def _is_interface(klass: Optional[type]) -> bool:
+    # The members of COM interfaces are defined on the interface classes,
+    # the other classes in the MRO are those of ctypes and `comtypes`.
+    return klass is not None and "_iid_" in vars(klass)
+
+
+def add_case_alias(cls: type, alias: str, name: str) -> None:
+    """Make 'alias' an alternative spelling of 'name' on 'cls'.
+
+    The alias takes precedence over attributes inherited from ctypes, like
+    `value`, and replaces an alias for another name.  Nothing is done if
+    'alias' is the name of a member of a COM interface.
+    """
+    if alias == name:
+        return
+    owner, current = _lookup(cls, alias)
+    if isinstance(current, CaseAlias):
+        if current.name == name:
+            return
+    elif current is not _MISSING and _is_interface(owner):
+        return
+    type.__setattr__(cls, alias, CaseAlias(name))
+
+
+def add_case_aliases(cls: type, map_case: dict[str, str]) -> None:
+    """Install the lower case spellings in 'map_case', which maps lower case
+    names to the original names, as aliases on 'cls'."""
+    for alias, name in map_case.items():
+        add_case_alias(cls, alias, name)
+    # The names assigned to may have changed, see `case_insensitive_setattr`.
+    vars(cls).get("__case_targets__", {}).clear()
+
+
+def case_insensitive_getattr(self: Any, name: str) -> Any:
+    """Implement case insensitive access to methods and properties.
+
+    This is only called for spellings that have no alias yet.  When a
+    member is found, an alias for the spelling is added to the class, so
+    the next access does not get here.
+    """
+    try:
+        fixed_name = self.__map_case__[name.lower()]
+    except KeyError:
+        raise AttributeError(name)  # Should we use exception-chaining?
+    if fixed_name == name:  # prevent unbounded recursion
+        raise AttributeError(name)
+    result = getattr(self, fixed_name)
+    add_case_alias(type(self), name, fixed_name)
+    return result
+
+
+def _setattr_target(cls: type, map_case: dict[str, str], name: str) -> str:
+    owner, current = _lookup(cls, name)
+    if isinstance(current, CaseAlias):
+        return current.name
+    if current is not _MISSING and _is_interface(owner):
+        return name
+    fixed_name = map_case.get(name.lower(), name)
+    if fixed_name != name:
+        add_case_alias(cls, name, fixed_name)
+    return fixed_name
+
+
+def case_insensitive_setattr(self: Any, name: str, value: Any) -> None:
+    """Implement case insensitive assignment to properties.
+
+    Members of the interfaces, like the original spellings, are assigned
+    as usual, aliases are assigned to their original names, and other
+    spellings are looked up in `__map_case__`, like `__getattr__` does.
+    The name to assign to is resolved once per spelling and cached on the
+    class.
+    """
+    cls = type(self)
+    try:
+        targets = cls.__dict__["__case_targets__"]
+    except KeyError:
+        targets = {}
+        type.__setattr__(cls, "__case_targets__", targets)
+    try:
+        target = targets[name]
+    except KeyError:
+        target = targets[name] = _setattr_target(cls, self.__map_case__, name)
+    object.__setattr__(self, target, value)
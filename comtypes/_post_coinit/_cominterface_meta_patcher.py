@@ -2,6 +2,10 @@ import types
 from _ctypes import COMError
 
 from comtypes import hresult, patcher
+from comtypes._post_coinit._case_alias import (
+    case_insensitive_getattr,
+    case_insensitive_setattr,
+)
 
 _all_slice = slice(None, None, None)
 
@@ -9,26 +13,16 @@ _all_slice = slice(None, None, None)
 def case_insensitive(p: type) -> None:
     @patcher.Patch(p)
     class CaseInsensitive:
-        # case insensitive attributes for COM methods and properties
-        def __getattr__(self, name):
-            """Implement case insensitive access to methods and properties"""
-            try:
-                fixed_name = self.__map_case__[name.lower()]
-            except KeyError:
-                raise AttributeError(name)  # Should we use exception-chaining?
-            if fixed_name != name:  # prevent unbounded recursion
-                return getattr(self, fixed_name)
-            raise AttributeError(name)
-
-        # __setattr__ is pretty heavy-weight, because it is called for
-        # EVERY attribute assignment.  Settings a non-com attribute
-        # through this function takes 8.6 usec, while without this
-        # function it takes 0.7 sec - 12 times slower.
+        # case insensitive attributes for COM methods and properties.
         #
-        # How much faster would this be if implemented in C?
-        def __setattr__(self, name, value):
-            """Implement case insensitive access to methods and properties"""
-            object.__setattr__(self, self.__map_case__.get(name.lower(), name), value)
+        # The lower case spellings of the names are installed as aliases
+        # on the class by `add_case_aliases`, and other spellings when
+        # they are first resolved by `__getattr__` or `__setattr__`.
+        # `__setattr__` is still called for EVERY attribute assignment,
+        # but resolves each spelling only once, it used to look at
+        # `__map_case__` every time.
+        __getattr__ = case_insensitive_getattr
+        __setattr__ = case_insensitive_setattr
 
 
 def reference_fix(pp: type) -> None:
@@ -0,0 +1,109 @@
+"""Caching of `QueryInterface` results on COM interface pointers."""
+
+import threading
+import weakref
+from _ctypes import COMError
+from collections.abc import Callable, Hashable
+from ctypes import _SimpleCData, c_void_p
+from typing import Any
+
+from comtypes.hresult import E_NOINTERFACE
+
+# The pointer value of a COM interface pointer instance; its own `value`
+# property returns the instance itself.
+_address: Callable[[c_void_p], Any] = _SimpleCData.__dict__["value"].__get__
+
+# The key in the `__dict__` of an interface pointer instance under which
+# its cached results are stored.
+_ENTRIES = "__qi_cache"
+
+
+class QueryInterfaceCache:
+    """Remembers the results of `QueryInterface` calls on each COM pointer.
+
+    When a cache is installed with `comtypes.set_query_interface_cache`,
+    the results of `ptr.QueryInterface(...)` are stored on `ptr` itself,
+    so they go away together with it.  Calling `QueryInterface` again for
+    the same interface returns the same pointer instance, or raises the
+    E_NOINTERFACE error again, without calling into the object.
+
+    The returned pointers are referenced weakly, so the cache never holds
+    a COM reference of its own: a result is cached only as long as the
+    caller keeps it alive.
+
+    COM requires the set of interfaces of an object to be static, and
+    the pointers returned for `IUnknown` to be always the same, so the
+    results remain valid as long as the pointer refers to the same object.
+    They are dropped when the pointer, or a cached result, changes its
+    value, for example when passed as an [out] parameter again.  Only
+    E_NOINTERFACE failures are cached, other failures may be transient.
+
+    Cached pointers are shared by all callers and must not be released
+    explicitly.  If 'cache_failures' is False, failures are not cached.
+    """
+
+    def __init__(self, cache_failures: bool = True) -> None:
+        self.cache_failures = cache_failures
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.failure_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def query(
+        self, ptr: c_void_p, key: Hashable, query_interface: Callable[[], Any]
+    ) -> Any:
+        """Return the cached result for 'key' on 'ptr', calling
+        'query_interface()' on a miss."""
+        address = _address(ptr)
+        if not address:
+            return query_interface()
+        d = ptr.__dict__
+        state = d.get(_ENTRIES)
+        if state is None or state[0] != address:
+            if state is not None:
+                with self._lock:
+                    self.invalidations += 1
+            state = d[_ENTRIES] = (address, {})
+        entries = state[1]
+        entry = entries.get(key)
+        if entry is not None:
+            ref, result_address = entry
+            if ref is None:
+                with self._lock:
+                    self.failure_hits += 1
+                raise COMError(*result_address)
+            result = ref()
+            if result is not None:
+                if _address(result) == result_address:
+                    with self._lock:
+                        self.hits += 1
+                    return result
+                with self._lock:
+                    self.invalidations += 1
+        with self._lock:
+            self.misses += 1
+        try:
+            result = query_interface()
+        except COMError as err:
+            if self.cache_failures and err.hresult == E_NOINTERFACE:
+                entries[key] = (None, err.args)
+            raise
+        entries[key] = (weakref.ref(result), _address(result))
+        return result
+
+    def invalidate(self, ptr: c_void_p) -> None:
+        """Forget the cached results for 'ptr'."""
+        if ptr.__dict__.pop(_ENTRIES, None) is not None:
+            with self._lock:
+                self.invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return the cache counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "failure_hits": self.failure_hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
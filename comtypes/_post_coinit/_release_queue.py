@@ -0,0 +1,151 @@
+"""Deferred `Release()` of COM interface pointers.
+
+This module does not depend on the rest of `comtypes`, the `Release()`
+call and the apartment of the calling thread are supplied by the caller.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, Optional
+
+
+class ReleaseQueue:
+    """Collects COM pointers that are no longer referenced from Python and
+    releases them in bulk, at safe points.
+
+    When a queue is installed with `comtypes.set_release_queue`, a COM
+    pointer that is destroyed does not call `Release()` on the spot.  Its
+    address is appended to the queue of the apartment the pointer was
+    created in instead, and released by the next `flush()` call in that
+    apartment, whichever thread the pointer was destroyed on.  Pointers
+    whose apartment is not known are released immediately.  `comtypes`
+    flushes the queue after `PumpEvents`, for each message dispatched by
+    `comtypes.messageloop`, and in `comtypes.CoUninitialize`.  The queue of
+    a single-threaded apartment whose thread exits without calling
+    `CoUninitialize` is discarded.
+
+    'release' is called with the address of each pointer to release, and
+    'apartment' returns a hashable key for the apartment of the calling
+    thread.  By default, they call `IUnknown::Release` and distinguish the
+    multithreaded apartment and the single-threaded apartment of each
+    thread.
+
+    If 'max_depth' is given, an apartment's queue is flushed as soon as it
+    holds that many pointers and a pointer is queued from that apartment.
+    """
+
+    def __init__(
+        self,
+        release: Optional[Callable[[int], Any]] = None,
+        apartment: Optional[Callable[[], Hashable]] = None,
+        max_depth: Optional[int] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if release is None:
+            from comtypes._post_coinit.unknwn import _release_address
+
+            release = _release_address
+        if apartment is None:
+            from comtypes._post_coinit.unknwn import _apartment_key
+
+            apartment = _apartment_key
+        self._release = release
+        self._apartment = apartment
+        self.max_depth = max_depth
+        self._clock = clock
+        # `defer` is called from `__del__`, which may run whenever an object
+        # is allocated, even while the lock is held by the same thread.
+        self._lock = threading.RLock()
+        self._queues: dict[Hashable, list[tuple[int, float]]] = {}
+        self.deferred = 0
+        self.released = 0
+        self.peak_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def defer(self, address: int, apartment: Optional[Hashable] = None) -> None:
+        """Queue the pointer at 'address' for release in 'apartment', by
+        default the current apartment."""
+        key = self._apartment() if apartment is None else apartment
+        with self._lock:
+            queue = self._queues.setdefault(key, [])
+            queue.append((address, self._clock()))
+            self.deferred += 1
+            depth = len(queue)
+            if depth > self.peak_depth:
+                self.peak_depth = depth
+        if self.max_depth is not None and depth >= self.max_depth:
+            if apartment is None or apartment == self._apartment():
+                self.flush()
+
+    def flush(self) -> int:
+        """Release the pointers queued in the current apartment.
+
+        Returns the number of pointers released.
+        """
+        key = self._apartment()
+        with self._lock:
+            queue = self._queues.pop(key, [])
+        return self._release_all(key, queue)
+
+    def discard(self, apartment: Hashable) -> int:
+        """Forget the pointers queued for 'apartment' without releasing
+        them, once the apartment is gone.
+
+        Returns the number of pointers forgotten.
+        """
+        with self._lock:
+            return len(self._queues.pop(apartment, []))
+
+    def clear(self) -> int:
+        """Forget all queued pointers without releasing them.
+
+        Returns the number of pointers forgotten.
+        """
+        with self._lock:
+            count = self.depth
+            self._queues.clear()
+        return count
+
+    @property
+    def depth(self) -> int:
+        """The number of pointers waiting to be released."""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def __len__(self) -> int:
+        return self.depth
+
+    def stats(self) -> dict[str, Any]:
+        """Return the counters and the release latencies, in seconds."""
+        with self._lock:
+            return {
+                "deferred": self.deferred,
+                "released": self.released,
+                "depth": self.depth,
+                "peak_depth": self.peak_depth,
+                "max_latency": self.max_latency,
+                "mean_latency": (
+                    self.total_latency / self.released if self.released else 0.0
+                ),
+            }
+
+    def _release_all(self, key: Hashable, queue: list[tuple[int, float]]) -> int:
+        release = self._release
+        for i, (address, queued_at) in enumerate(queue):
+            try:
+                release(address)
+            except BaseException:
+                # Do not lose the pointers that have not been released yet.
+                with self._lock:
+                    rest = self._queues.setdefault(key, [])
+                    rest[:0] = queue[i + 1 :]
+                raise
+            latency = self._clock() - queued_at
+            with self._lock:
+                self.released += 1
+                self.total_latency += latency
+                if latency > self.max_latency:
+                    self.max_latency = latency
+        return len(queue)
@@ -1,6 +1,8 @@
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
 from ctypes import WinDLL, _SimpleCData
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from comtypes import hints  # type: ignore
@@ -35,6 +37,12 @@ class BSTR(_SimpleCData):
         """Convert into a foreign function call parameter."""
         if isinstance(value, cls):
             return value
+        # A BSTR passed by value is always an [in] parameter, which the
+        # callee must not free, so a shared instance can be passed.
+        if _bstr_cache is not None and cls is BSTR and isinstance(value, str):
+            bstr = _bstr_cache.get(value)
+            if bstr is not None:
+                return bstr  # type: ignore
         # Although the builtin SimpleCData.from_param call does the
         # right thing, it doesn't ensure that SysFreeString is called
         # on destruction.
@@ -43,3 +51,79 @@ class BSTR(_SimpleCData):
 
 _SysFreeString.argtypes = [BSTR]
 _SysFreeString.restype = None
+
+
+class BSTRCache:
+    """A bounded LRU cache of BSTR instances for frequently repeated
+    strings, like property names, column headers or enum-like values.
+
+    The instances returned by `get` are owned by the cache and must only
+    be passed as [in] parameters, which the callee does not free.  An
+    instance is freed when it has been evicted from the cache and is no
+    longer referenced.
+
+    Strings longer than 'max_length' are not cached.
+    """
+
+    def __init__(self, maxsize: int = 256, max_length: int = 256) -> None:
+        self.maxsize = maxsize
+        self.max_length = max_length
+        self._data: "OrderedDict[str, BSTR]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.allocations = 0
+        self.evictions = 0
+
+    def get(self, text: str) -> Optional[BSTR]:
+        """Return the cached BSTR for 'text', allocating it on a miss.
+
+        Returns None if 'text' is too long to be cached.
+        """
+        if len(text) > self.max_length:
+            return None
+        with self._lock:
+            try:
+                bstr = self._data[text]
+            except KeyError:
+                pass
+            else:
+                self._data.move_to_end(text)
+                self.hits += 1
+                return bstr
+            bstr = self._data[text] = BSTR(text)
+            self.allocations += 1
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            return bstr
+
+    def clear(self) -> None:
+        """Drop all cached instances."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the cache."""
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "allocations": self.allocations,
+            "evictions": self.evictions,
+        }
+
+
+_bstr_cache: Optional[BSTRCache] = None
+
+
+def set_bstr_cache(cache: Optional[BSTRCache]) -> Optional[BSTRCache]:
+    """Make `BSTR.from_param` use 'cache' for str arguments of BSTR
+    parameters, or stop using a cache if 'cache' is None.
+
+    Returns the previously used cache.
+    """
+    global _bstr_cache
+    previous, _bstr_cache = _bstr_cache, cache
+    return previous
@@ -1,14 +1,18 @@
 # https://learn.microsoft.com/en-us/windows/win32/api/unknwn/
 
+import itertools
 import logging
 import sys
-from ctypes import HRESULT, POINTER, byref, c_ulong, c_void_p
+import threading
+import weakref
+from ctypes import HRESULT, POINTER, WINFUNCTYPE, byref, c_int, c_ulong, c_void_p
 from typing import TYPE_CHECKING, Any, ClassVar, Optional, TypeVar
 
 import comtypes
-from comtypes import GUID, _CoUninitialize
+from comtypes import GUID, _CoUninitialize, _ole32
 from comtypes._memberspec import STDMETHOD, ComMemberGenerator, DispMemberGenerator
 from comtypes._post_coinit import _cominterface_meta_patcher as _meta_patch
+from comtypes._post_coinit._case_alias import add_case_aliases
 from comtypes._post_coinit.instancemethod import instancemethod
 
 if TYPE_CHECKING:
@@ -17,9 +21,119 @@ if TYPE_CHECKING:
 
     from comtypes import hints  # type: ignore
     from comtypes._memberspec import _ComMemberSpec, _DispMemberSpec
+    from comtypes._post_coinit._qi_cache import QueryInterfaceCache
+    from comtypes._post_coinit._release_queue import ReleaseQueue
 
 logger = logging.getLogger(__name__)
 
+################################################################
+# Deferred Release() of COM pointers, see `ReleaseQueue`.
+
+APTTYPE_MTA = 1
+
+_CoGetApartmentType = _ole32.CoGetApartmentType
+_CoGetApartmentType.argtypes = [POINTER(c_int), POINTER(c_int)]
+_CoGetApartmentType.restype = HRESULT
+
+# `IUnknown::Release`, called with the address of an interface pointer.
+_Release = WINFUNCTYPE(c_ulong)(2, "Release")
+
+
+def _release_address(address: int) -> int:
+    return _Release(c_void_p(address))
+
+
+class _ApartmentToken:
+    # Lives as long as the thread-local storage of its thread.
+    __slots__ = ("__weakref__",)
+
+
+_apartment_local = threading.local()
+_apartment_serial = itertools.count(1)
+
+
+def _apartment_key() -> Any:
+    # Returns None if COM is not initialized for the calling thread.  All
+    # threads in the multithreaded apartment share a key.  Single-threaded
+    # apartments get a key of their own, which is not reused by threads
+    # that happen to get the same thread id later.
+    apttype, qualifier = c_int(), c_int()
+    try:
+        _CoGetApartmentType(byref(apttype), byref(qualifier))
+    except OSError:  # CO_E_NOTINITIALIZED
+        return None
+    if apttype.value == APTTYPE_MTA:
+        return "MTA"
+    try:
+        return _apartment_local.key
+    except AttributeError:
+        pass
+    key = _apartment_local.key = ("STA", next(_apartment_serial))
+    _apartment_local.token = _ApartmentToken()
+    # The pointers of a thread that exits without `CoUninitialize` cannot be
+    # released anymore.
+    weakref.finalize(_apartment_local.token, _discard_apartment, key)
+    return key
+
+
+def _discard_apartment(key: Any) -> None:
+    queue = _release_queue
+    if queue is not None:
+        queue.discard(key)
+
+
+def _flush_apartment() -> None:
+    # Called by `comtypes.CoUninitialize`, while the apartment still exists.
+    queue = _release_queue
+    if queue is not None:
+        queue.flush()
+
+
+comtypes._uninitialize_hooks.append(_flush_apartment)
+
+
+_release_queue: Optional["ReleaseQueue"] = None
+
+
+def set_release_queue(queue: Optional["ReleaseQueue"]) -> Optional["ReleaseQueue"]:
+    """Make COM pointers defer their `Release()` to 'queue', or release
+    them immediately again if 'queue' is None.
+
+    Returns the previously used queue.  Pointers still queued in it are not
+    released automatically anymore, call its `flush` method.
+    """
+    global _release_queue
+    previous, _release_queue = _release_queue, queue
+    return previous
+
+
+def flush_release_queue() -> int:
+    """Release the pointers queued for the current apartment, if a
+    release queue is in use.
+
+    Returns the number of pointers released.
+    """
+    queue = _release_queue
+    if queue is None:
+        return 0
+    return queue.flush()
+
+
+_qi_cache: Optional["QueryInterfaceCache"] = None
+
+
+def set_query_interface_cache(
+    cache: Optional["QueryInterfaceCache"],
+) -> Optional["QueryInterfaceCache"]:
+    """Make `IUnknown.QueryInterface` use 'cache', or call into the object
+    each time again if 'cache' is None.
+
+    Returns the previously used cache.
+    """
+    global _qi_cache
+    previous, _qi_cache = _qi_cache, cache
+    return previous
+
 
 def _shutdown(
     func=_CoUninitialize,
@@ -28,6 +142,12 @@ def _shutdown(
     # Sometimes, CoUninitialize, running at Python shutdown,
     # raises an exception.  We suppress this when __debug__ is
     # False.
+    if _release_queue is not None:
+        # Pointers queued by other apartments cannot be released from
+        # here, CoUninitialize() cleans them up.
+        _debug("Flushing the release queue")
+        _release_queue.flush()
+        _release_queue.clear()
     _debug("Calling CoUninitialize()")
     if __debug__:
         func()
@@ -136,6 +256,7 @@ class _cominterface_meta(type):
 
         if self._case_insensitive_:
             _meta_patch.case_insensitive(p)
+            self._make_case_aliases()
         _meta_patch.reference_fix(POINTER(p))  # type: ignore
 
         return self
@@ -184,6 +305,18 @@ class _cominterface_meta(type):
             d.update(getattr(self, "__map_case__", {}))
             self.__map_case__ = d
 
+    def _make_case_aliases(self) -> None:
+        # Installs the lower case names of the __map_case__ dictionary as
+        # aliases on the POINTER(...) type, if it has been created already.
+        if sys.version_info >= (3, 14):
+            p = self.__dict__.get("__pointer_type__")
+        else:
+            from ctypes import _pointer_type_cache  # type: ignore
+
+            p = _pointer_type_cache.get(self)
+        if p is not None:
+            add_case_aliases(p, getattr(self, "__map_case__", {}))
+
     def _make_dispmethods(self, methods: list["_DispMemberSpec"]) -> None:
         if self._case_insensitive_:
             self._make_case_insensitive()
@@ -205,6 +338,8 @@ class _cominterface_meta(type):
             # COM is case insensitive
             if self._case_insensitive_:
                 self.__map_case__[name.lower()] = name
+        if self._case_insensitive_:
+            self._make_case_aliases()
 
     def __get_baseinterface_methodcount(self) -> int:
         "Return the number of com methods in the base interfaces"
@@ -225,7 +360,7 @@ class _cominterface_meta(type):
         except KeyError:
             raise AttributeError("this class must define an _iid_")
         else:
-            comtypes.com_interface_registry[str(iid)] = self  # type: ignore
+            comtypes._interface_registry_by_iid[bytes(iid)] = self  # type: ignore
         # create members
         vtbl_offset = self.__get_baseinterface_methodcount()
         member_gen = ComMemberGenerator(self.__name__, vtbl_offset, self._iid_)
@@ -255,6 +390,8 @@ class _cominterface_meta(type):
             # COM is case insensitive
             if self._case_insensitive_:
                 self.__map_case__[name.lower()] = name
+        if self._case_insensitive_:
+            self._make_case_aliases()
 
 
 ################################################################
@@ -273,6 +410,17 @@ class _compointer_base(c_void_p, metaclass=_compointer_meta):
     if TYPE_CHECKING:
         __com_interface__: ClassVar[type["IUnknown"]]
 
+    def __new__(cls, *args, **kw):
+        self = super().__new__(cls, *args, **kw)
+        if _release_queue is not None:
+            # The apartment the pointer belongs to, where it is released.
+            # Pointers created by ctypes without calling the class, like
+            # with `cast`, do not have one and are released immediately.
+            key = _apartment_key()
+            if key is not None:
+                self.__dict__["_apartment_"] = key
+        return self
+
     def __del__(self, _debug=logger.debug) -> None:
         "Release the COM refcount we own."
         if self:
@@ -284,6 +432,13 @@ class _compointer_base(c_void_p, metaclass=_compointer_meta):
             # _com_shutting_down flag.
             #
             if not type(self)._com_shutting_down:
+                queue = _release_queue
+                if queue is not None:
+                    key = self.__dict__.get("_apartment_")
+                    if key is not None:
+                        _debug("Defer release %s", self)
+                        queue.defer(super().value, key)  # type: ignore
+                        return
                 _debug("Release %s", self)
                 self.Release()  # type: ignore
 
@@ -400,9 +555,19 @@ class IUnknown(_IUnknown_Base, metaclass=_cominterface_meta):
         self, interface: type[_T_IUnknown], iid: Optional[GUID] = None
     ) -> _T_IUnknown:
         """QueryInterface(interface) -> instance"""
-        p = POINTER(interface)()
         if iid is None:
             iid = interface._iid_
+        cache = _qi_cache
+        if cache is not None:
+            return cache.query(
+                self,  # type: ignore
+                (iid, interface),
+                lambda: self.__query_interface(interface, iid),
+            )
+        return self.__query_interface(interface, iid)
+
+    def __query_interface(self, interface: type[_T_IUnknown], iid: GUID) -> Any:
+        p = POINTER(interface)()
         self.__com_QueryInterface(byref(iid), byref(p))  # type: ignore
         clsid = self.__dict__.get("__clsid")
         if clsid is not None:
@@ -0,0 +1,51 @@
+"""Registries of interface and coclass classes.
+
+The registries are keyed by the 16 bytes of the IID or CLSID, so that
+looking up a class for a GUID on hot paths such as unpacking interface
+pointers does not need to format the GUID.  For compatibility, the
+registries are also exposed as mappings keyed by the string form of the
+GUIDs.
+"""
+
+from collections.abc import Iterator, MutableMapping
+from typing import TypeVar
+
+from comtypes.GUID import GUID, _format_guid, _parse_guid
+
+_T = TypeVar("_T")
+
+
+class GUIDStringKeyedView(MutableMapping[str, _T]):
+    """A view of a registry keyed by the binary form of GUIDs, that takes
+    and returns the string form of GUIDs as keys.
+    """
+
+    def __init__(self, data: dict[bytes, _T]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> _T:
+        data = _parse_guid(key) if isinstance(key, str) else None
+        if data is None:
+            raise KeyError(key)
+        try:
+            return self._data[data]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: _T) -> None:
+        self._data[bytes(GUID(key))] = value
+
+    def __delitem__(self, key: str) -> None:
+        data = _parse_guid(key) if isinstance(key, str) else None
+        if data is None or data not in self._data:
+            raise KeyError(key)
+        del self._data[data]
+
+    def __iter__(self) -> Iterator[str]:
+        return (_format_guid(data) for data in list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
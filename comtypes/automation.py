@@ -50,6 +50,43 @@ riid_null = byref(IID_NULL)
 # 30. December 1899, midnight.  For VT_DATE.
 _com_null_date = datetime.datetime(1899, 12, 30, 0, 0, 0)
 
+# VT_RECORD types, resolved on first use.  IRecordInfo pointers are
+# keyed by the `_recordinfo_` (LIBID, version, LCID, record GUID) of the
+# Structure subclasses, the Structure subclasses by their record GUID.
+_record_info_cache: dict[tuple[str, int, int, int, str], Any] = {}
+_record_type_cache: dict[GUID, type[Structure]] = {}
+
+
+def _get_record_info(struct_type: type[Structure]) -> Any:
+    """Return the IRecordInfo for a Structure subclass generated from a
+    type library."""
+    guids = struct_type._recordinfo_  # type: ignore
+    try:
+        return _record_info_cache[guids]
+    except KeyError:
+        from comtypes.typeinfo import GetRecordInfoFromGuids
+
+        ri = _record_info_cache[guids] = GetRecordInfoFromGuids(*guids)
+        _record_type_cache.setdefault(GUID(guids[-1]), struct_type)
+        return ri
+
+
+def _get_record_type(ri: Any) -> type[Structure]:
+    """Return the Structure subclass for a record described by 'ri', an
+    IRecordInfo pointer, generating the type library wrapper if needed."""
+    guid = ri.GetGuid()
+    try:
+        return _record_type_cache[guid]
+    except KeyError:
+        from comtypes.client import GetModule
+
+        tlib = ri.GetTypeInfo().GetContainingTypeLib()[0]
+        struct_type = getattr(GetModule(tlib), ri.GetName())
+        if guid:
+            _record_type_cache[guid] = struct_type
+        return struct_type
+
+
 ################################################################
 # VARIANT, in all it's glory.
 VARENUM = c_int  # enum
@@ -325,10 +362,7 @@ class tagVARIANT(Structure):
             memmove(byref(self._), byref(obj), sizeof(obj))
             self.vt = VT_ARRAY | obj._vartype_
         elif isinstance(value, Structure) and hasattr(value, "_recordinfo_"):
-            guids = value._recordinfo_
-            from comtypes.typeinfo import GetRecordInfoFromGuids
-
-            ri = GetRecordInfoFromGuids(*guids)
+            ri = _get_record_info(type(value))
             self.vt = VT_RECORD
             # Assigning a COM pointer to a structure field does NOT
             # call AddRef(), have to call it manually:
@@ -375,10 +409,7 @@ class tagVARIANT(Structure):
             self._.c_void_p = addressof(ref)
             self.__keepref = value
             if isinstance(ref, Structure) and hasattr(ref, "_recordinfo_"):
-                guids = ref._recordinfo_
-                from comtypes.typeinfo import GetRecordInfoFromGuids
-
-                ri = GetRecordInfoFromGuids(*guids)
+                ri = _get_record_info(type(ref))
                 self.vt = VT_RECORD | VT_BYREF
                 # Assigning a COM pointer to a structure field does NOT
                 # call AddRef(), have to call it manually:
@@ -397,10 +428,7 @@ class tagVARIANT(Structure):
             self._.c_void_p = addressof(ref)
             self.__keepref = value
             if isinstance(ref, Structure) and hasattr(ref, "_recordinfo_"):
-                guids = ref._recordinfo_
-                from comtypes.typeinfo import GetRecordInfoFromGuids
-
-                ri = GetRecordInfoFromGuids(*guids)
+                ri = _get_record_info(type(ref))
                 self.vt = VT_RECORD | VT_BYREF
                 # Assigning a COM pointer to a structure field does NOT
                 # call AddRef(), have to call it manually:
@@ -491,7 +519,6 @@ class tagVARIANT(Structure):
         elif self.vt & VT_BYREF:
             return self
         elif vt == VT_RECORD:
-            from comtypes.client import GetModule
             from comtypes.typeinfo import IRecordInfo
 
             # Retrieving a COM pointer from a structure field does NOT
@@ -500,13 +527,8 @@ class tagVARIANT(Structure):
             punk.AddRef()
             ri = punk.QueryInterface(IRecordInfo)
 
-            # find typelib
-            tlib = ri.GetTypeInfo().GetContainingTypeLib()[0]
-
-            # load typelib wrapper module
-            mod = GetModule(tlib)
             # retrive the type and create an instance
-            value = getattr(mod, ri.GetName())()
+            value = _get_record_type(ri)()
             # copy data into the instance
             ri.RecordCopy(self._.pvRecord, byref(value))
 
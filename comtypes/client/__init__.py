@@ -9,7 +9,14 @@ from comtypes.client._activeobj import RegisterActiveObject  # noqa
 from comtypes.client._code_cache import _find_gen_dir
 from comtypes.client._constants import Constants  # noqa
 from comtypes.client._events import GetEvents, PumpEvents, ShowEvents
-from comtypes.client._generate import GetModule
+from comtypes.client._generate import (  # noqa
+    GetModule,
+    set_archive_cache,
+    set_incremental_generation,
+    set_lean_modules,
+    set_stub_files,
+    set_table_modules,
+)
 from comtypes.client._managing import GetBestInterface, _manage, wrap_outparam  # noqa
 from comtypes.hresult import *  # noqa
 
@@ -30,6 +37,7 @@ ctypes.POINTER(automation.IDispatch).__ctypes_from_outparam__ = wrap_outparam  #
 
 from comtypes.client._activeobj import GetActiveObject
 from comtypes.client._create import (
+    ClassFactoryCache,
     CoGetObject,
     CreateObject,
     GetClassObject,
@@ -39,5 +47,6 @@ from comtypes.client._create import (
 __all__ = [
     "CreateObject", "GetActiveObject", "CoGetObject", "GetEvents",
     "ShowEvents", "PumpEvents", "GetModule", "GetClassObject",
+    "ClassFactoryCache",
 ]
 # fmt: on
@@ -0,0 +1,139 @@
+"""Early bound interface classes for a single dispinterface, created in
+memory from its type information without generating the typelib wrapper.
+"""
+
+import logging
+import threading
+from typing import Any
+
+import comtypes
+from comtypes import GUID, automation, typeinfo
+from comtypes._memberspec import DISPMETHOD, DISPPROPERTY, _DispMemberSpec
+from comtypes.automation import VARIANT, IDispatch
+
+logger = logging.getLogger(__name__)
+
+# The interfaces of IDispatch and IUnknown are listed by some typelibs even
+# for dispinterfaces, see `tlbparser.Parser.ParseDispatch`.
+_IGNORED_NAMES = frozenset(
+    [
+        "QueryInterface",
+        "AddRef",
+        "Release",
+        "GetTypeInfoCount",
+        "GetTypeInfo",
+        "GetIDsOfNames",
+        "Invoke",
+    ]
+)
+
+_INVKIND_FLAGS = {
+    automation.DISPATCH_METHOD: [],
+    automation.DISPATCH_PROPERTYGET: ["propget"],
+    automation.DISPATCH_PROPERTYPUT: ["propput"],
+    automation.DISPATCH_PROPERTYPUTREF: ["propputref"],
+}
+
+_interfaces: dict[GUID, type[IDispatch]] = {}
+_lock = threading.Lock()
+
+
+def _param_flags(flags: int) -> list[str]:
+    result = []
+    if flags & typeinfo.PARAMFLAG_FIN:
+        result.append("in")
+    if flags & typeinfo.PARAMFLAG_FOUT:
+        result.append("out")
+    if flags & (typeinfo.PARAMFLAG_FOPT | typeinfo.PARAMFLAG_FHASDEFAULT):
+        result.append("optional")
+    return result
+
+
+def _disp_members(tinfo: typeinfo.ITypeInfo, ta: Any) -> list[_DispMemberSpec]:
+    # Only the dispids, invocation kinds and parameter names are needed to
+    # call through `IDispatch.Invoke`, which converts the arguments and
+    # results from and to VARIANTs.  So the types of the members are not
+    # resolved, and no other typeinfos are loaded.
+    members = []
+    for i in range(ta.cVars):
+        vd = tinfo.GetVarDesc(i)
+        name = tinfo.GetNames(vd.memid, 1)[0]
+        idlflags: list[Any] = [vd.memid]
+        if vd.wVarFlags & typeinfo.VARFLAG_FREADONLY:
+            idlflags.append("readonly")
+        members.append(DISPPROPERTY(idlflags, VARIANT, name))
+    for i in range(ta.cFuncs):
+        fd = tinfo.GetFuncDesc(i)
+        names = tinfo.GetNames(fd.memid, fd.cParams + 1)
+        if names[0] in _IGNORED_NAMES:
+            continue
+        # The parameter of a property put has no name.
+        names += ["rhs"] * (fd.cParams + 1 - len(names))
+        argspec = tuple(
+            (
+                _param_flags(fd.lprgelemdescParam[j]._.paramdesc.wParamFlags),
+                VARIANT,
+                names[j + 1],
+            )
+            for j in range(fd.cParams)
+        )
+        idlflags = [fd.memid] + _INVKIND_FLAGS[fd.invkind]
+        members.append(DISPMETHOD(idlflags, VARIANT, names[0], *argspec))
+    return members
+
+
+def bind_interface(tinfo: typeinfo.ITypeInfo) -> type[IDispatch]:
+    """Return an interface class for the dispinterface described by
+    'tinfo', or for the dispatch part of a dual interface.
+
+    If the interface class of a generated module is registered for the
+    IID, it is returned.  Otherwise, a class is created from the FUNCDESCs
+    and VARDESCs of this single typeinfo, without generating the module of
+    its typelib, and is cached by IID in this module only.  Its members
+    call `IDispatch.Invoke` with the dispids from the typeinfo, so they do
+    not need `GetIDsOfNames` or `ITypeComp.Bind`.
+
+    Raises TypeError if 'tinfo' describes neither a dispinterface nor a
+    dual interface.
+    """
+    ta = tinfo.GetTypeAttr()
+    if ta.typekind == typeinfo.TKIND_INTERFACE and (
+        ta.wTypeFlags & typeinfo.TYPEFLAG_FDUAL
+    ):
+        # The dispinterface of a dual interface.
+        tinfo = tinfo.GetRefTypeInfo(tinfo.GetRefTypeOfImplType(-1))
+        ta = tinfo.GetTypeAttr()
+    if ta.typekind != typeinfo.TKIND_DISPATCH:
+        raise TypeError(f"typekind {ta.typekind:d} is not a dispinterface")
+    iid = ta.guid.copy()
+    # The interface classes of generated modules, which describe the
+    # parameter and result types, are preferred.
+    key = bytes(iid)
+    registered = comtypes._interface_registry_by_iid.get(key)
+    if registered is not None and issubclass(registered, IDispatch):
+        return registered
+    with _lock:
+        try:
+            return _interfaces[iid]
+        except KeyError:
+            pass
+    name = tinfo.GetDocumentation(-1)[0]
+    logger.debug("bind_interface(%s) -> %s", iid, name)
+    namespace = {
+        "_case_insensitive_": True,
+        "_iid_": iid,
+        "_idlflags_": [],
+        "_disp_methods_": _disp_members(tinfo, ta),
+        "__module__": __name__,
+    }
+    itf = type(IDispatch)(name, (IDispatch,), namespace)
+    # The class must not be found by IID instead of a generated one, for
+    # SAFEARRAYs and events, so it is not left in the global registry.
+    if comtypes._interface_registry_by_iid.get(key) is itf:
+        if registered is None:
+            del comtypes._interface_registry_by_iid[key]
+        else:
+            comtypes._interface_registry_by_iid[key] = registered
+    with _lock:
+        # Another thread may have been faster.
+        return _interfaces.setdefault(iid, itf)
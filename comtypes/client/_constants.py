@@ -9,6 +9,7 @@ import sys
 import comtypes
 import comtypes.automation
 import comtypes.typeinfo
+from comtypes.typeinfo import TKIND_ALIAS, TKIND_ENUM, TKIND_MODULE
 
 
 class _frozen_attr_dict(dict):
@@ -48,6 +49,10 @@ class Constants:
     then exposes constants and enumerations in the type library
     as attributes.
 
+    The members of an enumeration or module are read from the type library
+    when one of them is first looked up; `consts`, `enums` and `alias` are
+    populated completely when they are first accessed.
+
     Examples:
         >>> c = Constants('scrrun.dll')  # load `Scripting` consts, enums, and alias
         >>> c.IOMode.ForReading  # returns enumeration member value
@@ -70,7 +75,16 @@ class Constants:
         True
     """
 
-    __slots__ = ("alias", "consts", "enums", "tcomp")
+    __slots__ = (
+        "tcomp",
+        "_tlib",
+        "_typeinfos",
+        "_members",
+        "_ref_names",
+        "_consts",
+        "_enums",
+        "_alias",
+    )
 
     def __init__(self, obj):
         if isinstance(obj, str):
@@ -78,31 +92,76 @@ class Constants:
         else:
             obj = obj.QueryInterface(comtypes.automation.IDispatch)
             tlib, index = obj.GetTypeInfo(0).GetContainingTypeLib()
-        consts, enums, alias = self._get_bound_namespaces(tlib)
-        self.consts = _frozen_attr_dict(consts)
-        self.enums = _frozen_attr_dict(enums)
-        self.alias = _frozen_attr_dict(alias)
+        self._tlib = tlib
         self.tcomp = tlib.GetTypeComp()
-
-    def _get_bound_namespaces(self, tlib):
-        consts, enums, alias = {}, {}, {}
-        for i in range(tlib.GetTypeInfoCount()):
-            tinfo = tlib.GetTypeInfo(i)
-            ta = tinfo.GetTypeAttr()
-            if ta.typekind == comtypes.typeinfo.TKIND_ALIAS:
-                alias.update(self._get_ref_names(tinfo, ta))
-            members = self._get_members(tinfo, ta)
-            if ta.typekind == comtypes.typeinfo.TKIND_ENUM:
-                enums[tinfo.GetDocumentation(-1)[0]] = members
-            consts.update(members)
-        return consts, enums, alias
+        # Only the names and the kinds of the type infos are read here, they
+        # are available without loading the type infos themselves.
+        self._typeinfos = {
+            tlib.GetDocumentation(i)[0]: (i, tlib.GetTypeInfoType(i))
+            for i in range(tlib.GetTypeInfoCount())
+        }
+        self._members = {}  # type info index -> members
+        self._ref_names = {}  # type info index -> {friendly_name: real_name}
+        self._consts = None
+        self._enums = None
+        self._alias = None
+
+    @property
+    def consts(self):
+        if self._consts is None:
+            consts = {}
+            for index in self._indexes(TKIND_ENUM, TKIND_MODULE):
+                consts.update(self._get_members_of(index))
+            self._consts = _frozen_attr_dict(consts)
+        return self._consts
+
+    @property
+    def enums(self):
+        if self._enums is None:
+            enums = {
+                name: self._get_members_of(index)
+                for name, (index, typekind) in self._typeinfos.items()
+                if typekind == TKIND_ENUM
+            }
+            self._enums = _frozen_attr_dict(enums)
+        return self._enums
+
+    @property
+    def alias(self):
+        if self._alias is None:
+            alias = {}
+            for index in self._indexes(TKIND_ALIAS):
+                alias.update(self._get_ref_names_of(index))
+            self._alias = _frozen_attr_dict(alias)
+        return self._alias
+
+    def _indexes(self, *typekinds):
+        return sorted(i for i, kind in self._typeinfos.values() if kind in typekinds)
+
+    def _get_members_of(self, index):
+        try:
+            return self._members[index]
+        except KeyError:
+            tinfo = self._tlib.GetTypeInfo(index)
+            members = self._get_members(tinfo, tinfo.GetTypeAttr())
+            self._members[index] = members
+            return members
+
+    def _get_ref_names_of(self, index):
+        try:
+            return self._ref_names[index]
+        except KeyError:
+            tinfo = self._tlib.GetTypeInfo(index)
+            ref_names = self._get_ref_names(tinfo, tinfo.GetTypeAttr())
+            self._ref_names[index] = ref_names
+            return ref_names
 
     def _get_ref_names(self, tinfo, ta):
         try:
             refinfo = tinfo.GetRefTypeInfo(ta.tdescAlias._.hreftype)
         except comtypes.COMError:
             return {}
-        if refinfo.GetTypeAttr().typekind != comtypes.typeinfo.TKIND_ENUM:
+        if refinfo.GetTypeAttr().typekind != TKIND_ENUM:
             return {}
         friendly_name = tinfo.GetDocumentation(-1)[0]
         real_name = refinfo.GetDocumentation(-1)[0]
@@ -123,14 +182,36 @@ class Constants:
                 members[name] = vdesc._.lpvarValue[0].value
         return _frozen_attr_dict(members)
 
-    def __getattr__(self, name):
-        name = self.alias.get(name, name)
-        if name in self.enums:
-            return self.enums[name]
-        elif name in self.consts:
-            return self.consts[name]
+    def _find_const(self, name):
+        if self._consts is not None:
+            return self._consts[name]
+        # The type library knows the names before they are munged.
+        if name.endswith("_") and keyword.iskeyword(name[:-1]):
+            tlib_name = name[:-1]
         else:
-            raise AttributeError(name)
+            tlib_name = name
+        if self._tlib.IsName(tlib_name) is None:
+            raise KeyError(name)
+        # When a name is defined more than once, the last definition wins,
+        # like in `consts`.
+        for index in reversed(self._indexes(TKIND_ENUM, TKIND_MODULE)):
+            members = self._get_members_of(index)
+            if name in members:
+                return members[name]
+        raise KeyError(name)
+
+    def __getattr__(self, name):
+        if name in self._typeinfos:
+            index, typekind = self._typeinfos[name]
+            if typekind == TKIND_ALIAS:
+                name = self._get_ref_names_of(index).get(name, name)
+                index, typekind = self._typeinfos.get(name, (None, None))
+            if typekind == TKIND_ENUM:
+                return self._get_members_of(index)
+        try:
+            return self._find_const(name)
+        except KeyError:
+            raise AttributeError(name) from None
 
     def _bind_type(self, name):
         return self.tcomp.BindType(name)
@@ -1,4 +1,5 @@
 import logging
+from ctypes import byref
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, overload
 from typing import Union as _UnionT
 
@@ -122,6 +123,101 @@ def CreateObject(
     return _manage(obj, clsid, interface=interface)
 
 
+class ClassFactoryCache:
+    """A pool of class factories used to create many objects of the same
+    classes without going through `CoCreateInstance` every time.
+
+    The `IClassFactory` pointers are retrieved with `GetClassObject` on
+    first use and are kept per (clsid, clsctx, machine) until `release()`
+    is called or the `with` block is left.
+
+    If 'lock_server' is True, `IClassFactory.LockServer(True)` is called
+    for every cached factory, which keeps the server loaded while the
+    factory is held, and `LockServer(False)` is called on release.
+
+    The factories are COM pointers; a cache must only be used from the
+    apartment it was created in.
+    """
+
+    def __init__(self, lock_server: bool = False) -> None:
+        self.lock_server = lock_server
+        self._factories: dict[
+            tuple[GUID, Optional[int], Optional[str]], "hints.IClassFactory"
+        ] = {}
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._factories
+
+    def __enter__(self) -> "hints.Self":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    def GetClassObject(
+        self,
+        progid: _UnionT[str, type[CoClass], GUID],
+        clsctx: Optional[int] = None,
+        machine: Optional[str] = None,
+    ) -> "hints.IClassFactory":
+        """Return the cached class factory for 'progid', retrieving it
+        with `GetClassObject` if it is not cached yet."""
+        clsid = GUID.from_progid(progid)
+        key = (clsid, clsctx, machine)
+        try:
+            return self._factories[key]
+        except KeyError:
+            pass
+        if machine is None:
+            factory = GetClassObject(clsid, clsctx)
+        else:
+            serverinfo = COSERVERINFO()
+            serverinfo.pwszName = machine
+            factory = GetClassObject(clsid, clsctx, byref(serverinfo))  # type: ignore
+        if self.lock_server:
+            factory.LockServer(True)
+        self._factories[key] = factory
+        return factory
+
+    def CreateObject(
+        self,
+        progid: _UnionT[str, type[CoClass], GUID],
+        clsctx: Optional[int] = None,
+        machine: Optional[str] = None,
+        interface: Optional[type[IUnknown]] = None,
+        dynamic: bool = False,
+    ) -> Any:
+        """Create a COM object through a cached class factory.
+
+        The parameters have the same meaning as in `CreateObject()`.
+        """
+        clsid = GUID.from_progid(progid)
+        if dynamic:
+            if interface:
+                raise ValueError("interface and dynamic are mutually exclusive")
+            interface = automation.IDispatch
+        elif interface is None:
+            interface = getattr(progid, "_com_interfaces_", [None])[0]
+        factory = self.GetClassObject(clsid, clsctx, machine)
+        logger.debug("IClassFactory.CreateInstance(%s, interface=%s)", clsid, interface)
+        obj = factory.CreateInstance(interface=interface or IUnknown)
+        if dynamic:
+            return comtypes.client.dynamic.Dispatch(obj)
+        return _manage(obj, clsid, interface=interface)
+
+    def release(self) -> None:
+        """Drop all cached class factories, unlocking the servers if
+        they were locked."""
+        factories = list(self._factories.values())
+        self._factories.clear()
+        if self.lock_server:
+            for factory in factories:
+                factory.LockServer(False)
+
+
 @overload
 def CoGetObject(displayname: str, interface: type[_T_IUnknown]) -> _T_IUnknown: ...
 @overload
@@ -126,12 +126,12 @@ def FindOutgoingInterface(source: IUnknown) -> type[IUnknown]:
             raise NotImplementedError("retrieved outgoing interface IID is GUID_NULL")
         # another try: block needed?
         try:
-            interface = comtypes.com_interface_registry[str(guid)]
+            interface = comtypes._interface_registry_by_iid[bytes(guid)]
         except KeyError:
             tinfo = pci.GetClassInfo()
             tlib, index = tinfo.GetContainingTypeLib()
             GetModule(tlib)
-            interface = comtypes.com_interface_registry[str(guid)]
+            interface = comtypes._interface_registry_by_iid[bytes(guid)]
         logger.debug("%s using sinkinterface %s", source, interface)
         return interface
 
@@ -165,7 +165,7 @@ def find_single_connection_interface(source):
         next(enum)
     except StopIteration:
         try:
-            interface = comtypes.com_interface_registry[str(iid)]
+            interface = comtypes._interface_registry_by_iid[bytes(iid)]
         except KeyError:
             return None
         else:
@@ -402,3 +402,4 @@ def PumpEvents(timeout: Any) -> None:
     finally:
         _CloseHandle(hevt)
         _SetConsoleCtrlHandler(PHANDLER_ROUTINE(HandlerRoutine), 0)
+        comtypes.flush_release_queue()
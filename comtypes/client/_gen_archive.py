@@ -0,0 +1,143 @@
+"""An archive of compiled generated modules.
+
+With `comtypes.client.set_archive_cache(path)`, the modules that
+`GetModule` generates are stored, compiled, in a single SQLite database
+file instead of one `.py` file per module in the `comtypes.gen` directory,
+and imported from there by a `sys.meta_path` finder.  Importing a
+generated module then costs a single query instead of the directory
+listings and `stat` calls of the path based import system, which adds up
+on slow file systems like network home directories.
+
+Each module is written in a transaction of its own, so other processes
+using the same archive see either the former or the new version of a
+module, never a partially written one.
+
+An archive can also be opened read-only, for instance one that was
+prebuilt and shipped with a frozen application.  Modules that are missing
+from such an archive are generated as if there was no archive.
+"""
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import logging
+import marshal
+import os
+import sqlite3
+import sys
+import threading
+import zlib
+from types import ModuleType
+from typing import Optional
+from urllib.request import pathname2url
+
+logger = logging.getLogger(__name__)
+
+# Bump this when the schema of the archive changes.
+FORMAT_VERSION = 1
+
+_PACKAGE = "comtypes.gen."
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS modules (
+    name TEXT PRIMARY KEY,
+    magic BLOB NOT NULL,
+    code BLOB NOT NULL,
+    source BLOB NOT NULL
+)
+"""
+
+
+class GenArchive(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Finds and loads the modules of the `comtypes.gen` package stored in
+    the SQLite database at 'path'.
+
+    Modules are stored as code objects compiled by the running Python;
+    those compiled by another version are ignored, and replaced when they
+    are generated again.  If 'readonly' is true, the database is opened as
+    immutable and `store` must not be called.
+    """
+
+    def __init__(self, path: str, readonly: bool = False) -> None:
+        self.path = path
+        self.readonly = readonly
+        self._lock = threading.Lock()
+        if readonly:
+            uri = f"file:{pathname2url(os.path.abspath(path))}?immutable=1"
+            self._con = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._valid = self._user_version() == FORMAT_VERSION
+            if not self._valid:
+                logger.info("Ignoring archive %s of another format", path)
+        else:
+            # The default rollback journal, unlike WAL, also works on network
+            # file systems.
+            self._con = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            with self._lock, self._con:
+                if self._user_version() != FORMAT_VERSION:
+                    self._con.execute("DROP TABLE IF EXISTS modules")
+                    self._con.execute(f"PRAGMA user_version = {FORMAT_VERSION:d}")
+                self._con.execute(_SCHEMA)
+            self._valid = True
+
+    def _user_version(self) -> int:
+        return self._con.execute("PRAGMA user_version").fetchone()[0]
+
+    def _origin(self, fullname: str) -> str:
+        # Like the modules generated in memory, archived modules pretend to
+        # be in the `comtypes.gen` directory, which relative typelib paths
+        # in generated modules are resolved against.
+        gen_path = os.path.abspath(sys.modules["comtypes.gen"].__path__[0])
+        return os.path.join(gen_path, f"{fullname[len(_PACKAGE) :]}.py")
+
+    def _select(self, column: str, fullname: str) -> Optional[bytes]:
+        if not self._valid:
+            return None
+        with self._lock:
+            row = self._con.execute(
+                f"SELECT {column} FROM modules WHERE name = ? AND magic = ?",
+                (fullname, importlib.util.MAGIC_NUMBER),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not fullname.startswith(_PACKAGE) or "." in fullname[len(_PACKAGE) :]:
+            return None
+        code = self._select("code", fullname)
+        if code is None:
+            return None
+        return importlib.machinery.ModuleSpec(
+            fullname, self, origin=self._origin(fullname), loader_state=code
+        )
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module: ModuleType) -> None:
+        spec = module.__spec__
+        module.__file__ = spec.origin
+        exec(marshal.loads(spec.loader_state), module.__dict__)
+
+    def get_source(self, fullname: str) -> Optional[str]:
+        source = self._select("source", fullname)
+        if source is None:
+            return None
+        return zlib.decompress(source).decode("utf-8")
+
+    def store(self, fullname: str, source: str) -> None:
+        """Compile the 'source' of the module 'fullname' and store it,
+        replacing a former version."""
+        if self.readonly:
+            raise OSError(f"archive {self.path} is read-only")
+        code = compile(source, self._origin(fullname), "exec", dont_inherit=True)
+        row = (
+            fullname,
+            importlib.util.MAGIC_NUMBER,
+            marshal.dumps(code),
+            zlib.compress(source.encode("utf-8")),
+        )
+        with self._lock, self._con:
+            self._con.execute("INSERT OR REPLACE INTO modules VALUES (?, ?, ?, ?)", row)
+
+    def close(self) -> None:
+        """Close the database."""
+        self._con.close()
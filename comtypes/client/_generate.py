@@ -1,22 +1,137 @@
 import ctypes
 import importlib
 import inspect
+import io
 import logging
 import os
 import sys
 import types
 import winreg
-from collections.abc import Mapping
-from typing import Any, Optional
+from collections.abc import Callable, Mapping
+from typing import IO, Any, Optional
 from typing import Union as _UnionT
 
 import comtypes.client
 from comtypes import GUID, typeinfo
+from comtypes.client._gen_archive import GenArchive
 from comtypes.tools import codegenerator, tlbparser
 
 logger = logging.getLogger(__name__)
 
 
+# If True, the code fragments of generated modules are kept in the cache
+# directory, see `set_incremental_generation`.
+_incremental = False
+
+
+def set_incremental_generation(enabled: bool) -> bool:
+    """Make `GetModule` keep the code generated for the interfaces of a
+    typelib, and reuse it for the interfaces that are unchanged when the
+    typelib is revised and its module is generated again.
+
+    This only takes effect when the modules are written to the file system.
+
+    Returns the previous setting.
+    """
+    global _incremental
+    previous, _incremental = _incremental, enabled
+    return previous
+
+
+# If True, the members of interfaces in generated modules are described
+# with data tables, see `set_table_modules`.
+_table_modules = False
+
+
+def set_table_modules(enabled: bool) -> bool:
+    """Make `GetModule` generate wrapper modules that define the methods of
+    interfaces and the values of enumerations from an embedded data table,
+    instead of Python source.
+
+    These modules are much smaller, and faster to compile and to import.
+    Modules that were generated before are not affected.  See also
+    `comtypes._member_tables`.
+
+    Returns the previous setting.
+    """
+    global _table_modules
+    previous, _table_modules = _table_modules, enabled
+    return previous
+
+
+# If True, the type annotations of interfaces are written to `.pyi` stubs
+# of the generated modules, see `set_stub_files`.
+_stub_files = False
+
+
+def set_stub_files(enabled: bool) -> bool:
+    """Make `GetModule` write the type annotations of the interfaces of a
+    wrapper module to a `.pyi` stub file next to it, instead of to `if
+    TYPE_CHECKING:` blocks in the module itself.
+
+    Type checkers and IDEs read the stub, and the module that is compiled
+    and imported at runtime is smaller.  This only takes effect when the
+    modules are written to the file system.
+
+    Returns the previous setting.
+    """
+    global _stub_files
+    previous, _stub_files = _stub_files, enabled
+    return previous
+
+
+# If True, generated modules are written without the help text of the
+# typelib, see `set_lean_modules`.
+_lean_modules = False
+
+
+def set_lean_modules(enabled: bool) -> bool:
+    """Make `GetModule` generate wrapper modules in the "lean" profile,
+    which leaves out the helpstrings of methods and properties and the
+    docstrings of classes, so the modules are smaller and faster to import.
+
+    The modules of the lean profile are named like the full ones with a
+    `_lean` suffix, for example `comtypes.gen.Scripting_lean`, so both
+    can be generated and used side by side.
+
+    Returns the previous setting.
+    """
+    global _lean_modules
+    previous, _lean_modules = _lean_modules, enabled
+    return previous
+
+
+# The archive that generated modules are stored in and imported from, see
+# `set_archive_cache`.
+_archive: Optional[GenArchive] = None
+
+
+def set_archive_cache(path: Optional[str], readonly: bool = False) -> Optional[str]:
+    """Make `GetModule` store the modules it generates, compiled, in the
+    single archive file at 'path', and import generated modules from it
+    before looking for them in the `comtypes.gen` package directories.
+
+    This avoids the many file system accesses of importing modules from
+    a directory, which are slow on network drives.  If 'readonly' is true,
+    the archive is only imported from, and missing modules are generated
+    as without an archive; this serves an archive that was prebuilt and
+    shipped with a frozen application.  With 'path' None, the archive is
+    no longer used.  See also `comtypes.client._gen_archive`.
+
+    Returns the path of the previous archive, or None.
+    """
+    global _archive
+    previous, _archive = _archive, None
+    if previous is not None:
+        sys.meta_path.remove(previous)
+        previous.close()
+    if path is not None:
+        _archive = GenArchive(path, readonly)
+        sys.meta_path.insert(0, _archive)
+    importlib.invalidate_caches()
+    return None if previous is None else previous.path
+
+
 def _my_import(fullname: str) -> types.ModuleType:
     """helper function to import dotted modules"""
     import comtypes.gen as g
@@ -82,6 +197,9 @@ def GetModule(tlib: _UnionT[Any, typeinfo.ITypeLib]) -> types.ModuleType:
     executable it lives in a zip archive), generated modules are only
     created in memory without writing them to the file system.
 
+    If an archive was set with `set_archive_cache`, generated modules
+    are stored in it and imported from it instead.
+
     Example:
         GetModule("UIAutomationCore.dll")
 
@@ -176,8 +294,8 @@ def _get_existing_module(tlib: typeinfo.ITypeLib) -> Optional[types.ModuleType]:
         except Exception as details:
             logger.info("Could not import %s: %s", name, details)
 
-    wrapper_name = codegenerator.name_wrapper_module(tlib)
-    friendly_name = codegenerator.name_friendly_module(tlib)
+    wrapper_name = codegenerator.name_wrapper_module(tlib, _lean_modules)
+    friendly_name = codegenerator.name_friendly_module(tlib, _lean_modules)
     wrapper_module = _get_wrapper(wrapper_name)
     if wrapper_module is not None:
         if friendly_name is None:
@@ -189,14 +307,30 @@ def _get_existing_module(tlib: typeinfo.ITypeLib) -> Optional[types.ModuleType]:
     return None
 
 
-def _create_module(modulename: str, code: str) -> types.ModuleType:
-    """Creates the module, then imports it."""
+def _create_module(
+    modulename: str, code: _UnionT[str, Callable[[IO[str]], None]]
+) -> types.ModuleType:
+    """Creates the module, then imports it.
+
+    'code' is the source code, or a function that writes it to a text file.
+    """
     # `modulename` is 'comtypes.gen.xxx'
     stem = modulename.split(".")[-1]
+    if _archive is not None and not _archive.readonly:
+        if callable(code):
+            output = io.StringIO()
+            code(output)
+            code = output.getvalue()
+        _archive.store(modulename, code)
+        return _my_import(modulename)
     if comtypes.client.gen_dir is None:
         # in memory system
         import comtypes.gen as g
 
+        if callable(code):
+            output = io.StringIO()
+            code(output)
+            code = output.getvalue()
         mod = types.ModuleType(modulename)
         abs_gen_path = os.path.abspath(g.__path__[0])  # type: ignore
         mod.__file__ = os.path.join(abs_gen_path, "<memory>")
@@ -206,16 +340,29 @@ def _create_module(modulename: str, code: str) -> types.ModuleType:
         return mod
     # in file system
     with open(os.path.join(comtypes.client.gen_dir, f"{stem}.py"), "w") as ofi:
-        print(code, file=ofi)
+        if callable(code):
+            code(ofi)
+        else:
+            print(code, file=ofi)
     # clear the import cache to make sure Python sees newly created modules
     importlib.invalidate_caches()
     return _my_import(modulename)
 
 
+def _write_stub(path: str, codegen: codegenerator.CodeGenerator) -> None:
+    if codegen.stub_stream is not None:
+        with open(path, "w", encoding="utf-8") as ofi:
+            codegen.write_stub_code(ofi)
+    elif os.path.exists(path):
+        # A stub from a former generation would hide the module.
+        os.remove(path)
+
+
 class ModuleGenerator:
     def __init__(self, tlib: typeinfo.ITypeLib, pathname: Optional[str]) -> None:
-        self.wrapper_name = codegenerator.name_wrapper_module(tlib)
-        self.friendly_name = codegenerator.name_friendly_module(tlib)
+        self.lean = _lean_modules
+        self.wrapper_name = codegenerator.name_wrapper_module(tlib, self.lean)
+        self.friendly_name = codegenerator.name_friendly_module(tlib, self.lean)
         if pathname is None:
             self.pathname = tlbparser.get_tlib_filename(tlib)
         else:
@@ -225,12 +372,38 @@ class ModuleGenerator:
     def generate(self) -> types.ModuleType:
         """Generates wrapper and friendly modules."""
         known_symbols, known_interfaces = _get_known_namespaces()
-        codegen = codegenerator.CodeGenerator(known_symbols, known_interfaces)
-        codebases: list[tuple[str, str]] = []
+        gen_dir = comtypes.client.gen_dir
+        stem = self.wrapper_name.split(".")[-1]
+        fragments = None
+        # Fragments are kept of the source of interfaces only.
+        if _incremental and not _table_modules and gen_dir is not None:
+            fragments = codegenerator.FragmentCache(
+                os.path.join(gen_dir, f"{stem}.fragments.json"),
+                version=codegenerator.version,
+            )
+        codegen = codegenerator.CodeGenerator(
+            known_symbols,
+            known_interfaces,
+            fragments,
+            member_tables=_table_modules,
+            stubs=_stub_files and gen_dir is not None,
+            lean=self.lean,
+        )
+        codebases: list[tuple[str, _UnionT[str, Callable[[IO[str]], None]]]] = []
         logger.info("# Generating %s", self.wrapper_name)
         items = list(tlbparser.TypeLibParser(self.tlib).parse().values())
-        wrp_code = codegen.generate_wrapper_code(items, filename=self.pathname)
-        codebases.append((self.wrapper_name, wrp_code))
+        codegen.generate_wrapper(items, filename=self.pathname)
+        if fragments is not None:
+            logger.info(
+                "# Reused %d of %d code fragments",
+                fragments.hits,
+                fragments.hits + fragments.misses,
+            )
+            fragments.save()
+        if gen_dir is not None:
+            _write_stub(os.path.join(gen_dir, f"{stem}.pyi"), codegen)
+        # The wrapper code can be large; it is streamed into the module file.
+        codebases.append((self.wrapper_name, codegen.write_wrapper_code))
         if self.friendly_name is not None:
             logger.info("# Generating %s", self.friendly_name)
             frd_code = codegen.generate_friendly_code(self.wrapper_name)
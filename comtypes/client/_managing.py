@@ -9,6 +9,11 @@ from comtypes.client._generate import GetModule
 
 logger = logging.getLogger(__name__)
 
+# Maps the string form of a CLSID, or of the GUID of the default interface's
+# typeinfo, to the Python interface class that `GetBestInterface` resolved for
+# it.  Later objects of the same kind then only need a `QueryInterface` call.
+_best_interface_cache: dict[str, type[IUnknown]] = {}
+
 
 def wrap_outparam(punk: Any) -> Any:
     logger.debug("wrap_outparam(%s)", punk)
@@ -32,6 +37,10 @@ def GetBestInterface(punk: Any) -> Any:
         return punk  # or should we return None?
     # find the typelib and the interface name
     logger.debug("GetBestInterface(%s)", punk)
+    clsid = punk.__dict__.get("__clsid")
+    result = _query_cached_interface(punk, clsid)
+    if result is not None:
+        return result
     try:
         try:
             pci = punk.QueryInterface(typeinfo.IProvideClassInfo)
@@ -47,6 +56,10 @@ def GetBestInterface(punk: Any) -> Any:
         tinfo = pci.GetClassInfo()  # TypeInfo for the CoClass
         # find the interface marked as default
         ta = tinfo.GetTypeAttr()
+        clsid = str(ta.guid)
+        result = _query_cached_interface(punk, clsid)
+        if result is not None:
+            return result
         for index in range(ta.cImplTypes):
             if tinfo.GetImplTypeFlags(index) == 1:
                 break
@@ -74,6 +87,10 @@ def GetBestInterface(punk: Any) -> Any:
             return pdisp
     typeattr = tinfo.GetTypeAttr()
     logger.debug("Default interface is %s", typeattr.guid)
+    tinfo_guid = str(typeattr.guid)
+    result = _query_cached_interface(punk, tinfo_guid)
+    if result is not None:
+        return result
     try:
         punk.QueryInterface(IUnknown, typeattr.guid)
     except COMError:
@@ -102,6 +119,31 @@ def GetBestInterface(punk: Any) -> Any:
     # *before* generating the wrapper module?
     result = punk.QueryInterface(interface)
     logger.debug("Final result is %s", result)
+    _best_interface_cache[tinfo_guid] = interface
+    if clsid is not None and clsid != "None":
+        _best_interface_cache[clsid] = interface
+    return result
+
+
+def _query_cached_interface(punk: Any, key: Optional[str]) -> Any:
+    """QueryInterface `punk` for the interface that was previously resolved
+    for `key` by `GetBestInterface`.
+
+    Returns None if nothing is cached for `key` or if the object does not
+    implement the cached interface, so the caller falls back to resolving
+    it from the type information.
+    """
+    if key is None:
+        return None
+    interface = _best_interface_cache.get(key)
+    if interface is None:
+        return None
+    try:
+        result = punk.QueryInterface(interface)
+    except COMError:
+        logger.debug("Does not implement cached interface %s", interface)
+        return None
+    logger.debug("Final result from cache is %s", result)
     return result
 
 
@@ -3,7 +3,7 @@ from typing import Any, Optional, TypeVar
 
 from comtypes import GUID, COMError, IUnknown, _is_object, automation
 from comtypes import hresult as hres
-from comtypes.client import lazybind
+from comtypes.client import _bind, lazybind
 
 _T_IUnknown = TypeVar("_T_IUnknown", bound=IUnknown)
 # These errors generally mean the property or method exists,
@@ -17,6 +17,26 @@ ERRORS_BAD_CONTEXT = [
     hres.E_INVALIDARG,
 ]
 
+# If True, `Dispatch` returns early bound pointers for objects that expose
+# type information, see `set_early_binding`.
+_early_binding = False
+
+
+def set_early_binding(enabled: bool) -> bool:
+    """Make `Dispatch` return pointers to early bound interfaces for
+    objects that expose type information.
+
+    The interface classes are created from the type information of the
+    single interface of the object, see `comtypes.client._bind`, instead
+    of from the generated module of the whole typelib.  Members that are
+    not described by the type information can not be accessed then.
+
+    Returns the previous setting.
+    """
+    global _early_binding
+    previous, _early_binding = _early_binding, enabled
+    return previous
+
 
 def Dispatch(obj):
     """Wrap an object in a Dispatch instance, exposing methods and properties
@@ -29,6 +49,16 @@ def Dispatch(obj):
             tinfo = obj.GetTypeInfo(0)
         except (OSError, COMError):
             return _Dispatch(obj)
+        if _early_binding:
+            try:
+                interface = _bind.bind_interface(tinfo)
+            except (TypeError, COMError):
+                pass
+            else:
+                ptr = ctypes.cast(obj, ctypes.POINTER(interface))
+                # cast doesn't call AddRef
+                ptr.AddRef()
+                return ptr
         return lazybind.Dispatch(obj, tinfo)
     return obj
 
@@ -174,4 +204,4 @@ class _Collection:
         return self
 
 
-__all__ = ["Dispatch"]
+__all__ = ["Dispatch", "set_early_binding"]
@@ -4,9 +4,12 @@ The global interface table provides a way to marshal interface pointers
 between different threading appartments.
 """
 
+import threading
+import weakref
 from ctypes import *
 from ctypes.wintypes import DWORD
 
+import comtypes
 from comtypes import (
     CLSCTX_INPROC_SERVER,
     COMMETHOD,
@@ -63,10 +66,121 @@ RevokeInterfaceFromGlobal = git.RevokeInterfaceFromGlobal
 RegisterInterfaceInGlobal = git.RegisterInterfaceInGlobal
 GetInterfaceFromGlobal = git.GetInterfaceFromGlobal
 
+
+class _ThreadProxies(dict):
+    """The proxies cached by a `ProxyPool` for one thread, by cookie."""
+
+    def __init__(self):
+        super().__init__()
+        # Cookies revoked by other threads; their proxies are released the
+        # next time the pool is used from the owning thread.
+        self.revoked = set()
+
+
+class ProxyPool:
+    """A cache of apartment-correct proxies for objects registered in the
+    global interface table.
+
+    `get` unmarshals a proxy with `GetInterfaceFromGlobal` only the first
+    time a thread asks for a (cookie, interface) pair; later calls from the
+    same thread return the cached proxy.
+
+    The proxies of a thread are released when `release_thread` is called
+    from that thread, and by `comtypes.CoUninitialize` before the apartment
+    of the thread is uninitialized.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._serial = 0
+        self._registered = {}
+        # The caches of all threads, so `revoke` can reach them.  They are
+        # owned by the thread-local storage of their threads.
+        self._caches = weakref.WeakSet()
+        _pools.add(self)
+
+    def register(self, obj, interface=IUnknown):
+        """Register 'obj' in the global interface table and return the cookie."""
+        cookie = RegisterInterfaceInGlobal(obj, interface)
+        with self._lock:
+            self._serial += 1
+            self._registered[cookie] = self._serial
+        return cookie
+
+    def revoke(self, cookie):
+        """Revoke 'cookie' from the global interface table.
+
+        The proxies of the calling thread are released at once.  Those
+        cached by other threads are not handed out anymore, and since a
+        proxy must be released in its own apartment, they are released the
+        next time the pool is used from their thread.
+        """
+        with self._lock:
+            self._registered.pop(cookie, None)
+            for cache in self._caches:
+                cache.revoked.add(cookie)
+        self._proxies().pop(cookie, None)
+        RevokeInterfaceFromGlobal(cookie)
+
+    def get(self, cookie, interface=IUnknown):
+        """Return a proxy for 'cookie' that is usable in the calling thread."""
+        # Cookies may be reused by the global interface table after they
+        # have been revoked, so cached proxies are keyed by the serial
+        # number of the registration, too.
+        serial = self._registered.get(cookie)
+        cached = self._proxies()
+        if cookie not in cached or cached[cookie][0] != serial:
+            cached[cookie] = (serial, {})
+        proxies = cached[cookie][1]
+        try:
+            return proxies[interface._iid_]
+        except KeyError:
+            ptr = proxies[interface._iid_] = GetInterfaceFromGlobal(cookie, interface)
+            return ptr
+
+    def release_thread(self):
+        """Release all proxies cached for the calling thread."""
+        proxies = getattr(self._local, "proxies", None)
+        if proxies is None:
+            return
+        proxies.revoked.clear()
+        while proxies:
+            _, (_, per_cookie) = proxies.popitem()
+            per_cookie.clear()
+
+    def _proxies(self):
+        try:
+            proxies = self._local.proxies
+        except AttributeError:
+            proxies = self._local.proxies = _ThreadProxies()
+            with self._lock:
+                self._caches.add(proxies)
+            return proxies
+        if proxies.revoked:
+            with self._lock:
+                revoked, proxies.revoked = proxies.revoked, set()
+            for cookie in revoked:
+                proxies.pop(cookie, None)
+        return proxies
+
+
+# The pools whose proxies `comtypes.CoUninitialize` releases.
+_pools = weakref.WeakSet()
+
+
+def _release_pools():
+    for pool in list(_pools):
+        pool.release_thread()
+
+
+comtypes._uninitialize_hooks.append(_release_pools)
+
+
 # fmt: off
 __all__ = [
     "RegisterInterfaceInGlobal", "RevokeInterfaceFromGlobal",
-    "GetInterfaceFromGlobal",
+    "GetInterfaceFromGlobal", "ProxyPool",
 ]
 # fmt: on
 
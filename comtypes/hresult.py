@@ -22,6 +22,12 @@ CLASS_E_CLASSNOTAVAILABLE = -2147221231  # 0x80040111L
 
 CO_E_CLASSSTRING = -2147221005  # 0x800401F3L
 
+# structured storage error codes
+STG_E_INVALIDFUNCTION = -2147287039  # 0x80030001
+STG_E_ACCESSDENIED = -2147287035  # 0x80030005
+STG_E_INVALIDPOINTER = -2147287031  # 0x80030009
+STG_E_MEDIUMFULL = -2147286928  # 0x80030070
+
 # connection point error codes
 CONNECT_E_CANNOTCONNECT = -2147220990
 CONNECT_E_ADVISELIMIT = -2147220991
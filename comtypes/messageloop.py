@@ -4,6 +4,8 @@ from ctypes.wintypes import BOOL, HWND, MSG
 from ctypes.wintypes import LPLONG as LRESULT
 from typing import TYPE_CHECKING, SupportsIndex
 
+import comtypes
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
     from ctypes import _CArgObject
@@ -58,6 +60,7 @@ class _MessageLoop:
             if not self.filter_message(lpmsg):
                 TranslateMessage(lpmsg)
                 DispatchMessage(lpmsg)
+            comtypes.flush_release_queue()
 
     def filter_message(self, lpmsg: "_CArgObject") -> bool:
         return any(list(filter(lpmsg)) for filter in self._filters)
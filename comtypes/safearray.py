@@ -1,10 +1,20 @@
 import array
 import threading
-from ctypes import POINTER, Structure, byref, c_long, cast, memmove, pointer, sizeof
+from ctypes import (
+    POINTER,
+    Structure,
+    byref,
+    c_long,
+    c_ubyte,
+    cast,
+    memmove,
+    pointer,
+    sizeof,
+)
 from typing import TYPE_CHECKING
 
 import comtypes
-from comtypes import IUnknown, _safearray, com_interface_registry
+from comtypes import IUnknown, _interface_registry_by_iid, _safearray
 from comtypes.patcher import Patch
 
 if TYPE_CHECKING:
@@ -81,6 +91,7 @@ def _make_safearray_type(itemtype):
         VT_UNKNOWN,
         IDispatch,
         _ctype_to_vartype,
+        _get_record_info,
     )
 
     meta = type(_safearray.tagSAFEARRAY)
@@ -91,14 +102,10 @@ def _make_safearray_type(itemtype):
         extra = None
     except KeyError:
         if issubclass(itemtype, Structure):
-            try:
-                guids = itemtype._recordinfo_
-            except AttributeError:
-                extra = None
+            if hasattr(itemtype, "_recordinfo_"):
+                extra = _get_record_info(itemtype)
             else:
-                from comtypes.typeinfo import GetRecordInfoFromGuids
-
-                extra = GetRecordInfoFromGuids(*guids)
+                extra = None
             vartype = VT_RECORD
         elif issubclass(itemtype, POINTER(IDispatch)):
             vartype = VT_DISPATCH
@@ -312,7 +319,7 @@ def _make_safearray_type(itemtype):
                     return [i.value for i in ptr[:num_elements]]
                 elif issubclass(self._itemtype_, POINTER(IUnknown)):
                     iid = _safearray.SafeArrayGetIID(self)
-                    itf = com_interface_registry[str(iid)]
+                    itf = _interface_registry_by_iid[bytes(iid)]
                     # COM interface pointers retrieved from array
                     # must be AddRef()'d if non-NULL.
                     elems = ptr[:num_elements]
@@ -345,6 +352,18 @@ def _make_safearray_type(itemtype):
                             return arr.copy()
                         return ptr[:num_elements]
 
+                    if safearray_as_ndarray:
+                        # Records made of plain numbers are copied into a
+                        # structured ndarray at once.
+                        npsupport = comtypes.npsupport
+                        dtype = npsupport.structure_dtype(self._itemtype_)
+                        if dtype is not None:
+                            if not num_elements:
+                                return npsupport.numpy.empty(0, dtype)
+                            size = num_elements * dtype.itemsize
+                            buf = cast(ptr, POINTER(c_ubyte * size)).contents
+                            return npsupport.numpy.frombuffer(buf, dtype).copy()
+
                     def keep_safearray(v):
                         v.__keepref = self
                         return v
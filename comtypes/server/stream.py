@@ -0,0 +1,224 @@
+import mmap
+from ctypes import (
+    c_char,
+    c_char_p,
+    c_ubyte,
+    c_void_p,
+    cast,
+    memmove,
+    memset,
+    sizeof,
+)
+from typing import Any
+
+from comtypes import COMObject
+from comtypes.hresult import (
+    S_OK,
+    STG_E_ACCESSDENIED,
+    STG_E_INVALIDFUNCTION,
+    STG_E_INVALIDPOINTER,
+    STG_E_MEDIUMFULL,
+)
+from comtypes.stream import (
+    STGTY_STREAM,
+    STREAM_SEEK_CUR,
+    STREAM_SEEK_END,
+    STREAM_SEEK_SET,
+    IStream,
+    tagSTATSTG,
+)
+
+__all__ = ["BufferStream"]
+
+STGM_READ = 0x00000000
+STGM_READWRITE = 0x00000002
+
+# The size of the temporary buffer of `BufferStream.RemoteCopyTo`.
+COPY_CHUNK_SIZE = 1 << 16
+
+
+class BufferStream(COMObject):
+    """An `IStream` implementation on top of a Python buffer.
+
+    'buffer' may be a `bytes` object or any other object supporting the
+    buffer protocol, like `bytearray`, `mmap.mmap` or `memoryview`.  Data
+    is moved between the buffer and the caller's memory with `memmove`,
+    without intermediate Python objects.  Read-only buffers other than
+    `bytes` are copied once, since their address cannot be taken otherwise.
+
+    The stream is read-only if the buffer is, or if 'readonly' is True.
+    Writing past the end of the buffer grows a `bytearray` or a resizable
+    `mmap`; other buffers have a fixed size and the write fails with
+    `STG_E_MEDIUMFULL`.
+    """
+
+    _com_interfaces_ = [IStream]
+
+    def __init__(self, buffer: Any, readonly: bool = False) -> None:
+        if not isinstance(buffer, bytes):
+            with memoryview(buffer) as view:
+                if view.readonly:
+                    buffer = view.tobytes()
+        self.buffer = buffer
+        self.readonly = readonly or isinstance(buffer, bytes)
+        self.position = 0
+        super().__init__()
+
+    @classmethod
+    def from_file(cls, fileno: int, readonly: bool = True) -> "BufferStream":
+        """Create a stream on the contents of the file descriptor 'fileno'
+        by mapping it into memory.
+
+        The file must not be empty.  Unless 'readonly' is False, the file
+        is mapped copy-on-write, so its contents are never modified.
+        """
+        access = mmap.ACCESS_COPY if readonly else mmap.ACCESS_WRITE
+        return cls(mmap.mmap(fileno, 0, access=access), readonly=readonly)
+
+    @property
+    def size(self) -> int:
+        return len(self.buffer)
+
+    def _address(self, offset: int, size: int) -> Any:
+        # Returns an object that can be passed as a `void *`, pointing at
+        # 'offset' in the buffer.
+        if isinstance(self.buffer, bytes):
+            return cast(c_char_p(self.buffer), c_void_p).value + offset  # type: ignore
+        return (c_char * size).from_buffer(self.buffer, offset)
+
+    def _grow(self, size: int) -> bool:
+        if size <= self.size:
+            return True
+        if isinstance(self.buffer, bytearray):
+            self.buffer.extend(bytes(size - self.size))
+            return True
+        if isinstance(self.buffer, mmap.mmap):
+            try:
+                self.buffer.resize(size)
+            except (OSError, SystemError, TypeError):
+                return False
+            return True
+        return False
+
+    ################################################################
+    # ISequentialStream
+
+    def RemoteRead(self, this, pv, cb, pcbRead):
+        if not pv:
+            return STG_E_INVALIDPOINTER
+        count = max(0, min(cb, self.size - self.position))
+        if count:
+            memmove(pv, self._address(self.position, count), count)
+            self.position += count
+        if pcbRead:
+            pcbRead[0] = count
+        return S_OK
+
+    def RemoteWrite(self, this, pv, cb, pcbWritten):
+        if not pv:
+            return STG_E_INVALIDPOINTER
+        if pcbWritten:
+            pcbWritten[0] = 0
+        if self.readonly:
+            return STG_E_ACCESSDENIED
+        end = self.position + cb
+        if not self._grow(end):
+            return STG_E_MEDIUMFULL
+        if cb:
+            memmove(self._address(self.position, cb), pv, cb)
+            self.position = end
+        if pcbWritten:
+            pcbWritten[0] = cb
+        return S_OK
+
+    ################################################################
+    # IStream
+
+    def RemoteSeek(self, this, dlibMove, dwOrigin, plibNewPosition):
+        if dwOrigin == STREAM_SEEK_SET:
+            position = dlibMove
+        elif dwOrigin == STREAM_SEEK_CUR:
+            position = self.position + dlibMove
+        elif dwOrigin == STREAM_SEEK_END:
+            position = self.size + dlibMove
+        else:
+            return STG_E_INVALIDFUNCTION
+        if position < 0:
+            return STG_E_INVALIDFUNCTION
+        self.position = position
+        if plibNewPosition:
+            plibNewPosition[0] = position
+        return S_OK
+
+    def SetSize(self, this, libNewSize):
+        if self.readonly:
+            return STG_E_ACCESSDENIED
+        if libNewSize > self.size:
+            if not self._grow(libNewSize):
+                return STG_E_MEDIUMFULL
+        elif libNewSize < self.size:
+            if isinstance(self.buffer, bytearray):
+                del self.buffer[libNewSize:]
+            else:
+                return STG_E_INVALIDFUNCTION
+        return S_OK
+
+    def RemoteCopyTo(self, this, pstm, cb, pcbRead, pcbWritten):
+        if not pstm:
+            return STG_E_INVALIDPOINTER
+        count = max(0, min(cb, self.size - self.position))
+        written = 0
+        if count:
+            # The destination may be a clone sharing the buffer, which cannot
+            # be resized while it is exported.  So the data is copied through
+            # a temporary buffer, and the buffer is not exported during
+            # `RemoteWrite`.
+            chunk = (c_ubyte * min(count, COPY_CHUNK_SIZE))()
+            offset = self.position
+            end = offset + count
+            while offset < end:
+                size = min(end - offset, len(chunk))
+                memmove(chunk, self._address(offset, size), size)
+                written += pstm.RemoteWrite(chunk, size)
+                offset += size
+            self.position = end
+        if pcbRead:
+            pcbRead[0] = count
+        if pcbWritten:
+            pcbWritten[0] = written
+        return S_OK
+
+    def Commit(self, this, grfCommitFlags):
+        if isinstance(self.buffer, mmap.mmap) and not self.readonly:
+            self.buffer.flush()
+        return S_OK
+
+    def Revert(self, this):
+        # The stream is not transacted, there is nothing to revert.
+        return S_OK
+
+    def LockRegion(self, this, libOffset, cb, dwLockType):
+        return STG_E_INVALIDFUNCTION
+
+    def UnlockRegion(self, this, libOffset, cb, dwLockType):
+        return STG_E_INVALIDFUNCTION
+
+    def Stat(self, this, pstatstg, grfStatFlag):
+        if not pstatstg:
+            return STG_E_INVALIDPOINTER
+        # The stream has no name, so `pwcsName` stays NULL whether or not
+        # `STATFLAG_NONAME` is set.  The times and the clsid are zero, too.
+        memset(pstatstg, 0, sizeof(tagSTATSTG))
+        stat = pstatstg[0]
+        stat.type = STGTY_STREAM
+        stat.cbSize = self.size
+        stat.grfMode = STGM_READ if self.readonly else STGM_READWRITE
+        return S_OK
+
+    def Clone(self, this, ppstm):
+        if not ppstm:
+            return STG_E_INVALIDPOINTER
+        clone = BufferStream(self.buffer, readonly=self.readonly)
+        clone.position = self.position
+        ppstm[0] = clone.QueryInterface(IStream)
+        return S_OK
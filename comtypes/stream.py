@@ -1,11 +1,30 @@
-from ctypes import HRESULT, POINTER, c_ubyte, c_ulong, pointer
-from typing import TYPE_CHECKING
+import io
+from ctypes import (
+    HRESULT,
+    POINTER,
+    Structure,
+    c_char_p,
+    c_longlong,
+    c_ubyte,
+    c_ulong,
+    c_ulonglong,
+    c_wchar_p,
+    cast,
+    pointer,
+)
+from ctypes.wintypes import FILETIME
+from typing import TYPE_CHECKING, Any, Optional
 
 from comtypes import COMMETHOD, GUID, IUnknown
 
 if TYPE_CHECKING:
     from ctypes import Array as _CArrayType
 
+    from comtypes import hints  # type: ignore
+
+# `cb` of `Read` and `Write` is a ULONG, a single call cannot transfer more.
+_MAX_CHUNK = 0x80000000
+
 
 class ISequentialStream(IUnknown):
     """Defines methods for the stream objects in sequence."""
@@ -52,6 +71,43 @@ class ISequentialStream(IUnknown):
         # return both `out` parameters
         return pv, pcb_read.contents.value
 
+    def RemoteReadInto(self, buffer: Any) -> int:
+        """Reads bytes from the stream object directly into the writable
+        'buffer' (a bytearray, memoryview, mmap, ...) and returns the
+        number of bytes read.
+        """
+        view = memoryview(buffer).cast("B")
+        cb = min(view.nbytes, _MAX_CHUNK)
+        if not cb:
+            return 0
+        pv = (c_ubyte * cb).from_buffer(view)
+        pcb_read = pointer(c_ulong(0))
+        self.__com_RemoteRead(pv, c_ulong(cb), pcb_read)  # type: ignore
+        return pcb_read.contents.value
+
+    def RemoteWriteFrom(self, buffer: Any) -> int:
+        """Writes the bytes of 'buffer' into the stream object and returns
+        the number of bytes written.
+
+        The bytes are passed to the stream without an intermediate copy,
+        unless 'buffer' is a read-only object other than `bytes`.
+        """
+        if isinstance(buffer, bytes):
+            cb = min(len(buffer), _MAX_CHUNK)
+            pv = cast(c_char_p(buffer), POINTER(c_ubyte))
+        else:
+            view = memoryview(buffer).cast("B")
+            cb = min(view.nbytes, _MAX_CHUNK)
+            if view.readonly:
+                pv = (c_ubyte * cb).from_buffer_copy(view[:cb])
+            else:
+                pv = (c_ubyte * cb).from_buffer(view)
+        if not cb:
+            return 0
+        pcb_written = pointer(c_ulong(0))
+        self.__com_RemoteWrite(pv, c_ulong(cb), pcb_written)  # type: ignore
+        return pcb_written.contents.value
+
     if TYPE_CHECKING:
 
         def RemoteWrite(self, pv: "_CArrayType[c_ubyte]", cb: int) -> int:
@@ -61,6 +117,178 @@ class ISequentialStream(IUnknown):
             ...
 
 
+STGTY_STREAM = 2
+
+STREAM_SEEK_SET = 0
+STREAM_SEEK_CUR = 1
+STREAM_SEEK_END = 2
+
+STATFLAG_DEFAULT = 0
+STATFLAG_NONAME = 1
+
+
+class tagSTATSTG(Structure):
+    _fields_ = [
+        ("pwcsName", c_wchar_p),
+        ("type", c_ulong),
+        ("cbSize", c_ulonglong),
+        ("mtime", FILETIME),
+        ("ctime", FILETIME),
+        ("atime", FILETIME),
+        ("grfMode", c_ulong),
+        ("grfLocksSupported", c_ulong),
+        ("clsid", GUID),
+        ("grfStateBits", c_ulong),
+        ("reserved", c_ulong),
+    ]
+
+
+STATSTG = tagSTATSTG
+
+
+class IStream(ISequentialStream):
+    """Supports reading and writing data to stream objects.
+
+    The method names are the same as in the wrappers generated from
+    type libraries, like `RemoteSeek` and `RemoteCopyTo`.
+    """
+
+    _iid_ = GUID("{0000000C-0000-0000-C000-000000000046}")
+    _idlflags_ = []
+
+    if TYPE_CHECKING:
+
+        def RemoteSeek(self, dlibMove: int, dwOrigin: int) -> int: ...
+        def SetSize(self, libNewSize: int) -> hints.Hresult: ...
+        def RemoteCopyTo(self, pstm: "IStream", cb: int) -> tuple[int, int]: ...
+        def Commit(self, grfCommitFlags: int) -> hints.Hresult: ...
+        def Revert(self) -> hints.Hresult: ...
+        def LockRegion(
+            self, libOffset: int, cb: int, dwLockType: int
+        ) -> hints.Hresult: ...
+        def UnlockRegion(
+            self, libOffset: int, cb: int, dwLockType: int
+        ) -> hints.Hresult: ...
+        def Stat(self, grfStatFlag: int) -> tagSTATSTG: ...
+        def Clone(self) -> "IStream": ...
+
+
+IStream._methods_ = [
+    COMMETHOD(
+        [],
+        HRESULT,
+        "RemoteSeek",
+        (["in"], c_longlong, "dlibMove"),
+        (["in"], c_ulong, "dwOrigin"),
+        (["out"], POINTER(c_ulonglong), "plibNewPosition"),
+    ),
+    COMMETHOD([], HRESULT, "SetSize", (["in"], c_ulonglong, "libNewSize")),
+    COMMETHOD(
+        [],
+        HRESULT,
+        "RemoteCopyTo",
+        (["in"], POINTER(IStream), "pstm"),
+        (["in"], c_ulonglong, "cb"),
+        (["out"], POINTER(c_ulonglong), "pcbRead"),
+        (["out"], POINTER(c_ulonglong), "pcbWritten"),
+    ),
+    COMMETHOD([], HRESULT, "Commit", (["in"], c_ulong, "grfCommitFlags")),
+    COMMETHOD([], HRESULT, "Revert"),
+    COMMETHOD(
+        [],
+        HRESULT,
+        "LockRegion",
+        (["in"], c_ulonglong, "libOffset"),
+        (["in"], c_ulonglong, "cb"),
+        (["in"], c_ulong, "dwLockType"),
+    ),
+    COMMETHOD(
+        [],
+        HRESULT,
+        "UnlockRegion",
+        (["in"], c_ulonglong, "libOffset"),
+        (["in"], c_ulonglong, "cb"),
+        (["in"], c_ulong, "dwLockType"),
+    ),
+    COMMETHOD(
+        [],
+        HRESULT,
+        "Stat",
+        (["out"], POINTER(tagSTATSTG), "pstatstg"),
+        (["in"], c_ulong, "grfStatFlag"),
+    ),
+    COMMETHOD([], HRESULT, "Clone", (["out"], POINTER(POINTER(IStream)), "ppstm")),
+]
+
+
+class StreamIO(io.RawIOBase):
+    """A raw binary file object on top of an `ISequentialStream`.
+
+    `readinto` reads directly into the caller's buffer, so the object can
+    be wrapped in `io.BufferedReader` and friends without extra copies;
+    see `open_stream`.  If the stream has a `RemoteSeek` method, like
+    `IStream`, the file object is seekable.
+    """
+
+    def __init__(self, stream: ISequentialStream) -> None:
+        self._stream: Optional[ISequentialStream] = stream
+
+    @property
+    def stream(self) -> ISequentialStream:
+        if self._stream is None:
+            raise ValueError("I/O operation on closed stream.")
+        return self._stream
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return hasattr(self.stream, "RemoteSeek")
+
+    def readinto(self, buffer: Any) -> int:
+        return self.stream.RemoteReadInto(buffer)
+
+    def write(self, buffer: Any) -> int:
+        return self.stream.RemoteWriteFrom(buffer)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if not self.seekable():
+            raise io.UnsupportedOperation("seek")
+        # `io.SEEK_SET`, `io.SEEK_CUR` and `io.SEEK_END` have the same values as
+        # `STREAM_SEEK_SET`, `STREAM_SEEK_CUR` and `STREAM_SEEK_END`.
+        return self.stream.RemoteSeek(offset, whence)  # type: ignore
+
+    def tell(self) -> int:
+        return self.seek(0, io.SEEK_CUR)
+
+    def close(self) -> None:
+        # Release the COM pointer.
+        super().close()
+        self._stream = None
+
+
+def open_stream(
+    stream: ISequentialStream, mode: str = "rb", buffer_size: int = 1 << 20
+) -> io.BufferedIOBase:
+    """Return a buffered binary file object for 'stream'.
+
+    'mode' is one of "rb", "wb" or "r+b".  The default 'buffer_size' of
+    1 MiB lets large sequential reads and writes transfer big chunks per
+    COM call.
+    """
+    raw = StreamIO(stream)
+    if mode == "rb":
+        return io.BufferedReader(raw, buffer_size)
+    if mode == "wb":
+        return io.BufferedWriter(raw, buffer_size)
+    if mode == "r+b":
+        return io.BufferedRandom(raw, buffer_size)
+    raise ValueError(f"invalid mode: {mode!r}")
+
+
 # fmt: off
 __known_symbols__ = [
     'ISequentialStream',
@@ -2,7 +2,7 @@ import unittest
 from ctypes import WinDLL
 from ctypes.wintypes import UINT
 
-from comtypes import BSTR
+from comtypes import BSTR, BSTRCache, set_bstr_cache
 from comtypes.test.find_memleak import find_memleak
 
 
@@ -42,5 +42,50 @@ class Test(unittest.TestCase):
         self.check_leaks(doit)
 
 
+class Test_BSTRCache(unittest.TestCase):
+    def test_get(self):
+        cache = BSTRCache(maxsize=2, max_length=10)
+        first = cache.get("Name")
+        self.assertIsInstance(first, BSTR)
+        self.assertEqual(first.value, "Name")  # type: ignore
+        self.assertIs(cache.get("Name"), first)
+        self.assertIsNone(cache.get("x" * 11))
+        self.assertEqual(
+            cache.stats(), {"size": 1, "hits": 1, "allocations": 1, "evictions": 0}
+        )
+
+    def test_lru_eviction(self):
+        cache = BSTRCache(maxsize=2)
+        a = cache.get("a")
+        cache.get("b")
+        self.assertIs(cache.get("a"), a)
+        cache.get("c")  # evicts "b", the least recently used
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get("a"), a)
+        self.assertEqual(cache.evictions, 1)
+        cache.get("b")
+        self.assertEqual(cache.allocations, 4)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        # evicted instances stay valid while referenced.
+        self.assertEqual(a.value, "a")  # type: ignore
+
+    def test_inargs(self):
+        oleaut32 = WinDLL("oleaut32")
+
+        SysStringLen = oleaut32.SysStringLen
+        SysStringLen.argtypes = [BSTR]
+        SysStringLen.restype = UINT
+
+        cache = BSTRCache()
+        previous = set_bstr_cache(cache)
+        self.addCleanup(set_bstr_cache, previous)
+        self.assertEqual(SysStringLen("abc xyz"), 7)
+        self.assertEqual(SysStringLen("abc xyz"), 7)
+        self.assertEqual(
+            cache.stats(), {"size": 1, "hits": 1, "allocations": 1, "evictions": 0}
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
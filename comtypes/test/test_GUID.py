@@ -1,6 +1,22 @@
 import unittest
+from ctypes import byref, c_wchar_p
 
 from comtypes import GUID
+from comtypes.GUID import _CLSIDFromString, _CoTaskMemFree, _StringFromCLSID
+
+
+def _ole_str(guid: GUID) -> str:
+    p = c_wchar_p()
+    _StringFromCLSID(byref(guid), byref(p))
+    result = p.value
+    _CoTaskMemFree(p)
+    return result  # type: ignore
+
+
+def _ole_guid(text: str) -> GUID:
+    guid = GUID()
+    _CLSIDFromString(text, byref(guid))
+    return guid
 
 
 class Test(unittest.TestCase):
@@ -29,9 +45,34 @@ class Test(unittest.TestCase):
             'GUID("{0002DF01-0000-0000-C000-000000000046}")',
         )
 
+    def test_dunder_str_is_same_as_StringFromCLSID(self):
+        for _ in range(100):
+            guid = GUID.create_new()
+            self.assertEqual(str(guid), _ole_str(guid))
+        self.assertEqual(str(GUID()), _ole_str(GUID()))
+
+    def test_constructor_is_same_as_CLSIDFromString(self):
+        for _ in range(100):
+            text = str(GUID.create_new())
+            self.assertEqual(bytes(GUID(text)), bytes(_ole_guid(text)))
+            self.assertEqual(bytes(GUID(text.lower())), bytes(_ole_guid(text)))
+
+    def test_constructor_takes_progid(self):
+        self.assertEqual(
+            GUID("Scripting.FileSystemObject"),
+            GUID("{0D43FE01-F093-11CF-8940-00A0C9054228}"),
+        )
+
+    def test_dunder_hash(self):
+        guid = GUID("{0002DF01-0000-0000-C000-000000000046}")
+        self.assertEqual(hash(guid), hash(guid.copy()))
+        self.assertEqual(len({guid, guid.copy()}), 1)
+
     def test_invalid_constructor_arg(self):
         with self.assertRaises(WindowsError):
             GUID("abc")
+        with self.assertRaises(WindowsError):
+            GUID("{0002DF01-0000-0000-C000-00000000004}")
 
     def test_from_progid(self):
         self.assertEqual(
@@ -1,6 +1,9 @@
 import contextlib
 import unittest
+from ctypes import HRESULT, POINTER, c_int
 
+from comtypes import COMMETHOD, GUID, IUnknown
+from comtypes._post_coinit._case_alias import CaseAlias
 from comtypes.client import GetModule
 
 with contextlib.redirect_stdout(None):  # supress warnings
@@ -28,5 +31,70 @@ class TestCase(unittest.TestCase):
             self.assertIn(name, msvidctl.IMSVidPlayback.__map_case__)
 
 
+class ICaseInsensitive(IUnknown):
+    _case_insensitive_ = True
+    _iid_ = GUID.create_new()
+    _methods_ = [
+        COMMETHOD([], HRESULT, "DoSomething"),
+        COMMETHOD(
+            ["propget"],
+            HRESULT,
+            "Value",
+            (["out", "retval"], POINTER(c_int), "pVal"),
+        ),
+    ]
+
+
+class Test_CaseAlias(unittest.TestCase):
+    def test_lower_case_aliases(self):
+        ptr_type = POINTER(ICaseInsensitive)
+        self.assertIsInstance(vars(ptr_type)["dosomething"], CaseAlias)
+        self.assertIsInstance(vars(ptr_type)["value"], CaseAlias)
+        self.assertIs(ptr_type.value, ptr_type.Value)
+        self.assertNotIn("DoSomething", vars(ptr_type))
+        p = ptr_type()
+        self.assertEqual(p.dosomething, p.DoSomething)
+
+    def test_other_spellings(self):
+        ptr_type = POINTER(ICaseInsensitive)
+        p = ptr_type()
+        self.assertNotIn("DOSOMETHING", vars(ptr_type))
+        self.assertEqual(p.DOSOMETHING, p.DoSomething)
+        self.assertIsInstance(vars(ptr_type)["DOSOMETHING"], CaseAlias)
+        with self.assertRaises(AttributeError):
+            p.NoSuchMember
+
+    def test_setattr(self):
+        p = POINTER(ICaseInsensitive)()
+        p.spam = 42
+        self.assertEqual(p.spam, 42)
+        self.assertEqual(p.__dict__["spam"], 42)
+        p.dosomething = "ham"
+        # assignments through an alias use the original spelling
+        self.assertEqual(p.__dict__["DoSomething"], "ham")
+        self.assertEqual(p.DoSomething, "ham")
+
+    def test_alias_overrides_ctypes_attribute(self):
+        # `value` is the alias of the COM property `Value`, not the value
+        # of the pointer inherited from ctypes.
+        p = POINTER(ICaseInsensitive)()
+        with self.assertRaises(AttributeError):
+            p.value = 42  # `Value` is read-only
+        self.assertFalse(p)
+        self.assertNotIn("value", p.__dict__)
+
+    def test_setattr_other_spellings(self):
+        ptr_type = POINTER(ICaseInsensitive)
+        p = ptr_type()
+        self.assertNotIn("DOSOMETHING", vars(ptr_type))
+        p.DOSOMETHING = "ham"
+        self.assertEqual(p.__dict__["DoSomething"], "ham")
+        self.assertNotIn("DOSOMETHING", p.__dict__)
+        self.assertIsInstance(vars(ptr_type)["DOSOMETHING"], CaseAlias)
+        p.doSomething = "spam"
+        self.assertEqual(p.__dict__["DoSomething"], "spam")
+        self.assertNotIn("doSomething", p.__dict__)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -62,3 +62,40 @@ class Test_CreateInstance(ut.TestCase):
         with self.assertRaises(OSError) as cm:
             CoGetClassObject(GUID.create_new())
         self.assertEqual(cm.exception.winerror, REGDB_E_CLASSNOTREG)
+
+
+class Test_ClassFactoryCache(ut.TestCase):
+    def test_reuses_class_factory(self):
+        with comtypes.client.ClassFactoryCache() as cache:
+            shlnk1 = cache.CreateObject(
+                CLSID_ShellLink, interface=shelllink.IShellLinkW
+            )
+            shlnk2 = cache.CreateObject(
+                CLSID_ShellLink, interface=shelllink.IShellLinkW
+            )
+            self.assertEqual(len(cache), 1)
+            self.assertIn((CLSID_ShellLink, None, None), cache)
+            self.assertIsInstance(shlnk1, shelllink.IShellLinkW)
+            self.assertIsInstance(shlnk2, shelllink.IShellLinkW)
+            self.assertNotEqual(shlnk1, shlnk2)
+            shlnk1.SetDescription("sample")
+            self.assertEqual(shlnk1.GetDescription(), "sample")
+            self.assertEqual(shlnk2.GetDescription(), "")
+        self.assertEqual(len(cache), 0)
+
+    def test_returns_best_interface(self):
+        with comtypes.client.ClassFactoryCache(lock_server=True) as cache:
+            dic = cache.CreateObject("Scripting.Dictionary")
+            dic.Item["key"] = "value"
+            self.assertEqual(dic.Item["key"], "value")
+            factory = cache.GetClassObject("Scripting.Dictionary")
+            self.assertIsInstance(factory, IClassFactory)
+            self.assertEqual(len(cache), 1)
+
+    def test_returns_dynamic_dispatch(self):
+        cache = comtypes.client.ClassFactoryCache()
+        self.addCleanup(cache.release)
+        dic = cache.CreateObject("Scripting.Dictionary", dynamic=True)
+        self.assertIsInstance(dic, comtypes.client.lazybind.Dispatch)
+        with self.assertRaises(ValueError):
+            cache.CreateObject("Scripting.Dictionary", interface=IUnknown, dynamic=True)
@@ -3,9 +3,12 @@ import os
 import sys
 import unittest as ut
 from ctypes import POINTER, byref
+from unittest import mock
 
 import comtypes.client
 from comtypes import CLSCTX_INPROC_SERVER, COSERVERINFO
+from comtypes.client import _managing
+from comtypes.typeinfo import TKIND_ENUM, TKIND_MODULE
 
 # create the typelib wrapper and import it
 comtypes.client.GetModule("scrrun.dll")
@@ -228,6 +231,39 @@ class Test_CreateObject(ut.TestCase):
             )
 
 
+class Test_GetBestInterface(ut.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(_managing._best_interface_cache, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # `CreateObject` remembers the CLSID on the pointer; with an
+        # explicit interface, it does not call `GetBestInterface` itself.
+        self.punk = comtypes.client.CreateObject(
+            Scripting.Dictionary, interface=comtypes.IUnknown
+        )
+        self.clsid = str(Scripting.Dictionary._reg_clsid_)
+
+    def test_caches_resolved_interface(self):
+        best = comtypes.client.GetBestInterface(self.punk)
+        self.assertIsInstance(best, POINTER(Scripting.IDictionary))
+        cache = _managing._best_interface_cache
+        self.assertIs(cache[self.clsid], Scripting.IDictionary)
+
+    def test_uses_interface_cached_by_clsid(self):
+        _managing._best_interface_cache[self.clsid] = Scripting.IDictionary
+        # Resolving from the type information would import the wrapper.
+        with mock.patch.object(_managing, "GetModule", side_effect=AssertionError):
+            best = comtypes.client.GetBestInterface(self.punk)
+        self.assertIsInstance(best, POINTER(Scripting.IDictionary))
+
+    def test_falls_back_if_cached_interface_is_not_implemented(self):
+        cache = _managing._best_interface_cache
+        cache[self.clsid] = Scripting.IFileSystem
+        best = comtypes.client.GetBestInterface(self.punk)
+        self.assertIsInstance(best, POINTER(Scripting.IDictionary))
+        self.assertIs(cache[self.clsid], Scripting.IDictionary)
+
+
 class Test_CoGetObject(ut.TestCase):
     def test_returns_interface_pointer(self):
         wmi = comtypes.client.CoGetObject(
@@ -296,6 +332,27 @@ class Test_Constants(ut.TestCase):
         self.assertEqual(StandardStreamTypes.StdOut, Scripting.StdOut)
         self.assertEqual(StandardStreamTypes.StdErr, Scripting.StdErr)
 
+    def test_lazy_population(self):
+        consts = comtypes.client.Constants("scrrun.dll")
+        self.assertEqual(consts.TextCompare, Scripting.TextCompare)
+        self.assertEqual(consts.StandardStreamTypes.StdErr, Scripting.StdErr)
+        # Only the enumerations actually looked up have been read.
+        self.assertEqual(len(consts._members), 2)
+        self.assertIs(consts.CompareMethod, consts.enums["CompareMethod"])
+        self.assertEqual(consts.consts["StdErr"], Scripting.StdErr)
+        self.assertIn("StandardStreamTypes", consts.alias)
+        with self.assertRaises(AttributeError):
+            consts.Foo
+
+    def test_last_definition_wins(self):
+        consts = comtypes.client.Constants("scrrun.dll")
+        last = consts._indexes(TKIND_ENUM, TKIND_MODULE)[-1]
+        # Pretend that the last enumeration defines `TextCompare` again.
+        members = dict(consts._get_members_of(last), TextCompare=42)
+        consts._members[last] = members
+        self.assertEqual(consts.TextCompare, 42)
+        self.assertEqual(consts.consts["TextCompare"], 42)
+
     def test_progid(self):
         consts = comtypes.client.Constants("scrrun.dll")
         self.assertEqual(consts.BinaryCompare, Scripting.BinaryCompare)
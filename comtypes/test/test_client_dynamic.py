@@ -1,6 +1,8 @@
 import ctypes
 import unittest as ut
+from unittest import mock
 
+import comtypes
 from comtypes import GUID, COMError, IUnknown, automation, hresult, typeinfo
 from comtypes.client import CreateObject, GetModule, dynamic, lazybind
 
@@ -29,6 +31,57 @@ class Test_Dispatch_Function(ut.TestCase):
         self.assertIs(disp, dynamic.Dispatch(disp))
 
 
+class Test_EarlyBinding(ut.TestCase):
+    def setUp(self):
+        previous = dynamic.set_early_binding(True)
+        self.addCleanup(dynamic.set_early_binding, previous)
+
+    def test_dict(self):
+        orig = CreateObject("Scripting.Dictionary", interface=automation.IDispatch)
+        key = bytes(orig.GetTypeInfo(0).GetTypeAttr().guid)
+        # Hide the interface of the generated module, if any.
+        with mock.patch.dict(comtypes._interface_registry_by_iid):
+            comtypes._interface_registry_by_iid.pop(key, None)
+            d = dynamic.Dispatch(orig)
+            self.assertNotIn(key, comtypes._interface_registry_by_iid)
+        self.assertNotIsInstance(d, lazybind.Dispatch)
+        self.assertIsInstance(d, automation.IDispatch)
+        itf = type(d).__com_interface__
+        self.assertEqual(itf.__name__, "IDictionary")
+        self.assertEqual(itf.__module__, "comtypes.client._bind")
+        d.Add("foo", 1)
+        d.Item["bar"] = "spam"
+        self.assertEqual(d.Count, 2)
+        self.assertEqual(d.count, 2)
+        self.assertEqual(d.Item("foo"), 1)
+        self.assertEqual(d.Item["bar"], "spam")
+        self.assertTrue(d.Exists("foo"))
+        d.Remove("foo")
+        self.assertFalse(d.Exists("foo"))
+        # The interface class is created once per IID.
+        other = CreateObject("Scripting.Dictionary", interface=automation.IDispatch)
+        with mock.patch.dict(comtypes._interface_registry_by_iid):
+            comtypes._interface_registry_by_iid.pop(key, None)
+            self.assertIs(type(dynamic.Dispatch(other)).__com_interface__, itf)
+
+    def test_generated_interface(self):
+        Scripting = GetModule("scrrun.dll")
+        orig = CreateObject("Scripting.Dictionary", interface=automation.IDispatch)
+        d = dynamic.Dispatch(orig)
+        self.assertIs(type(d).__com_interface__, Scripting.IDictionary)
+
+    def test_no_typeinfo(self):
+        orig = CreateObject(
+            "WindowsInstaller.Installer", interface=automation.IDispatch
+        )
+        self.assertIsInstance(dynamic.Dispatch(orig), dynamic._Dispatch)
+
+    def test_disabled(self):
+        dynamic.set_early_binding(False)
+        orig = CreateObject("Scripting.Dictionary", interface=automation.IDispatch)
+        self.assertIsInstance(dynamic.Dispatch(orig), lazybind.Dispatch)
+
+
 HKCU = 1  # HKEY_CURRENT_USER
 msiInstallStateUnknown = -1
 
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from comtypes import typeinfo
+from comtypes.tools import tlbparser
+from comtypes.tools.codegenerator import CodeGenerator, FragmentCache, version
+
+
+def _parse_scrrun():
+    tlib = typeinfo.LoadTypeLib("scrrun.dll")
+    return tlbparser.TypeLibParser(tlib).parse()
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.items = _parse_scrrun()
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "scrrun.fragments.json")
+
+    def _generate(self, fragments):
+        codegen = CodeGenerator(fragments=fragments)
+        return codegen.generate_wrapper_code(self.items.values(), "scrrun.dll")
+
+    def test_reuse(self):
+        expected = self._generate(None)
+        first = FragmentCache(self.path, version=version)
+        self.assertEqual(self._generate(first), expected)
+        self.assertEqual(first.hits, 0)
+        self.assertGreater(first.misses, 0)
+        first.save()
+        second = FragmentCache(self.path, version=version)
+        self.assertEqual(self._generate(second), expected)
+        self.assertEqual(second.hits, first.misses)
+        self.assertEqual(second.misses, 0)
+
+    def test_changed_fingerprint(self):
+        fragments = FragmentCache(self.path, version=version)
+        self._generate(fragments)
+        fragments.save()
+        fragments = FragmentCache(self.path, version=version)
+        key = next(iter(fragments._loaded))
+        fp, fragment = fragments._loaded[key]
+        self.assertIsNone(fragments.lookup(key, "0" * len(fp)))
+        self.assertEqual(fragments.lookup(key, fp), fragment)
+        self.assertEqual((fragments.hits, fragments.misses), (1, 1))
+
+    def test_other_version(self):
+        fragments = FragmentCache(self.path, version=version)
+        self._generate(fragments)
+        fragments.save()
+        fragments = FragmentCache(self.path, version="other")
+        self._generate(fragments)
+        self.assertEqual(fragments.hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
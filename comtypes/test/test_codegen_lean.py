@@ -0,0 +1,73 @@
+import io
+import re
+import sys
+import unittest
+from unittest import mock
+
+import comtypes
+from comtypes import typeinfo
+from comtypes.client import GetModule, set_lean_modules
+from comtypes.client._generate import _get_known_namespaces
+from comtypes.tools import codegenerator, tlbparser
+from comtypes.tools.codegenerator import CodeGenerator
+
+
+def _generate_code(lean: bool) -> str:
+    tlib = typeinfo.LoadTypeLib("scrrun.dll")
+    items = tlbparser.TypeLibParser(tlib).parse()
+    codegen = CodeGenerator(*_get_known_namespaces(), lean=lean)
+    codegen.generate_wrapper(list(items.values()), "scrrun.dll")
+    output = io.StringIO()
+    codegen.write_wrapper_code(output)
+    return output.getvalue()
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.full = _generate_code(lean=False)
+        cls.lean = _generate_code(lean=True)
+
+    def test_no_help_text(self):
+        self.assertIn("helpstring(", self.full)
+        self.assertIn('"""', self.full)
+        self.assertNotIn("helpstring(", self.lean)
+        self.assertNotIn('"""', self.lean)
+        self.assertLess(len(self.lean), len(self.full))
+
+    def test_same_members(self):
+        self.assertEqual(self.full.count("COMMETHOD("), self.lean.count("COMMETHOD("))
+        self.assertIn("IDictionary._methods_ = [", self.lean)
+
+    def test_module_names(self):
+        tlib = typeinfo.LoadTypeLib("scrrun.dll")
+        full = codegenerator.name_wrapper_module(tlib)
+        self.assertEqual(
+            codegenerator.name_wrapper_module(tlib, lean=True), f"{full}_lean"
+        )
+        self.assertEqual(
+            codegenerator.name_friendly_module(tlib, lean=True),
+            "comtypes.gen.Scripting_lean",
+        )
+        # Other typelibs are imported in their lean modules, too.
+        for name in re.findall(r"comtypes\.gen\.(_\w+)", self.lean):
+            self.assertTrue(name.endswith("_lean"), name)
+
+    def test_get_module(self):
+        full = GetModule("scrrun.dll")
+        with mock.patch.dict(sys.modules):
+            with mock.patch.dict(comtypes._interface_registry_by_iid):
+                with mock.patch.dict(comtypes._coclass_registry_by_clsid):
+                    previous = set_lean_modules(True)
+                    try:
+                        lean = GetModule("scrrun.dll")
+                    finally:
+                        set_lean_modules(previous)
+                    self.assertEqual(lean.__name__, "comtypes.gen.Scripting_lean")
+                    self.assertIsNot(lean.IDictionary, full.IDictionary)
+                    # The full module is still in use.
+                    self.assertIs(GetModule("scrrun.dll"), full)
+
+
+if __name__ == "__main__":
+    unittest.main()
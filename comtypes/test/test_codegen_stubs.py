@@ -0,0 +1,55 @@
+import io
+import unittest
+
+from comtypes import typeinfo
+from comtypes.client._generate import _get_known_namespaces
+from comtypes.tools import tlbparser
+from comtypes.tools.codegenerator import CodeGenerator
+
+
+def _generate(stubs: bool) -> CodeGenerator:
+    tlib = typeinfo.LoadTypeLib("scrrun.dll")
+    items = tlbparser.TypeLibParser(tlib).parse()
+    codegen = CodeGenerator(*_get_known_namespaces(), stubs=stubs)
+    codegen.generate_wrapper(list(items.values()), "scrrun.dll")
+    return codegen
+
+
+def _getvalue(write) -> str:
+    output = io.StringIO()
+    write(output)
+    return output.getvalue()
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        codegen = _generate(stubs=True)
+        cls.code = _getvalue(codegen.write_wrapper_code)
+        cls.stub = _getvalue(codegen.write_stub_code)
+        cls.inline = _getvalue(_generate(stubs=False).write_wrapper_code)
+
+    def test_annotations_in_stub(self):
+        self.assertIn("if TYPE_CHECKING:  # commembers", self.inline)
+        self.assertNotIn("if TYPE_CHECKING:", self.code)
+        self.assertIn("if TYPE_CHECKING:  # commembers", self.stub)
+        self.assertLess(len(self.code), len(self.inline))
+
+    def test_members_in_module(self):
+        self.assertIn("IDictionary._methods_ = [", self.code)
+        self.assertNotIn("._methods_ = [", self.stub)
+        self.assertNotIn("_check_version(", self.stub)
+
+    def test_same_definitions(self):
+        for name in ("class IDictionary(", "class Dictionary(CoClass):"):
+            self.assertIn(name, self.code)
+            self.assertIn(name, self.stub)
+        self.assertIn("__all__ = [", self.stub)
+
+    def test_compiles(self):
+        compile(self.code, "<module>", "exec")
+        compile(self.stub, "<stub>", "exec")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import weakref
 from ctypes import ArgumentError
 
 from comtypes.client import CreateObject
@@ -155,6 +156,37 @@ class TestCollectionInterface(unittest.TestCase):
         with self.assertRaises(TypeError):
             len(self.d.Item)
 
+    def test_bound_named_property(self):
+        item = self.d.Item
+        self.assertIs(item.instance, self.d)
+        self.assertTrue(item.name.endswith(".Item"))
+        self.assertFalse(hasattr(item, "__dict__"))
+        item["foo"] = "bar"
+        self.assertEqual(item["foo"], "bar")
+        self.assertEqual(item("foo"), "bar")
+
+    def test_bound_named_property_lifetime(self):
+        d = self.d
+        d.Item["foo"] = "bar"
+        # The accessor keeps the instance alive while it is used ...
+        item = d.Item
+        ref = weakref.ref(d)
+        self.d = None
+        del d
+        self.assertEqual((item["foo"], item["foo"]), ("bar", "bar"))
+        # ... but does not create a reference cycle with it.
+        del item
+        self.assertIsNone(ref())
+
+    def test_bound_named_property_of_temporary(self):
+        d = self.d
+        d.Item["foo"] = "bar"
+        d.Item["foo"]
+        # Accessors of temporaries are used after the temporary is gone.
+        self.assertEqual(d.QueryInterface(type(d)).Item["foo"], "bar")
+        item = d.QueryInterface(type(d)).Item
+        self.assertEqual((item["foo"], item["foo"]), ("bar", "bar"))
+
     def test_named_property_not_iterable(self):
         with self.assertRaises(TypeError):
             list(self.d.Item)
@@ -0,0 +1,97 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import comtypes
+import comtypes.client
+import comtypes.gen
+from comtypes import typeinfo
+from comtypes.client import _generate
+from comtypes.client._gen_archive import GenArchive
+
+
+class Test_GenArchive(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "gen.sqlite")
+        self.archive = GenArchive(self.path)
+        self.addCleanup(self.archive.close)
+        sys.meta_path.insert(0, self.archive)
+        self.addCleanup(sys.meta_path.remove, self.archive)
+        patcher = mock.patch.dict(sys.modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_import(self):
+        self.archive.store("comtypes.gen._archived", "value = 42\n")
+        self.archive.store(
+            "comtypes.gen.Archived", "from comtypes.gen._archived import *\n"
+        )
+        from comtypes.gen import Archived
+
+        self.assertEqual(Archived.value, 42)
+        self.assertIs(Archived.__spec__.loader, self.archive)
+        self.assertEqual(
+            self.archive.get_source("comtypes.gen._archived"), "value = 42\n"
+        )
+
+    def test_file(self):
+        # Relative typelib paths are resolved against the directory of the
+        # module, so it must be the `comtypes.gen` directory.
+        self.archive.store("comtypes.gen._archived", "")
+        from comtypes.gen import _archived
+
+        gen_path = os.path.abspath(comtypes.gen.__path__[0])
+        self.assertEqual(_archived.__file__, os.path.join(gen_path, "_archived.py"))
+
+    def test_replace(self):
+        self.archive.store("comtypes.gen._archived", "value = 1\n")
+        self.archive.store("comtypes.gen._archived", "value = 2\n")
+        from comtypes.gen import _archived
+
+        self.assertEqual(_archived.value, 2)
+
+    def test_only_gen_modules(self):
+        self.assertIsNone(self.archive.find_spec("comtypes.gen._missing"))
+        self.assertIsNone(self.archive.find_spec("comtypes.client"))
+        self.archive.store("comtypes.gen._archived", "")
+        self.assertIsNone(self.archive.find_spec("comtypes.gen._archived.sub"))
+
+    def test_readonly(self):
+        self.archive.store("comtypes.gen._archived", "value = 42\n")
+        readonly = GenArchive(self.path, readonly=True)
+        self.addCleanup(readonly.close)
+        self.assertIsNotNone(readonly.find_spec("comtypes.gen._archived"))
+        with self.assertRaises(OSError):
+            readonly.store("comtypes.gen._archived", "")
+
+
+class Test_GetModule(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "gen.sqlite")
+
+    def test_generate(self):
+        tlib = typeinfo.LoadTypeLib("scrrun.dll")
+        with mock.patch.dict(sys.modules):
+            with mock.patch.dict(comtypes._coclass_registry_by_clsid):
+                with mock.patch.dict(comtypes._interface_registry_by_iid):
+                    comtypes.client.set_archive_cache(self.path)
+                    try:
+                        mod = _generate.ModuleGenerator(tlib, None).generate()
+                        archive = _generate._archive
+                        self.assertIs(mod.__spec__.loader, archive)
+                        self.assertTrue(hasattr(mod, "IDictionary"))
+                    finally:
+                        self.assertEqual(
+                            comtypes.client.set_archive_cache(None), self.path
+                        )
+        self.assertNotIn(archive, sys.meta_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,7 @@ import comtypes
 from comtypes import GUID, IUnknown
 from comtypes.git import (
     GetInterfaceFromGlobal,
+    ProxyPool,
     RegisterInterfaceInGlobal,
     RevokeInterfaceFromGlobal,
 )
@@ -173,3 +174,108 @@ class Test_ApartmentMarshaling(ut.TestCase):
         # garbage collected if no other references exist, ensuring proper
         # resource management.
         self.assertEqual((pf.AddRef(), pf.Release()), (2, 1))
+
+
+class Test_ProxyPool(ut.TestCase):
+    def setUp(self):
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.tmpdir = Path(td.name)
+        self.imgfile = self.tmpdir / "img.png"
+        self.imgfile.write_bytes(IMG_DATA)
+
+    def test(self):
+        def work(pool: ProxyPool, ck: int, evt: threading.Event, res: Queue) -> None:
+            comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+            try:
+                first = pool.get(ck, interface=IPersistFile)
+                second = pool.get(ck, interface=IPersistFile)
+                res.put((first is second, first.GetCurFile()))
+                pool.release_thread()
+            finally:
+                comtypes.CoUninitialize()
+                evt.set()
+
+        pf = comtypes.CoCreateInstance(CLSID_PaintPicture, interface=IPersistFile)
+        self.assertEqual(CoGetApartmentType()[0], APTTYPE_MAINSTA)
+        pf.Load(str(self.imgfile), STGM_READ)
+        pool = ProxyPool()
+        cookie = pool.register(pf)
+        try:
+            # The proxy is cached until the thread releases it.
+            self.assertIs(
+                pool.get(cookie, interface=IPersistFile),
+                pool.get(cookie, interface=IPersistFile),
+            )
+            pool.release_thread()
+            event = threading.Event()
+            results = Queue(maxsize=1)
+            thread = threading.Thread(target=work, args=(pool, cookie, event, results))
+            thread.start()
+            pump(event)
+            thread.join()
+            is_same, curfile = results.get()
+            self.assertTrue(is_same)
+            self.assertEqual(
+                os.path.normcase(os.path.normpath(self.imgfile)),
+                os.path.normcase(os.path.normpath(curfile)),
+            )
+        finally:
+            pool.revoke(cookie)
+        # All the cached proxies have been released, and the object is no
+        # longer referenced by the GIT.
+        self.assertEqual((pf.AddRef(), pf.Release()), (2, 1))
+
+    def test_released_by_CoUninitialize(self):
+        def work(pool: ProxyPool, ck: int, evt: threading.Event, res: Queue) -> None:
+            comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+            try:
+                pool.get(ck, interface=IPersistFile)
+                res.put(sum(len(c) for c in pool._caches))
+            finally:
+                # No `release_thread()`; `CoUninitialize` releases the proxies.
+                comtypes.CoUninitialize()
+                res.put(sum(len(c) for c in pool._caches))
+                evt.set()
+
+        pf = comtypes.CoCreateInstance(CLSID_PaintPicture, interface=IPersistFile)
+        pf.Load(str(self.imgfile), STGM_READ)
+        pool = ProxyPool()
+        cookie = pool.register(pf)
+        try:
+            event = threading.Event()
+            results = Queue()
+            thread = threading.Thread(target=work, args=(pool, cookie, event, results))
+            thread.start()
+            pump(event)
+            thread.join()
+            self.assertEqual((results.get(), results.get()), (1, 0))
+        finally:
+            pool.revoke(cookie)
+        self.assertEqual((pf.AddRef(), pf.Release()), (2, 1))
+
+    def test_revoke_from_other_thread(self):
+        def work(pool: ProxyPool, ck: int, evt: threading.Event) -> None:
+            comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+            try:
+                pool.revoke(ck)
+            finally:
+                comtypes.CoUninitialize()
+                evt.set()
+
+        pf = comtypes.CoCreateInstance(CLSID_PaintPicture, interface=IPersistFile)
+        pf.Load(str(self.imgfile), STGM_READ)
+        pool = ProxyPool()
+        cookie = pool.register(pf)
+        pool.get(cookie, interface=IPersistFile)
+        event = threading.Event()
+        thread = threading.Thread(target=work, args=(pool, cookie, event))
+        thread.start()
+        pump(event)
+        thread.join()
+        # The proxy of this thread is marked, and released on the next use
+        # of the pool from this thread.
+        self.assertEqual(pool._local.proxies.revoked, {cookie})
+        pool.release_thread()
+        self.assertEqual(pool._local.proxies, {})
+        self.assertEqual((pf.AddRef(), pf.Release()), (2, 1))
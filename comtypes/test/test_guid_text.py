@@ -0,0 +1,93 @@
+import importlib.util
+import os
+import struct
+import unittest
+
+
+def _load_guid_text():
+    # Loaded from its file instead of imported, so that this test also runs
+    # as a script where the `comtypes` package cannot be imported.
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "_guid_text.py")
+    spec = importlib.util.spec_from_file_location("_guid_text", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_guid_text = _load_guid_text()
+_format_guid = _guid_text._format_guid
+_parse_guid = _guid_text._parse_guid
+
+# IDispatch, and a GUID whose fields are all different, with their bytes.
+IID_IDispatch = "{00020400-0000-0000-C000-000000000046}"
+IID_IDispatch_BYTES = bytes.fromhex("0004020000000000C000000000000046")
+MIXED = "{01234567-89AB-CDEF-0123-456789ABCDEF}"
+MIXED_BYTES = bytes.fromhex("67452301AB89EFCD0123456789ABCDEF")
+
+
+class Test_format_guid(unittest.TestCase):
+    def test_known_vectors(self):
+        self.assertEqual(_format_guid(IID_IDispatch_BYTES), IID_IDispatch)
+        self.assertEqual(_format_guid(MIXED_BYTES), MIXED)
+        self.assertEqual(
+            _format_guid(bytes(16)), "{00000000-0000-0000-0000-000000000000}"
+        )
+
+    def test_upper_case(self):
+        text = _format_guid(bytes(range(0xF0, 0x100)))
+        self.assertEqual(text, "{F3F2F1F0-F5F4-F7F6-F8F9-FAFBFCFDFEFF}")
+
+    def test_wrong_length(self):
+        with self.assertRaises(struct.error):
+            _format_guid(b"\0" * 4)
+
+
+class Test_parse_guid(unittest.TestCase):
+    def test_known_vectors(self):
+        self.assertEqual(_parse_guid(IID_IDispatch), IID_IDispatch_BYTES)
+        self.assertEqual(_parse_guid(MIXED), MIXED_BYTES)
+
+    def test_byte_order(self):
+        # Data1, Data2 and Data3 are little-endian, Data4 is a byte array.
+        data = _parse_guid(MIXED)
+        self.assertEqual(data[:4], bytes.fromhex("67452301"))
+        self.assertEqual(data[4:6], bytes.fromhex("AB89"))
+        self.assertEqual(data[6:8], bytes.fromhex("EFCD"))
+        self.assertEqual(data[8:], bytes.fromhex("0123456789ABCDEF"))
+
+    def test_case_insensitive(self):
+        self.assertEqual(_parse_guid(MIXED.lower()), MIXED_BYTES)
+        self.assertEqual(
+            _parse_guid("{01234567-89ab-CDEF-0123-456789abcdef}"), MIXED_BYTES
+        )
+
+    def test_round_trip(self):
+        for text in (IID_IDispatch, MIXED):
+            self.assertEqual(_format_guid(_parse_guid(text)), text)
+        self.assertEqual(_format_guid(_parse_guid(MIXED.lower())), MIXED)
+
+    def test_braces_required(self):
+        # Left to `CLSIDFromString`, which rejects them.
+        self.assertIsNone(_parse_guid(MIXED[1:-1]))
+        self.assertIsNone(_parse_guid(MIXED[:-1]))
+        self.assertIsNone(_parse_guid(MIXED[1:]))
+
+    def test_malformed(self):
+        for text in (
+            "",
+            "abc",
+            "Scripting.FileSystemObject",
+            "{01234567-89AB-CDEF-0123-456789ABCDE}",
+            "{01234567-89AB-CDEF-0123-456789ABCDEF0}",
+            "{0123456789AB-CDEF-0123-456789ABCDEF}",
+            "{01234567-89AB-CDEF-0123-456789ABCDEG}",
+            " {01234567-89AB-CDEF-0123-456789ABCDEF}",
+            "{01234567-89AB-CDEF-0123-456789ABCDEF}\n",
+            "{+1234567-89AB-CDEF-0123-456789ABCDEF}",
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(_parse_guid(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import types
+import unittest
+from unittest import mock
+
+import comtypes.client
+from comtypes import _member_tables, typeinfo
+from comtypes.client._generate import _get_known_namespaces
+from comtypes.tools import tlbparser
+from comtypes.tools.codegenerator import CodeGenerator
+
+comtypes.client.GetModule("scrrun.dll")
+from comtypes.gen import Scripting  # noqa
+
+SCRRUN_WRAPPER = Scripting.__wrapper_module__
+
+
+def _generate_table_module() -> types.ModuleType:
+    tlib = typeinfo.LoadTypeLib("scrrun.dll")
+    items = tlbparser.TypeLibParser(tlib).parse()
+    codegen = CodeGenerator(*_get_known_namespaces(), member_tables=True)
+    code = codegen.generate_wrapper_code(list(items.values()), "scrrun.dll")
+    mod = types.ModuleType("scrrun_table")
+    # Keep the classes of the `Scripting` module registered.
+    with mock.patch.dict(comtypes._coclass_registry_by_clsid):
+        with mock.patch.dict(comtypes._interface_registry_by_iid):
+            exec(code, mod.__dict__)
+    return mod
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mod = _generate_table_module()
+
+    def test_same_members(self):
+        for name in ("IDictionary", "IFileSystem", "IFileSystem3", "ITextStream"):
+            with self.subTest(name=name):
+                expected = getattr(SCRRUN_WRAPPER, name)._methods_
+                actual = getattr(self.mod, name)._methods_
+                self.assertEqual(
+                    [(m.name, m.idlflags, m.paramflags, m.doc) for m in actual],
+                    [(m.name, m.idlflags, m.paramflags, m.doc) for m in expected],
+                )
+
+    def test_same_constants(self):
+        self.assertEqual(self.mod.TemporaryFolder, SCRRUN_WRAPPER.TemporaryFolder)
+        self.assertEqual(self.mod.ForAppending, SCRRUN_WRAPPER.ForAppending)
+        self.assertIs(self.mod.CompareMethod, SCRRUN_WRAPPER.CompareMethod)
+
+    def test_call(self):
+        d = comtypes.client.CreateObject(
+            "Scripting.Dictionary", interface=self.mod.IDictionary
+        )
+        d.Add("spam", 42)
+        self.assertEqual(d.Item("spam"), 42)
+        self.assertEqual(d.Count, 1)
+
+    def test_wrong_format(self):
+        data = _member_tables.dumps((_member_tables.FORMAT_VERSION + 1, (), ()))
+        with self.assertRaises(ImportError):
+            _member_tables._build_members({}, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@ import functools
 import importlib
 import inspect
 import unittest
-from ctypes import POINTER, c_double, c_long, c_longlong, pointer
+from ctypes import POINTER, Structure, c_double, c_long, c_longlong, pointer, sizeof
 from decimal import Decimal
 
 import comtypes._npsupport
@@ -143,20 +143,26 @@ class NumpySupportTestCase(unittest.TestCase):
         arr = get_ndarray(sa)
 
         self.assertTrue(isinstance(arr, numpy.ndarray))
-        # The conversion code allows numpy to choose the dtype of
-        # structured data.  This dtype is structured under numpy 1.5, 1.7 and
-        # 1.8, and object in 1.6. Instead of assuming either of these, check
-        # the array contents based on the chosen type.
-        if arr.dtype is numpy.dtype(object):
-            data = [(x.red, x.green, x.blue) for x in arr]
-        else:
-            float_dtype = numpy.dtype("float64")
-            self.assertIs(arr.dtype[0], float_dtype)
-            self.assertIs(arr.dtype[1], float_dtype)
-            self.assertIs(arr.dtype[2], float_dtype)
-            data = [tuple(x) for x in arr]
+        # Records made of plain numbers are returned as structured arrays.
+        self.assertEqual(arr.dtype.names, ("red", "green", "blue"))
+        data = [tuple(x) for x in arr]
         self.assertEqual(data, [(0.0, 0.0, 0.0), (1.0, 2.0, 3.0)])
 
+    def test_structure_dtype(self):
+        comtypes.npsupport.enable()
+
+        class POINT(Structure):
+            _fields_ = [("x", c_long), ("y", c_double), ("z", c_long * 3)]
+
+        class NAMED_POINT(Structure):
+            _fields_ = [("name", BSTR), ("point", POINT)]
+
+        dtype = comtypes.npsupport.structure_dtype(POINT)
+        self.assertEqual(dtype.names, ("x", "y", "z"))
+        self.assertEqual(dtype.itemsize, sizeof(POINT))
+        self.assertEqual(dtype.fields["y"][1], POINT.y.offset)
+        self.assertIsNone(comtypes.npsupport.structure_dtype(NAMED_POINT))
+
     def test_VT_BOOL_ndarray(self):
         t = _midlSAFEARRAY(VARIANT_BOOL)
 
@@ -0,0 +1,93 @@
+import unittest
+import weakref
+from _ctypes import COMError
+from ctypes import POINTER, byref
+
+import comtypes.client
+from comtypes import (
+    GUID,
+    IUnknown,
+    QueryInterfaceCache,
+    set_query_interface_cache,
+)
+from comtypes.automation import IDispatch
+from comtypes.hresult import E_NOINTERFACE
+
+
+class INotImplemented(IUnknown):
+    _iid_ = GUID("{D6B4C4C4-4E2B-4A7C-9A5F-0E3C1A3B7F21}")
+    _methods_ = []
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.cache = QueryInterfaceCache()
+        previous = set_query_interface_cache(self.cache)
+        self.addCleanup(set_query_interface_cache, previous)
+        self.d = comtypes.client.CreateObject("Scripting.Dictionary")
+
+    def test_hits(self):
+        disp = self.d.QueryInterface(IDispatch)
+        self.assertIs(self.d.QueryInterface(IDispatch), disp)
+        self.assertEqual(
+            self.cache.stats(),
+            {"hits": 1, "failure_hits": 0, "misses": 1, "invalidations": 0},
+        )
+
+    def test_weak_results(self):
+        # The cache holds no reference to the pointers it returns.
+        disp = self.d.QueryInterface(IDispatch)
+        ref = weakref.ref(disp)
+        del disp
+        self.assertIsNone(ref())
+        self.d.QueryInterface(IDispatch)
+        self.assertEqual(self.cache.stats()["misses"], 2)
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+    def test_identity(self):
+        punk = self.d.QueryInterface(IUnknown)
+        other = self.d.QueryInterface(IDispatch).QueryInterface(IUnknown)
+        self.assertEqual(punk, other)
+
+    def test_failure(self):
+        for _ in range(2):
+            with self.assertRaises(COMError) as cm:
+                self.d.QueryInterface(INotImplemented)
+            self.assertEqual(cm.exception.hresult, E_NOINTERFACE)
+        self.assertEqual(self.cache.stats()["failure_hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_no_failure_caching(self):
+        self.cache.cache_failures = False
+        for _ in range(2):
+            with self.assertRaises(COMError):
+                self.d.QueryInterface(INotImplemented)
+        self.assertEqual(self.cache.stats()["failure_hits"], 0)
+        self.assertEqual(self.cache.stats()["misses"], 2)
+
+    def test_reused_pointer(self):
+        punk = POINTER(IUnknown)()
+        self.d._IUnknown__com_QueryInterface(byref(IUnknown._iid_), byref(punk))
+        disp = punk.QueryInterface(IDispatch)
+        # Let `punk` refer to another object, like an [out] parameter does.
+        other = comtypes.client.CreateObject("Scripting.Dictionary")
+        punk.Release()
+        other._IUnknown__com_QueryInterface(byref(IUnknown._iid_), byref(punk))
+        self.assertNotEqual(punk.QueryInterface(IDispatch), disp)
+        self.assertEqual(self.cache.stats()["invalidations"], 1)
+
+    def test_invalidate(self):
+        disp = self.d.QueryInterface(IDispatch)
+        self.cache.invalidate(self.d)
+        self.assertIsNot(self.d.QueryInterface(IDispatch), disp)
+        self.assertEqual(self.cache.stats()["invalidations"], 1)
+
+    def test_disabled(self):
+        set_query_interface_cache(None)
+        disp = self.d.QueryInterface(IDispatch)
+        self.assertIsNot(self.d.QueryInterface(IDispatch), disp)
+        self.assertEqual(self.cache.stats()["misses"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
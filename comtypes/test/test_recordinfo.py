@@ -1,7 +1,7 @@
 import unittest
 from ctypes import byref, pointer, sizeof
 
-from comtypes import typeinfo
+from comtypes import GUID, typeinfo
 from comtypes.client import GetModule
 
 ComtypesCppTestSrvLib_GUID = "{07D2AEE5-1DF8-4D2C-953A-554ADFD25F99}"
@@ -75,3 +75,25 @@ class Test_IRecordInfo(unittest.TestCase):
         self.assertEqual(dst_rec.question, "foo")
         self.assertEqual(dst_rec.answer, 3)
         self.assertEqual(dst_rec.needs_clarification, True)
+
+
+@unittest.skipIf(IMPORT_FAILED, "This depends on the out of process COM-server.")
+class Test_VARIANT_RecordCache(unittest.TestCase):
+    def test_round_trip(self):
+        from comtypes import automation
+
+        v = automation.VARIANT(_create_record("foo", 3, True))
+        self.assertEqual(v.vt, automation.VT_RECORD)
+        ri = automation._record_info_cache[StructRecordParamTest._recordinfo_]
+        self.assertIs(automation._get_record_info(StructRecordParamTest), ri)
+        *_, guid = StructRecordParamTest._recordinfo_
+        self.assertIs(
+            automation._record_type_cache[GUID(guid)],
+            StructRecordParamTest,
+        )
+        for _ in range(2):
+            rec = v.value
+            self.assertIsInstance(rec, StructRecordParamTest)
+            self.assertEqual(rec.question, "foo")
+            self.assertEqual(rec.answer, 3)
+            self.assertEqual(rec.needs_clarification, True)
@@ -0,0 +1,58 @@
+import unittest as ut
+
+import comtypes
+from comtypes import GUID, IUnknown, shelllink
+from comtypes._registry import GUIDStringKeyedView
+from comtypes.automation import IDispatch
+
+
+class Test_InterfaceRegistry(ut.TestCase):
+    def test_binary_keys(self):
+        self.assertIs(
+            comtypes._interface_registry_by_iid[bytes(IUnknown._iid_)], IUnknown
+        )
+        self.assertIs(
+            comtypes._interface_registry_by_iid[bytes(IDispatch._iid_)], IDispatch
+        )
+
+    def test_string_keys(self):
+        self.assertIs(comtypes.com_interface_registry[str(IUnknown._iid_)], IUnknown)
+        self.assertIs(
+            comtypes.com_interface_registry[str(IDispatch._iid_).lower()], IDispatch
+        )
+        self.assertIn(str(IDispatch._iid_), comtypes.com_interface_registry)
+        self.assertIn(str(IDispatch._iid_), list(comtypes.com_interface_registry))
+        self.assertNotIn(str(GUID.create_new()), comtypes.com_interface_registry)
+        self.assertNotIn("foo", comtypes.com_interface_registry)
+
+
+class Test_CoClassRegistry(ut.TestCase):
+    def test_string_and_binary_keys(self):
+        clsid = shelllink.ShellLink._reg_clsid_
+        self.assertIs(comtypes.com_coclass_registry[str(clsid)], shelllink.ShellLink)
+        self.assertIs(
+            comtypes._coclass_registry_by_clsid[bytes(clsid)], shelllink.ShellLink
+        )
+        self.assertIsNone(comtypes.com_coclass_registry.get(None))  # type: ignore
+
+
+class Test_GUIDStringKeyedView(ut.TestCase):
+    def test_mutable_mapping(self):
+        data = {}
+        view = GUIDStringKeyedView(data)
+        guid = GUID.create_new()
+        view[str(guid)] = 1
+        self.assertEqual(data, {bytes(guid): 1})
+        self.assertEqual(view[str(guid)], 1)
+        self.assertEqual(dict(view), {str(guid): 1})
+        self.assertEqual(len(view), 1)
+        del view[str(guid)]
+        self.assertEqual(data, {})
+        with self.assertRaises(KeyError):
+            view[str(guid)]
+        with self.assertRaises(KeyError):
+            del view[str(guid)]
+
+
+if __name__ == "__main__":
+    ut.main()
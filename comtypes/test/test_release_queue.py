@@ -0,0 +1,100 @@
+import threading
+import unittest
+from ctypes import addressof, c_void_p
+
+import comtypes.client
+from comtypes import ReleaseQueue, flush_release_queue, set_release_queue
+from comtypes.automation import IDispatch
+
+
+class Test_SetReleaseQueue(unittest.TestCase):
+    def setUp(self):
+        self.released = []
+
+        def release(address):
+            self.released.append(address)
+            return default_release(address)
+
+        queue = ReleaseQueue()
+        default_release, queue._release = queue._release, release
+        self.queue = queue
+
+    def test_deferred_release(self):
+        d = comtypes.client.CreateObject("Scripting.Dictionary")
+        previous = set_release_queue(self.queue)
+        self.addCleanup(set_release_queue, previous)
+        disp = d.QueryInterface(IDispatch)
+        address = c_void_p.from_address(addressof(disp)).value
+        del disp
+        self.assertEqual(self.released, [])
+        self.assertEqual(len(self.queue), 1)
+        self.assertEqual(flush_release_queue(), 1)
+        self.assertEqual(self.released, [address])
+        self.assertEqual(len(self.queue), 0)
+
+    def test_other_thread(self):
+        # A pointer dropped by another thread is released in the apartment
+        # it was created in.
+        d = comtypes.client.CreateObject("Scripting.Dictionary")
+        previous = set_release_queue(self.queue)
+        self.addCleanup(set_release_queue, previous)
+
+        flushed = []
+        pointers = [d.QueryInterface(IDispatch)]
+
+        def func():
+            comtypes.CoInitialize()
+            try:
+                del pointers[:]
+                flushed.append(flush_release_queue())
+            finally:
+                comtypes.CoUninitialize()
+
+        thread = threading.Thread(target=func)
+        thread.start()
+        thread.join()
+        self.assertEqual(flushed, [0])
+        self.assertEqual(self.released, [])
+        self.assertEqual(flush_release_queue(), 1)
+
+    def test_uninitialize(self):
+        # The queue of an apartment is flushed before it is uninitialized.
+        previous = set_release_queue(self.queue)
+        self.addCleanup(set_release_queue, previous)
+
+        depths = []
+
+        def func():
+            comtypes.CoInitialize()
+            try:
+                d = comtypes.client.CreateObject("Scripting.Dictionary")
+                del d
+                depths.append(len(self.queue))
+            finally:
+                comtypes.CoUninitialize()
+            depths.append(len(self.queue))
+
+        thread = threading.Thread(target=func)
+        thread.start()
+        thread.join()
+        self.assertEqual(depths, [1, 0])
+        self.assertEqual(len(self.released), 1)
+
+    def test_created_before(self):
+        # The apartment of a pointer created without a queue is unknown, so
+        # it is released immediately.
+        d = comtypes.client.CreateObject("Scripting.Dictionary")
+        disp = d.QueryInterface(IDispatch)
+        previous = set_release_queue(self.queue)
+        self.addCleanup(set_release_queue, previous)
+        del disp
+        self.assertEqual(len(self.queue), 0)
+
+    def test_no_queue(self):
+        previous = set_release_queue(None)
+        self.addCleanup(set_release_queue, previous)
+        self.assertEqual(flush_release_queue(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
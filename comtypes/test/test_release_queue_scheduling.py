@@ -0,0 +1,170 @@
+import importlib.util
+import os
+import unittest
+
+
+def _load_release_queue():
+    # The queue does not need the rest of `comtypes`, so it is loaded from
+    # its file and these tests also run as a script off Windows.
+    path = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "_post_coinit", "_release_queue.py"
+    )
+    spec = importlib.util.spec_from_file_location("_release_queue", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ReleaseQueue = _load_release_queue().ReleaseQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Test_ReleaseQueue(unittest.TestCase):
+    def setUp(self):
+        self.released = []
+        self.apartment = "STA-1"
+        self.clock = FakeClock()
+
+    def create_queue(self, **kw):
+        return ReleaseQueue(
+            release=self.released.append,
+            apartment=lambda: self.apartment,
+            clock=self.clock,
+            **kw,
+        )
+
+    def test_defer_and_flush(self):
+        queue = self.create_queue()
+        queue.defer(100)
+        queue.defer(200)
+        self.assertEqual(self.released, [])
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.flush(), 2)
+        self.assertEqual(self.released, [100, 200])
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(queue.flush(), 0)
+
+    def test_apartments(self):
+        queue = self.create_queue()
+        queue.defer(100)
+        self.apartment = "STA-2"
+        queue.defer(200)
+        self.assertEqual(queue.flush(), 1)
+        self.assertEqual(self.released, [200])
+        self.assertEqual(queue.depth, 1)
+        self.apartment = "STA-1"
+        self.assertEqual(queue.flush(), 1)
+        self.assertEqual(self.released, [200, 100])
+
+    def test_defer_to_apartment(self):
+        queue = self.create_queue()
+        queue.defer(100, "STA-2")
+        self.assertEqual(queue.flush(), 0)
+        self.apartment = "STA-2"
+        self.assertEqual(queue.flush(), 1)
+        self.assertEqual(self.released, [100])
+
+    def test_max_depth(self):
+        queue = self.create_queue(max_depth=3)
+        queue.defer(1)
+        queue.defer(2)
+        self.assertEqual(self.released, [])
+        queue.defer(3)
+        self.assertEqual(self.released, [1, 2, 3])
+        self.assertEqual(len(queue), 0)
+
+    def test_max_depth_other_apartment(self):
+        # Pointers of another apartment must not be released here.
+        queue = self.create_queue(max_depth=2)
+        queue.defer(1, "STA-2")
+        queue.defer(2, "STA-2")
+        self.assertEqual(self.released, [])
+        self.apartment = "STA-2"
+        queue.defer(3, "STA-2")
+        self.assertEqual(self.released, [1, 2, 3])
+
+    def test_stats(self):
+        queue = self.create_queue()
+        self.assertEqual(
+            queue.stats(),
+            {
+                "deferred": 0,
+                "released": 0,
+                "depth": 0,
+                "peak_depth": 0,
+                "max_latency": 0.0,
+                "mean_latency": 0.0,
+            },
+        )
+        queue.defer(1)
+        self.clock.now = 1.0
+        queue.defer(2)
+        queue.defer(3)
+        self.clock.now = 3.0
+        queue.flush()
+        self.assertEqual(
+            queue.stats(),
+            {
+                "deferred": 3,
+                "released": 3,
+                "depth": 0,
+                "peak_depth": 3,
+                "max_latency": 3.0,
+                "mean_latency": 7.0 / 3,
+            },
+        )
+
+    def test_clear(self):
+        queue = self.create_queue()
+        queue.defer(1)
+        self.apartment = "STA-2"
+        queue.defer(2)
+        self.assertEqual(queue.clear(), 2)
+        self.assertEqual(queue.flush(), 0)
+        self.assertEqual(self.released, [])
+
+    def test_discard(self):
+        queue = self.create_queue()
+        queue.defer(1)
+        queue.defer(2, "STA-2")
+        self.assertEqual(queue.discard("STA-2"), 1)
+        self.assertEqual(queue.discard("STA-2"), 0)
+        self.assertEqual(queue.flush(), 1)
+        self.assertEqual(self.released, [1])
+
+    def test_release_error(self):
+        def release(address):
+            if address == 2:
+                raise ValueError(address)
+            self.released.append(address)
+
+        queue = ReleaseQueue(release=release, apartment=lambda: self.apartment)
+        for address in (1, 2, 3, 4):
+            queue.defer(address)
+        with self.assertRaises(ValueError):
+            queue.flush()
+        self.assertEqual(self.released, [1])
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.stats()["released"], 1)
+        queue._release = self.released.append
+        self.assertEqual(queue.flush(), 2)
+        self.assertEqual(self.released, [1, 3, 4])
+
+    def test_reentrant_defer(self):
+        # `defer` may be called from a `__del__` that runs while the same
+        # thread already holds the lock.
+        queue = self.create_queue()
+        with queue._lock:
+            queue.defer(1)
+        self.assertEqual(len(queue), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+import os
+import tempfile
+import unittest as ut
+from _ctypes import COMError
+from ctypes import POINTER, c_ubyte, c_ulong, c_ulonglong, pointer
+from unittest import mock
+
+from comtypes import hresult
+from comtypes.server.stream import BufferStream
+from comtypes.stream import (
+    STATFLAG_DEFAULT,
+    STGTY_STREAM,
+    STREAM_SEEK_CUR,
+    STREAM_SEEK_END,
+    STREAM_SEEK_SET,
+    IStream,
+    tagSTATSTG,
+)
+
+
+def _create_buffer_stream(buffer, readonly: bool = False) -> IStream:
+    return BufferStream(buffer, readonly).QueryInterface(IStream)
+
+
+class Test_BufferStream(ut.TestCase):
+    def test_read(self):
+        stream = _create_buffer_stream(b"spam egg bacon ham")
+        buf, read = stream.RemoteRead(9)
+        self.assertEqual(bytes(buf)[:read], b"spam egg ")
+        buf = bytearray(32)
+        self.assertEqual(stream.RemoteReadInto(buf), 9)
+        self.assertEqual(buf[:9], b"bacon ham")
+        self.assertEqual(stream.RemoteReadInto(buf), 0)
+
+    def test_write_grows_bytearray(self):
+        data = bytearray(b"spam")
+        stream = _create_buffer_stream(data)
+        stream.RemoteSeek(0, STREAM_SEEK_END)
+        self.assertEqual(stream.RemoteWriteFrom(b" egg"), 4)
+        self.assertEqual(data, b"spam egg")
+        stream.RemoteSeek(0, STREAM_SEEK_SET)
+        self.assertEqual(stream.RemoteWriteFrom(b"SPAM"), 4)
+        self.assertEqual(data, b"SPAM egg")
+
+    def test_write_to_fixed_size_buffer(self):
+        data = bytearray(b"spam")
+        stream = _create_buffer_stream(memoryview(data))
+        self.assertEqual(stream.RemoteWriteFrom(b"SPAM"), 4)
+        self.assertEqual(data, b"SPAM")
+        with self.assertRaises(COMError) as cm:
+            stream.RemoteWriteFrom(b"!")
+        self.assertEqual(cm.exception.hresult, hresult.STG_E_MEDIUMFULL)
+
+    def test_readonly(self):
+        for stream in (
+            _create_buffer_stream(b"spam"),
+            _create_buffer_stream(bytearray(b"spam"), readonly=True),
+        ):
+            with self.subTest(stream=stream):
+                with self.assertRaises(COMError) as cm:
+                    stream.RemoteWriteFrom(b"egg")
+                self.assertEqual(cm.exception.hresult, hresult.STG_E_ACCESSDENIED)
+                with self.assertRaises(COMError) as cm:
+                    stream.SetSize(0)
+                self.assertEqual(cm.exception.hresult, hresult.STG_E_ACCESSDENIED)
+
+    def test_seek(self):
+        stream = _create_buffer_stream(b"spam egg bacon ham")
+        self.assertEqual(stream.RemoteSeek(5, STREAM_SEEK_SET), 5)
+        self.assertEqual(stream.RemoteSeek(4, STREAM_SEEK_CUR), 9)
+        self.assertEqual(stream.RemoteSeek(-3, STREAM_SEEK_END), 15)
+        with self.assertRaises(COMError) as cm:
+            stream.RemoteSeek(-1, STREAM_SEEK_SET)
+        self.assertEqual(cm.exception.hresult, hresult.STG_E_INVALIDFUNCTION)
+
+    def test_SetSize(self):
+        data = bytearray(b"spam egg")
+        stream = _create_buffer_stream(data)
+        stream.SetSize(4)
+        self.assertEqual(data, b"spam")
+        stream.SetSize(6)
+        self.assertEqual(data, b"spam\x00\x00")
+
+    def test_Stat(self):
+        stat = _create_buffer_stream(bytearray(42)).Stat(STATFLAG_DEFAULT)
+        self.assertIsNone(stat.pwcsName)
+        self.assertEqual(stat.type, STGTY_STREAM)
+        self.assertEqual(stat.cbSize, 42)
+        self.assertEqual(stat.grfMode, 2)  # STGM_READWRITE
+        stat = _create_buffer_stream(b"spam").Stat(STATFLAG_DEFAULT)
+        self.assertEqual(stat.cbSize, 4)
+        self.assertEqual(stat.grfMode, 0)  # STGM_READ
+
+    def test_Clone(self):
+        orig = _create_buffer_stream(b"spam egg bacon ham")
+        orig.RemoteSeek(9, STREAM_SEEK_SET)
+        clone = orig.Clone()
+        self.assertIsInstance(clone, IStream)
+        buf, read = clone.RemoteRead(1024)
+        self.assertEqual(bytes(buf)[:read], b"bacon ham")
+        self.assertEqual(orig.RemoteSeek(0, STREAM_SEEK_CUR), 9)
+
+    def test_RemoteCopyTo(self):
+        src = _create_buffer_stream(b"spam egg bacon ham")
+        data = bytearray()
+        dst = _create_buffer_stream(data)
+        src.RemoteSeek(9, STREAM_SEEK_SET)
+        self.assertEqual(src.RemoteCopyTo(dst, 1024), (9, 9))
+        self.assertEqual(data, b"bacon ham")
+
+    def test_LockRegion(self):
+        stream = _create_buffer_stream(b"spam")
+        with self.assertRaises(COMError) as cm:
+            stream.LockRegion(0, 4, 0)
+        self.assertEqual(cm.exception.hresult, hresult.STG_E_INVALIDFUNCTION)
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as t:
+            path = os.path.join(t, "spam.bin")
+            with open(path, "wb") as f:
+                f.write(b"spam egg bacon ham")
+            with open(path, "rb") as f:
+                obj = BufferStream.from_file(f.fileno())
+            stream = obj.QueryInterface(IStream)
+            pv = (c_ubyte * 8)()
+            self.assertEqual(stream.RemoteReadInto(pv), 8)
+            self.assertEqual(bytes(pv), b"spam egg")
+            self.assertEqual(stream.Stat(STATFLAG_DEFAULT).cbSize, 18)
+            del stream
+            obj.buffer.close()
+
+
+class Test_BufferStream_Methods(ut.TestCase):
+    # The methods are called directly, like the COM runtime calls them, but
+    # without going through `QueryInterface` and the vtable.
+
+    def test_RemoteRead(self):
+        obj = BufferStream(b"spam egg bacon ham")
+        buf = (c_ubyte * 9)()
+        read = c_ulong()
+        self.assertEqual(obj.RemoteRead(None, buf, 9, pointer(read)), hresult.S_OK)
+        self.assertEqual((bytes(buf), read.value), (b"spam egg ", 9))
+        buf = (c_ubyte * 32)()
+        obj.RemoteRead(None, buf, 32, pointer(read))
+        self.assertEqual(bytes(buf)[: read.value], b"bacon ham")
+        obj.RemoteRead(None, buf, 32, pointer(read))
+        self.assertEqual(read.value, 0)
+        self.assertEqual(
+            obj.RemoteRead(None, None, 1, None), hresult.STG_E_INVALIDPOINTER
+        )
+
+    def test_RemoteWrite(self):
+        data = bytearray(b"spam")
+        obj = BufferStream(data)
+        obj.position = 4
+        written = c_ulong()
+        pv = (c_ubyte * 4).from_buffer_copy(b" egg")
+        self.assertEqual(obj.RemoteWrite(None, pv, 4, pointer(written)), hresult.S_OK)
+        self.assertEqual((data, written.value), (b"spam egg", 4))
+        obj = BufferStream(memoryview(data))
+        obj.position = 6
+        hr = obj.RemoteWrite(None, pv, 4, pointer(written))
+        self.assertEqual((hr, written.value), (hresult.STG_E_MEDIUMFULL, 0))
+        hr = BufferStream(b"spam").RemoteWrite(None, pv, 4, pointer(written))
+        self.assertEqual(hr, hresult.STG_E_ACCESSDENIED)
+
+    def test_RemoteSeek(self):
+        obj = BufferStream(b"spam egg bacon ham")
+        pos = c_ulonglong()
+        obj.RemoteSeek(None, -3, STREAM_SEEK_END, pointer(pos))
+        self.assertEqual(pos.value, 15)
+        obj.RemoteSeek(None, -5, STREAM_SEEK_CUR, pointer(pos))
+        self.assertEqual((pos.value, obj.position), (10, 10))
+        hr = obj.RemoteSeek(None, -1, STREAM_SEEK_SET, None)
+        self.assertEqual(hr, hresult.STG_E_INVALIDFUNCTION)
+
+    def test_Stat(self):
+        stat = tagSTATSTG()
+        obj = BufferStream(bytearray(42))
+        self.assertEqual(obj.Stat(None, pointer(stat), STATFLAG_DEFAULT), 0)
+        self.assertEqual((stat.type, stat.cbSize), (STGTY_STREAM, 42))
+
+    def test_RemoteCopyTo_clone(self):
+        # A clone shares the buffer, which must not be exported while the
+        # clone grows it.
+        data = bytearray(b"spam egg ")
+        obj = BufferStream(data)
+        ppstm = pointer(POINTER(IStream)())
+        self.assertEqual(obj.Clone(None, ppstm), hresult.S_OK)
+        clone = ppstm[0]
+        clone.RemoteSeek(0, STREAM_SEEK_END)
+        read, written = c_ulonglong(), c_ulonglong()
+        with mock.patch("comtypes.server.stream.COPY_CHUNK_SIZE", 4):
+            hr = obj.RemoteCopyTo(None, clone, 1024, pointer(read), pointer(written))
+        self.assertEqual(hr, hresult.S_OK)
+        self.assertEqual((read.value, written.value), (9, 9))
+        self.assertEqual(data, b"spam egg spam egg ")
+
+
+if __name__ == "__main__":
+    ut.main()
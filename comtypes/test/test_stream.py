@@ -37,6 +37,7 @@ from typing import Optional
 import comtypes.client
 from comtypes import hresult
 from comtypes.malloc import CoGetMalloc
+from comtypes.stream import StreamIO, open_stream
 from comtypes.test.gdi_helper import BI_RGB, _GdiFlush, create_image_rendering_dc
 
 comtypes.client.GetModule("portabledeviceapi.dll")
@@ -178,6 +179,50 @@ class Test_RemoteSeek(ut.TestCase):
         self.assertEqual(bytearray(buf)[0:read], b"egg bacon ham")
 
 
+class Test_RemoteReadInto_RemoteWriteFrom(ut.TestCase):
+    def test_bytes_and_bytearray(self):
+        stream = _create_stream_on_hglobal()
+        self.assertEqual(stream.RemoteWriteFrom(b"spam egg "), 9)
+        self.assertEqual(stream.RemoteWriteFrom(bytearray(b"bacon ham")), 9)
+        self.assertEqual(stream.RemoteWriteFrom(memoryview(b"")), 0)
+        stream.RemoteSeek(0, STREAM_SEEK_SET)
+        buf = bytearray(12)
+        self.assertEqual(stream.RemoteReadInto(buf), 12)
+        self.assertEqual(buf, b"spam egg bac")
+        view = memoryview(buf)[4:]
+        self.assertEqual(stream.RemoteReadInto(view), 6)
+        self.assertEqual(buf, b"spamon hamac")
+
+
+class Test_StreamIO(ut.TestCase):
+    def test_raw(self):
+        raw = StreamIO(_create_stream_on_hglobal())
+        self.assertTrue(raw.readable())
+        self.assertTrue(raw.writable())
+        self.assertTrue(raw.seekable())
+        self.assertEqual(raw.write(b"spam egg bacon ham"), 18)
+        self.assertEqual(raw.tell(), 18)
+        self.assertEqual(raw.seek(-9, os.SEEK_END), 9)
+        self.assertEqual(raw.read(5), b"bacon")
+        self.assertEqual(raw.readall(), b" ham")
+        self.assertEqual(raw.read(5), b"")
+        raw.close()
+        with self.assertRaises(ValueError):
+            raw.read(1)
+
+    def test_buffered(self):
+        stream = _create_stream_on_hglobal()
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        with open_stream(stream, "wb", buffer_size=1 << 16) as f:
+            f.write(data)
+        stream.RemoteSeek(0, STREAM_SEEK_SET)
+        with open_stream(stream, "rb") as f:
+            self.assertEqual(f.read(17), data[:17])
+            self.assertEqual(f.read(), data[17:])
+        with self.assertRaises(ValueError):
+            open_stream(stream, "w")
+
+
 class Test_SetSize(ut.TestCase):
     def test_SetSize(self):
         stream = _create_stream_on_hglobal()
@@ -3,3 +3,4 @@ from comtypes.tools.codegenerator.modulenamer import (  # noqa
     name_wrapper_module,
 )
 from comtypes.tools.codegenerator.codegenerator import CodeGenerator, version  # noqa
+from comtypes.tools.codegenerator.fragments import FragmentCache  # noqa
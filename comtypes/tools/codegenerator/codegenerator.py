@@ -1,21 +1,23 @@
 # Code generator to generate code for everything contained in COM type
 # libraries.
 import contextlib
+import functools
 import io
 import keyword
 import logging
 import os
 import textwrap
 import warnings
-from collections.abc import Iterator, Sequence
-from typing import Any, Literal, Optional
+from collections.abc import Callable, Iterator, Sequence
+from typing import IO, Any, Literal, Optional
 from typing import Union as _UnionT
 
 import comtypes
-from comtypes import typeinfo
+from comtypes import _member_tables, typeinfo
 from comtypes.tools import tlbparser, typedesc
 from comtypes.tools.codegenerator import heads, namespaces, packing
 from comtypes.tools.codegenerator.comments import ComInterfaceBodyImplCommentWriter
+from comtypes.tools.codegenerator.fragments import Fragment, FragmentCache, fingerprint
 from comtypes.tools.codegenerator.helpers import (
     ASSUME_STRINGS,
     ComMethodGenerator,
@@ -25,6 +27,8 @@ from comtypes.tools.codegenerator.helpers import (
     get_real_type,
 )
 from comtypes.tools.codegenerator.modulenamer import name_wrapper_module
+from comtypes.tools.codegenerator.spool import SpooledCodeWriter
+from comtypes.tools.codegenerator.worklist import Worklist
 
 version = comtypes.__version__
 
@@ -43,45 +47,117 @@ _InterfaceTypeDesc = _UnionT[
 ]
 
 
+class _RequirementRecorder:
+    """Forwards `add` calls to the imports or declarations of a module and
+    records them for a `Fragment`."""
+
+    def __init__(self, kind: str, target: Any, journal: list) -> None:
+        self._kind = kind
+        self._target = target
+        self._journal = journal
+
+    def add(self, *args: Any) -> None:
+        self._journal.append((self._kind, args))
+        self._target.add(*args)
+
+
+class _StreamTee(io.TextIOBase):
+    """Writes to the module and to its stub."""
+
+    def __init__(self, *streams: IO[str]) -> None:
+        super().__init__()
+        self._streams = streams
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        for stream in self._streams:
+            stream.write(s)
+        return len(s)
+
+
 class CodeGenerator:
-    def __init__(self, known_symbols=None, known_interfaces=None) -> None:
-        self.stream = io.StringIO()
+    def __init__(
+        self,
+        known_symbols=None,
+        known_interfaces=None,
+        fragments: Optional[FragmentCache] = None,
+        member_tables: bool = False,
+        stubs: bool = False,
+        lean: bool = False,
+    ) -> None:
+        # The definitions, which make up most of a wrapper module.
+        self.stream = SpooledCodeWriter()
+        # If stubs are generated, the definitions for the `.pyi` file of the
+        # module; then the type annotations of interfaces are written there
+        # instead of to the module.
+        self.stub_stream: Optional[SpooledCodeWriter] = None
+        self._both_streams: IO[str] = self.stream
+        if stubs:
+            self.stub_stream = SpooledCodeWriter()
+            self._both_streams = _StreamTee(self.stream, self.stub_stream)
         self.imports = namespaces.ImportedNamespaces()
         self.declarations = namespaces.DeclaredNamespaces()
         self.enums = namespaces.EnumerationNamespaces()
         self.unnamed_enum_members: list[tuple[str, int]] = []
-        self._to_type_name = TypeNamer()
+        self._to_type_name = TypeNamer(lean)
         self.known_symbols = known_symbols or {}
         self.known_interfaces = known_interfaces or {}
 
         self.done = set()  # type descriptions that have been generated
+        self.more = Worklist()  # and those still to be generated
         self.names = set()  # names that have been generated
         self.externals = []  # typelibs imported to generated module
         self.enum_aliases: dict[str, str] = {}
         self.last_item = "attribute"
+        self.fragments = fragments
+        # In the lean profile, no help text from the typelib is written.
+        self.lean = lean
+        self.docs = not lean
+        # The `_methods_` and `_disp_methods_` of interfaces, if they are
+        # written as a data table, see `comtypes._member_tables`.
+        self.member_table: Optional[list[tuple[str, str, tuple[Any, ...]]]] = (
+            [] if member_tables else None
+        )
+        self.filename: Optional[str] = None
+        self.tlib_mtime: Optional[float] = None
 
     @contextlib.contextmanager
     def adjust_blank(
-        self, item: Literal["assert", "attribute", "class", "comment", "variable"]
-    ) -> Iterator[io.StringIO]:
+        self,
+        item: Literal["assert", "attribute", "class", "comment", "variable"],
+        stub: bool = True,
+    ) -> Iterator[IO[str]]:
+        """Yields the stream to write an item to, after the blank lines that
+        separate it from the previous one.
+
+        If 'stub' is False, the item is not written to the stub.
+        """
+        ofi = self._both_streams if stub else self.stream
         if self.last_item == "class":
-            print(file=self.stream)
-            print(file=self.stream)
+            print(file=ofi)
+            print(file=ofi)
         elif self.last_item == "attribute":
-            print(file=self.stream)
+            print(file=ofi)
             if item == "class":
-                print(file=self.stream)
+                print(file=ofi)
         elif self.last_item in ("variable", "assert", "comment"):
             if item == "class":
-                print(file=self.stream)
-                print(file=self.stream)
+                print(file=ofi)
+                print(file=ofi)
             elif item == "attribute":
-                print(file=self.stream)
+                print(file=ofi)
         else:
             raise TypeError
-        yield self.stream
+        yield ofi
         self.last_item = item
 
+    def _checkpoint(self) -> None:
+        self.stream.checkpoint()
+        if self.stub_stream is not None:
+            self.stub_stream.checkpoint()
+
     def generate(self, item):
         if item in self.done:
             return
@@ -108,6 +184,7 @@ class CodeGenerator:
     def generate_all(self, items):
         for item in items:
             self.generate(item)
+            self._checkpoint()
 
     def _make_relative_path(self, path1, path2):
         """path1 and path2 are pathnames.
@@ -172,6 +249,19 @@ class CodeGenerator:
         and version numbers.
         Such as `comtypes.gen._xxxxxxxx_xxxx_xxxx_xxxx_xxxxxxxxxxxx_l_M_m`.
         """
+        self.generate_wrapper(tdescs, filename)
+        output = io.StringIO()
+        self.write_wrapper_code(output)
+        return output.getvalue()
+
+    def generate_wrapper(self, tdescs: Sequence[Any], filename: Optional[str]) -> None:
+        """Generates the code for the COM type library wrapper module, without
+        assembling it.
+
+        The code is written to a file by `write_wrapper_code` afterwards.  For
+        large type libraries, the definitions are kept in a temporary file in the
+        meantime.
+        """
         tlib_mtime = None
 
         if filename is not None:
@@ -194,31 +284,76 @@ class CodeGenerator:
         self.declarations.add("_lcid", "0", "change this if required")
         self._generate_typelib_path(filename)
 
-        items = set(tdescs)
-        loops = 0
-        while items:
-            loops += 1
-            self.more = set()
-            self.generate_all(items)
-
-            items |= self.more
-            items -= self.done
+        # Items required by the generated code are added to the worklist,
+        # so everything is generated in a single pass over it.
+        self.more.extend(tdescs)
+        while self.more:
+            self.generate(self.more.pop())
+            self._checkpoint()
 
         self.imports.add("ctypes", "*")  # HACK: wildcard import is so ugly.
+        if self.member_table is not None:
+            self.imports.add("comtypes._member_tables", "_build_members")
         if tlib_mtime is not None:
             logger.debug('filename: "%s": tlib_mtime: %s', filename, tlib_mtime)
             self.imports.add("comtypes", "_check_version")
-        output = io.StringIO()
-        if filename is not None:
+        self.tlib_mtime = tlib_mtime
+
+    def write_wrapper_code(self, output: IO[str]) -> None:
+        """Writes the code generated by `generate_wrapper` to 'output'.
+
+        The definitions are copied from `self.stream` in large chunks instead
+        of being joined into a single string first.
+        """
+        if self.filename is not None:
             # Hm, what is the CORRECT encoding?
             print("# -*- coding: mbcs -*-", file=output)
             print(file=output)
         print(self.imports.getvalue(), file=output)
-        print("from typing import TYPE_CHECKING", file=output)
+        if self.stub_stream is None:
+            self._write_hints_import(output)
         print(file=output)
-        print("if TYPE_CHECKING:", file=output)
-        print("    from comtypes import hints", file=output)
+        print(self.declarations.getvalue(), file=output)
+        print(file=output)
+        if self.member_table is not None:
+            # The values are in the member table.
+            if self.enums:
+                print(self.enums.to_aliases(), file=output)
+                print(file=output)
+        else:
+            if self.unnamed_enum_members:
+                print("# values for unnamed enumeration", file=output)
+                for n, v in self.unnamed_enum_members:
+                    print(f"{n} = {v}", file=output)
+                print(file=output)
+            if self.enums:
+                print(self.enums.to_constants(), file=output)
+                print(file=output)
+        if self.enum_aliases:
+            print("# aliases for enums", file=output)
+            for k, v in self.enum_aliases.items():
+                print(f"{k} = {v}", file=output)
+            print(file=output)
+        self.stream.copy_to(output)
         print(file=output)
+        if self.member_table is not None:
+            self._write_member_table(output)
+            print(file=output)
+        print(self._make_dunder_all_part(), file=output)
+        print(file=output)
+        if self.tlib_mtime is not None:
+            print(f"_check_version({version!r}, {self.tlib_mtime:f})", file=output)
+
+    def write_stub_code(self, output: IO[str]) -> None:
+        """Writes the `.pyi` stub of the wrapper module to 'output'.
+
+        It has the definitions of the module, with the type annotations of
+        interfaces, but without their `_methods_` and `_disp_methods_`.  The
+        CodeGenerator must have been created with 'stubs=True'.
+        """
+        assert self.stub_stream is not None
+        print(self.imports.getvalue(), file=output)
+        self._write_hints_import(output)
         print(file=output)
         print(self.declarations.getvalue(), file=output)
         print(file=output)
@@ -235,12 +370,31 @@ class CodeGenerator:
             for k, v in self.enum_aliases.items():
                 print(f"{k} = {v}", file=output)
             print(file=output)
-        print(self.stream.getvalue(), file=output)
+        self.stub_stream.copy_to(output)
+        print(file=output)
         print(self._make_dunder_all_part(), file=output)
+
+    def _write_hints_import(self, output: IO[str]) -> None:
+        print("from typing import TYPE_CHECKING", file=output)
+        print(file=output)
+        print("if TYPE_CHECKING:", file=output)
+        print("    from comtypes import hints", file=output)
         print(file=output)
-        if tlib_mtime is not None:
-            print(f"_check_version({version!r}, {tlib_mtime:f})", file=output)
-        return output.getvalue()
+
+    def _write_member_table(self, output: IO[str]) -> None:
+        assert self.member_table is not None
+        constants = self.unnamed_enum_members + self.enums.get_constants()
+        table = (
+            _member_tables.FORMAT_VERSION,
+            tuple(constants),
+            tuple(self.member_table),
+        )
+        data = _member_tables.dumps(table)
+        print("_build_members(", file=output)
+        print("    globals(),", file=output)
+        for i in range(0, len(data), 72):
+            print(f"    {data[i : i + 72]!r}", file=output)
+        print(")", file=output)
 
     def generate_friendly_code(self, modname: str) -> str:
         """Returns the code for the COM type library friendly module.
@@ -424,7 +578,7 @@ class CodeGenerator:
         self,
         body: typedesc.StructureBody,
         fields: list[typedesc.Field],
-        ofi: io.StringIO,
+        ofi: IO[str],
     ) -> None:
         print(f"{body.struct.name}._fields_ = [", file=ofi)
         if body.struct.location:
@@ -446,7 +600,7 @@ class CodeGenerator:
         print("]", file=ofi)
 
     def _write_structbody_size_comments(
-        self, body: typedesc.StructureBody, ofi: io.StringIO
+        self, body: typedesc.StructureBody, ofi: IO[str]
     ) -> None:
         msg1 = "# The size provided by the typelib is incorrect."
         msg2 = f"# The size and alignment check for {body.struct.name} is skipped."
@@ -454,7 +608,7 @@ class CodeGenerator:
         print(msg2, file=ofi)
 
     def _write_structbody_size_assertion(
-        self, body: typedesc.StructureBody, ofi: io.StringIO
+        self, body: typedesc.StructureBody, ofi: IO[str]
     ) -> None:
         name = body.struct.name
         assert body.struct.size is not None
@@ -467,7 +621,7 @@ class CodeGenerator:
         self,
         body: typedesc.StructureBody,
         methods: list[typedesc.Method],
-        ofi: io.StringIO,
+        ofi: IO[str],
     ) -> None:
         print(f"{body.struct.name}._methods_ = [", file=ofi)
         if body.struct.location:
@@ -503,11 +657,11 @@ class CodeGenerator:
         # 'Library' symbol?
 
         with self.adjust_blank("class") as ofi:
-            heads.LibraryHeadWriter(ofi).write(lib)
+            heads.LibraryHeadWriter(ofi, self.docs).write(lib)
         self.names.add("Library")
 
     def External(self, ext: typedesc.External) -> None:
-        modname = name_wrapper_module(ext.tlib)
+        modname = name_wrapper_module(ext.tlib, self.lean)
         if modname not in self.imports:
             self.externals.append(ext.tlib)
             self.imports.add(modname)
@@ -550,7 +704,7 @@ class CodeGenerator:
         self.imports.add("comtypes", "GUID")
         self.imports.add("comtypes", "CoClass")
         with self.adjust_blank("class") as ofi:
-            heads.CoClassHeadWriter(ofi, self.filename).write(coclass)
+            heads.CoClassHeadWriter(ofi, self.filename, self.docs).write(coclass)
 
         for itf, _ in coclass.interfaces:
             self.generate(itf.get_head())
@@ -636,7 +790,16 @@ class CodeGenerator:
         self.imports.add("comtypes", "GUID")
 
         with self.adjust_blank("class") as ofi:
-            heads.ComInterfaceHeadWriter(ofi).write(head, basename)
+            if self.stub_stream is None:
+                heads.ComInterfaceHeadWriter(ofi, docs=self.docs).write(head, basename)
+            else:
+                # The type annotations go to the stub only.
+                writer = heads.ComInterfaceHeadWriter(
+                    self.stream, annotate=False, docs=self.docs
+                )
+                writer.write(head, basename)
+                writer = heads.ComInterfaceHeadWriter(self.stub_stream, docs=self.docs)
+                writer.write(head, basename)
 
     def ComInterfaceBody(self, body: typedesc.ComInterfaceBody) -> None:
         # The base class must be fully generated, including the
@@ -649,19 +812,59 @@ class CodeGenerator:
                 self.generate(a[0])
             self.generate(m.returns)
 
-        with self.adjust_blank("attribute") as ofi:
-            print(f"{body.itf.name}._methods_ = [", file=ofi)
-            for m in body.itf.members:
-                if isinstance(m, typedesc.ComMethod):
-                    isdual = "dual" in body.itf.idlflags
-                    print(ComMethodGenerator(m, isdual).generate(), file=ofi)
-                    self.add_ComMth_requirements(m, isdual)
-                else:
-                    raise TypeError("what's this?")
+        if self.member_table is not None:
+            self.member_table.append(self._ComInterfaceBody_table(body))
+            return
+        with self.adjust_blank("attribute", stub=False) as ofi:
+            self._write_fragment(
+                f"ComInterfaceBody:{body.itf.name}",
+                functools.partial(self._fingerprint_ComInterfaceBody, body),
+                functools.partial(self._write_ComInterfaceBody, body),
+                ofi,
+            )
 
-            print("]", file=ofi)
-        print(file=self.stream)
-        ComInterfaceBodyImplCommentWriter(self.stream).write(body)
+    def _write_ComInterfaceBody(
+        self, body: typedesc.ComInterfaceBody, ofi: IO[str]
+    ) -> None:
+        print(f"{body.itf.name}._methods_ = [", file=ofi)
+        for m in body.itf.members:
+            if isinstance(m, typedesc.ComMethod):
+                isdual = "dual" in body.itf.idlflags
+                print(ComMethodGenerator(m, isdual, self.docs).generate(), file=ofi)
+                self.add_ComMth_requirements(m, isdual)
+            else:
+                raise TypeError("what's this?")
+
+        print("]", file=ofi)
+        print(file=ofi)
+        if self.docs:
+            ComInterfaceBodyImplCommentWriter(ofi).write(body)
+
+    def _ComInterfaceBody_table(
+        self, body: typedesc.ComInterfaceBody
+    ) -> tuple[str, str, tuple[Any, ...]]:
+        members = []
+        for m in body.itf.members:
+            if isinstance(m, typedesc.ComMethod):
+                isdual = "dual" in body.itf.idlflags
+                generator = ComMethodGenerator(m, isdual, self.docs)
+                members.append(generator.to_table_entry())
+                self.add_ComMth_requirements(m, isdual)
+            else:
+                raise TypeError("what's this?")
+        return (body.itf.name, "_methods_", tuple(members))
+
+    def _fingerprint_ComInterfaceBody(self, body: typedesc.ComInterfaceBody) -> str:
+        inputs: list[Any] = [__debug__, self.docs, body.itf.name, body.itf.idlflags]
+        for m in body.itf.members:
+            if not isinstance(m, typedesc.ComMethod):
+                raise TypeError("what's this?")
+            inputs.append(
+                (m.name, m.memid, m.idlflags, m.doc, self._type_signature(m.returns))
+            )
+            for typ, name, idlflags, default in m.arguments:
+                inputs.append((self._type_signature(typ), name, idlflags, default))
+        return fingerprint(inputs)
 
     def DispInterface(self, itf: typedesc.DispInterface) -> None:
         self.generate(itf.get_head())
@@ -675,7 +878,16 @@ class CodeGenerator:
         self.imports.add("comtypes", "GUID")
 
         with self.adjust_blank("class") as ofi:
-            heads.DispInterfaceHeadWriter(ofi).write(head, basename)
+            if self.stub_stream is None:
+                heads.DispInterfaceHeadWriter(ofi, docs=self.docs).write(head, basename)
+            else:
+                # The type annotations go to the stub only.
+                writer = heads.DispInterfaceHeadWriter(
+                    self.stream, annotate=False, docs=self.docs
+                )
+                writer.write(head, basename)
+                writer = heads.DispInterfaceHeadWriter(self.stub_stream, docs=self.docs)
+                writer.write(head, basename)
 
     def DispInterfaceBody(self, body: typedesc.DispInterfaceBody) -> None:
         # make sure we can generate the body
@@ -688,18 +900,109 @@ class CodeGenerator:
                 self.generate(m.typ)
             else:
                 raise TypeError(m)
-        with self.adjust_blank("attribute") as ofi:
-            print(f"{body.itf.name}._disp_methods_ = [", file=ofi)
-            for m in body.itf.members:
-                if isinstance(m, typedesc.DispMethod):
-                    print(DispMethodGenerator(m).generate(), file=ofi)
-                    self.add_DispMth_requirements(m)
-                elif isinstance(m, typedesc.DispProperty):
-                    print(DispPropertyGenerator(m).generate(), file=ofi)
-                    self.add_DispProp_requirements(m)
-                else:
-                    raise TypeError(m)
-            print("]", file=ofi)
+        if self.member_table is not None:
+            self.member_table.append(self._DispInterfaceBody_table(body))
+            return
+        with self.adjust_blank("attribute", stub=False) as ofi:
+            self._write_fragment(
+                f"DispInterfaceBody:{body.itf.name}",
+                functools.partial(self._fingerprint_DispInterfaceBody, body),
+                functools.partial(self._write_DispInterfaceBody, body),
+                ofi,
+            )
+
+    def _write_DispInterfaceBody(
+        self, body: typedesc.DispInterfaceBody, ofi: IO[str]
+    ) -> None:
+        print(f"{body.itf.name}._disp_methods_ = [", file=ofi)
+        for m in body.itf.members:
+            if isinstance(m, typedesc.DispMethod):
+                print(DispMethodGenerator(m, self.docs).generate(), file=ofi)
+                self.add_DispMth_requirements(m)
+            elif isinstance(m, typedesc.DispProperty):
+                print(DispPropertyGenerator(m, self.docs).generate(), file=ofi)
+                self.add_DispProp_requirements(m)
+            else:
+                raise TypeError(m)
+        print("]", file=ofi)
+
+    def _DispInterfaceBody_table(
+        self, body: typedesc.DispInterfaceBody
+    ) -> tuple[str, str, tuple[Any, ...]]:
+        members = []
+        for m in body.itf.members:
+            if isinstance(m, typedesc.DispMethod):
+                members.append(DispMethodGenerator(m, self.docs).to_table_entry())
+                self.add_DispMth_requirements(m)
+            elif isinstance(m, typedesc.DispProperty):
+                members.append(DispPropertyGenerator(m, self.docs).to_table_entry())
+                self.add_DispProp_requirements(m)
+            else:
+                raise TypeError(m)
+        return (body.itf.name, "_disp_methods_", tuple(members))
+
+    def _fingerprint_DispInterfaceBody(self, body: typedesc.DispInterfaceBody) -> str:
+        inputs: list[Any] = [__debug__, self.docs, body.itf.name]
+        for m in body.itf.members:
+            if isinstance(m, typedesc.DispMethod):
+                inputs.append(
+                    (
+                        m.name,
+                        m.dispid,
+                        m.idlflags,
+                        m.doc,
+                        self._type_signature(m.returns),
+                    )
+                )
+                for typ, name, idlflags, default in m.arguments:
+                    inputs.append((self._type_signature(typ), name, idlflags, default))
+            elif isinstance(m, typedesc.DispProperty):
+                inputs.append(
+                    (m.name, m.dispid, m.idlflags, m.doc, self._type_signature(m.typ))
+                )
+            else:
+                raise TypeError(m)
+        return fingerprint(inputs)
+
+    ################################################################
+    # reuse of code fragments from a previous generation
+    #
+    def _type_signature(self, typ: Any) -> tuple[str, str]:
+        # How a type is referred to in generated code.  Its own definition
+        # is a separate item.
+        return (type(typ).__name__, self._to_type_name(typ))
+
+    def _write_fragment(
+        self,
+        key: str,
+        get_fingerprint: Callable[[], str],
+        write: Callable[[IO[str]], None],
+        ofi: IO[str],
+    ) -> None:
+        """Writes the code of an item with 'write', or the fragment cached for
+        'key' if the fingerprint of the item is unchanged."""
+        if self.fragments is None:
+            write(ofi)
+            return
+        fp = get_fingerprint()
+        fragment = self.fragments.lookup(key, fp)
+        if fragment is not None:
+            for kind, args in fragment.requirements:
+                target = self.imports if kind == "import" else self.declarations
+                target.add(*args)
+            ofi.write(fragment.text)
+            return
+        journal: list[tuple[str, tuple[Any, ...]]] = []
+        imports, declarations = self.imports, self.declarations
+        self.imports = _RequirementRecorder("import", imports, journal)  # type: ignore
+        self.declarations = _RequirementRecorder("declare", declarations, journal)  # type: ignore
+        try:
+            output = io.StringIO()
+            write(output)
+        finally:
+            self.imports, self.declarations = imports, declarations
+        self.fragments.store(key, fp, Fragment(output.getvalue(), tuple(journal)))
+        ofi.write(output.getvalue())
 
     ################################################################
     # non-toplevel method requirements
@@ -708,7 +1011,7 @@ class CodeGenerator:
         self.imports.add("comtypes", "COMMETHOD")
         if isdual:
             self.imports.add("comtypes", "dispid")
-        if __debug__ and m.doc:
+        if __debug__ and self.docs and m.doc:
             self.imports.add("comtypes", "helpstring")
         for typ, _, _, default in m.arguments:
             if isinstance(typ, typedesc.ComInterface):
@@ -723,7 +1026,7 @@ class CodeGenerator:
     def add_DispMth_requirements(self, m: typedesc.DispMethod) -> None:
         self.imports.add("comtypes", "DISPMETHOD")
         self.imports.add("comtypes", "dispid")
-        if __debug__ and m.doc:
+        if __debug__ and self.docs and m.doc:
             self.imports.add("comtypes", "helpstring")
         for _, _, _, default in m.arguments:
             if default is not None:
@@ -732,5 +1035,5 @@ class CodeGenerator:
     def add_DispProp_requirements(self, prop: typedesc.DispProperty) -> None:
         self.imports.add("comtypes", "DISPPROPERTY")
         self.imports.add("comtypes", "dispid")
-        if __debug__ and prop.doc:
+        if __debug__ and self.docs and prop.doc:
             self.imports.add("comtypes", "helpstring")
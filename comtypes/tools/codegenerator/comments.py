@@ -1,10 +1,10 @@
-import io
+from typing import IO
 
 from comtypes.tools import typedesc
 
 
 class ComInterfaceBodyImplCommentWriter:
-    def __init__(self, stream: io.StringIO):
+    def __init__(self, stream: IO[str]):
         self.stream = stream
 
     def write(self, body: typedesc.ComInterfaceBody) -> None:
@@ -0,0 +1,102 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Sequence
+from typing import Any, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump this when the format of the file or of the fingerprints changes.
+FORMAT_VERSION = 1
+
+
+class Fragment(NamedTuple):
+    """The code generated for an item, and the `add` calls it made on the
+    imports ("import") and declarations ("declare") of the module."""
+
+    text: str
+    requirements: tuple[tuple[str, tuple[Any, ...]], ...]
+
+
+def fingerprint(inputs: Sequence[Any]) -> str:
+    """Return a fingerprint of 'inputs', which must have a stable `repr`."""
+    return hashlib.sha1(repr(inputs).encode("utf-8")).hexdigest()
+
+
+class FragmentCache:
+    """Code fragments from a previous generation of a wrapper module.
+
+    The code generator looks up the fragment of an item by a key naming it
+    and by a fingerprint of the type information the code is generated
+    from.  A fragment is reused while the fingerprint is unchanged, so only
+    items that changed in a revised type library are generated again.
+
+    Fragments are kept in a JSON file at 'path'.  `save` writes the ones
+    that were looked up or stored since loading; the others belong to
+    items that no longer exist.
+    """
+
+    def __init__(self, path: Optional[str] = None, version: str = "") -> None:
+        self.path = path
+        self.version = version
+        self._loaded: dict[str, tuple[str, Fragment]] = {}
+        self._used: dict[str, tuple[str, Fragment]] = {}
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            self._load(path)
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, encoding="utf-8") as ifi:
+                data = json.load(ifi)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as details:
+            logger.info("Could not load code fragments from %s: %s", path, details)
+            return
+        if data.get("format") != FORMAT_VERSION or data.get("version") != self.version:
+            return
+        for key, (fp, text, requirements) in data["fragments"].items():
+            reqs = tuple((kind, tuple(args)) for kind, args in requirements)
+            self._loaded[key] = (fp, Fragment(text, reqs))
+
+    def lookup(self, key: str, fp: str) -> Optional[Fragment]:
+        """Return the fragment for 'key' if it was generated from inputs with
+        the fingerprint 'fp'."""
+        entry = self._loaded.get(key)
+        if entry is None or entry[0] != fp:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used[key] = entry
+        return entry[1]
+
+    def store(self, key: str, fp: str, fragment: Fragment) -> None:
+        """Store the fragment generated for 'key' from inputs with the
+        fingerprint 'fp'."""
+        self._used[key] = self._loaded[key] = (fp, fragment)
+
+    def save(self) -> None:
+        """Write the fragments used since loading to the file."""
+        if self.path is None:
+            return
+        data = {
+            "format": FORMAT_VERSION,
+            "version": self.version,
+            "fragments": {
+                key: [fp, fragment.text, fragment.requirements]
+                for key, (fp, fragment) in self._used.items()
+            },
+        }
+        dirname, basename = os.path.split(self.path)
+        fd, tmp_path = tempfile.mkstemp(prefix=basename, dir=dirname)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as ofi:
+                json.dump(data, ofi)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,6 +1,5 @@
-import io
 from collections.abc import Sequence
-from typing import Optional
+from typing import IO, Optional
 
 from comtypes.tools import typedesc
 from comtypes.tools.codegenerator import typeannotator
@@ -15,7 +14,7 @@ def _to_docstring(orig: str, depth: int = 1) -> str:
 
 
 class StructureHeadWriter:
-    def __init__(self, stream: io.StringIO) -> None:
+    def __init__(self, stream: IO[str]) -> None:
         self.stream = stream
 
     def write(self, head: typedesc.StructureHead, basenames: Sequence[str]) -> None:
@@ -69,8 +68,9 @@ class StructureHeadWriter:
 
 
 class LibraryHeadWriter:
-    def __init__(self, stream: io.StringIO) -> None:
+    def __init__(self, stream: IO[str], docs: bool = True) -> None:
         self.stream = stream
+        self.docs = docs
 
     def write(self, lib: typedesc.TypeLib) -> None:
         # Hm, in user code we have to write:
@@ -82,7 +82,7 @@ class LibraryHeadWriter:
         # generated code, instead as being an attribute of the
         # 'Library' symbol?
         print("class Library(object):", file=self.stream)
-        if lib.doc:
+        if self.docs and lib.doc:
             print(_to_docstring(lib.doc), file=self.stream)
 
         if lib.name:
@@ -95,13 +95,16 @@ class LibraryHeadWriter:
 
 
 class CoClassHeadWriter:
-    def __init__(self, stream: io.StringIO, filename: Optional[str]) -> None:
+    def __init__(
+        self, stream: IO[str], filename: Optional[str], docs: bool = True
+    ) -> None:
         self.stream = stream
         self.filename = filename
+        self.docs = docs
 
     def write(self, coclass: typedesc.CoClass) -> None:
         print(f"class {coclass.name}(CoClass):", file=self.stream)
-        if coclass.doc:
+        if self.docs and coclass.doc:
             print(_to_docstring(coclass.doc), file=self.stream)
         print(f"    _reg_clsid_ = GUID({coclass.clsid!r})", file=self.stream)
         print(f"    _idlflags_ = {coclass.idlflags}", file=self.stream)
@@ -119,8 +122,12 @@ class CoClassHeadWriter:
 
 
 class ComInterfaceHeadWriter:
-    def __init__(self, stream: io.StringIO) -> None:
+    def __init__(
+        self, stream: IO[str], annotate: bool = True, docs: bool = True
+    ) -> None:
         self.stream = stream
+        self.annotate = annotate
+        self.docs = docs
 
     def _is_enuminterface(self, itf: typedesc.ComInterface) -> bool:
         # Check if this is an IEnumXXX interface
@@ -138,7 +145,7 @@ class ComInterfaceHeadWriter:
             return
 
         print(f"class {head.itf.name}({basename}):", file=self.stream)
-        if head.itf.doc:
+        if self.docs and head.itf.doc:
             print(_to_docstring(head.itf.doc), file=self.stream)
 
         print("    _case_insensitive_ = True", file=self.stream)
@@ -166,6 +173,8 @@ class ComInterfaceHeadWriter:
             print("            return item", file=self.stream)
             print("        raise IndexError(index)", file=self.stream)
 
+        if not self.annotate:
+            return
         annotations = typeannotator.ComInterfaceMembersAnnotator(head.itf).generate()
         if annotations:
             print(file=self.stream)
@@ -174,18 +183,24 @@ class ComInterfaceHeadWriter:
 
 
 class DispInterfaceHeadWriter:
-    def __init__(self, stream: io.StringIO) -> None:
+    def __init__(
+        self, stream: IO[str], annotate: bool = True, docs: bool = True
+    ) -> None:
         self.stream = stream
+        self.annotate = annotate
+        self.docs = docs
 
     def write(self, head: typedesc.DispInterfaceHead, basename: str) -> None:
         print(f"class {head.itf.name}({basename}):", file=self.stream)
-        if head.itf.doc:
+        if self.docs and head.itf.doc:
             print(_to_docstring(head.itf.doc), file=self.stream)
         print("    _case_insensitive_ = True", file=self.stream)
         print(f"    _iid_ = GUID({head.itf.iid!r})", file=self.stream)
         print(f"    _idlflags_ = {head.itf.idlflags}", file=self.stream)
         print("    _methods_ = []", file=self.stream)
 
+        if not self.annotate:
+            return
         annotations = typeannotator.DispInterfaceMembersAnnotator(head.itf).generate()
         if annotations:
             print(file=self.stream)
@@ -1,6 +1,6 @@
 import keyword
 from collections.abc import Iterator
-from typing import Any
+from typing import Any, Optional
 from typing import Union as _UnionT
 
 from comtypes.tools import typedesc
@@ -101,12 +101,56 @@ def _to_arg_definition(
     return code
 
 
+# Default values of these types are stored in member tables as they are;
+# others as the source of an expression, see `comtypes._member_tables`.
+_TABLE_VALUE_TYPES = (bool, int, float, complex, str, bytes)
+
+
+def _to_table_flags(idlflags: list[_IdlFlagType]) -> tuple[tuple[Any, ...], Any]:
+    flags: list[Any] = []
+    doc = None
+    for f in idlflags:
+        if isinstance(f, dispid):
+            flags.append(f.memid)
+        elif isinstance(f, helpstring):
+            doc = f.text
+        else:
+            flags.append(f)
+    return tuple(flags), doc
+
+
+def _to_arg_table_entry(
+    type_name: str,
+    arg_name: str,
+    idlflags: list[str],
+    default: _DefValType,
+) -> tuple[Any, ...]:
+    if default is None:
+        return (tuple(idlflags), type_name, arg_name)
+    if type(default) not in _TABLE_VALUE_TYPES:
+        default = (repr(default),)
+    return (tuple(idlflags), type_name, arg_name, default)
+
+
+def _to_table_entry(
+    kind: str,
+    idlflags: list[_IdlFlagType],
+    type_name: str,
+    member_name: str,
+    args: Optional[Iterator[tuple[str, str, list[str], _DefValType]]] = None,
+) -> tuple[Any, ...]:
+    flags, doc = _to_table_flags(idlflags)
+    arguments = tuple(_to_arg_table_entry(*i) for i in args or ())
+    return (kind, flags, doc, type_name, member_name, arguments)
+
+
 class ComMethodGenerator:
-    def __init__(self, m: typedesc.ComMethod, isdual: bool) -> None:
+    def __init__(self, m: typedesc.ComMethod, isdual: bool, docs: bool = True) -> None:
         self._m = m
         self._isdual = isdual
+        self._docs = docs
         self.data: list[str] = []
-        self._to_type_name = TypeNamer()
+        self._to_type_name = TypeNamer(lean=not docs)
 
     def generate(self) -> str:
         if not self._m.arguments:
@@ -115,6 +159,10 @@ class ComMethodGenerator:
             self._make_withargs()
         return "\n".join(self.data)
 
+    def to_table_entry(self) -> tuple[Any, ...]:
+        """Returns the member table entry, see `comtypes._member_tables`."""
+        return _to_table_entry("COMMETHOD", *self._get_common_elms(), self._iter_args())
+
     def _get_common_elms(self) -> tuple[list[_IdlFlagType], str, str]:
         idlflags: list[_IdlFlagType] = []
         if self._isdual:
@@ -122,7 +170,7 @@ class ComMethodGenerator:
             idlflags.extend(self._m.idlflags)
         else:  # We don't include the dispid for non-dispatch COM interfaces
             idlflags.extend(self._m.idlflags)
-        if __debug__ and self._m.doc:
+        if __debug__ and self._docs and self._m.doc:
             idlflags.insert(1, helpstring(self._m.doc))
         type_name = self._to_type_name(self._m.returns)
         return (idlflags, type_name, self._m.name)
@@ -210,10 +258,11 @@ class ComMethodGenerator:
 
 
 class DispMethodGenerator:
-    def __init__(self, m: typedesc.DispMethod) -> None:
+    def __init__(self, m: typedesc.DispMethod, docs: bool = True) -> None:
         self._m = m
+        self._docs = docs
         self.data: list[str] = []
-        self._to_type_name = TypeNamer()
+        self._to_type_name = TypeNamer(lean=not docs)
 
     def generate(self) -> str:
         if not self._m.arguments:
@@ -222,11 +271,17 @@ class DispMethodGenerator:
             self._make_withargs()
         return "\n".join(self.data)
 
+    def to_table_entry(self) -> tuple[Any, ...]:
+        """Returns the member table entry, see `comtypes._member_tables`."""
+        return _to_table_entry(
+            "DISPMETHOD", *self._get_common_elms(), self._iter_args()
+        )
+
     def _get_common_elms(self) -> tuple[list[_IdlFlagType], str, str]:
         idlflags: list[_IdlFlagType] = []
         idlflags.append(dispid(self._m.dispid))
         idlflags.extend(self._m.idlflags)
-        if __debug__ and self._m.doc:
+        if __debug__ and self._docs and self._m.doc:
             idlflags.insert(1, helpstring(self._m.doc))
         type_name = self._to_type_name(self._m.returns)
         return (idlflags, type_name, self._m.name)
@@ -264,9 +319,10 @@ class DispMethodGenerator:
 
 
 class DispPropertyGenerator:
-    def __init__(self, m: typedesc.DispProperty) -> None:
+    def __init__(self, m: typedesc.DispProperty, docs: bool = True) -> None:
         self._m = m
-        self._to_type_name = TypeNamer()
+        self._docs = docs
+        self._to_type_name = TypeNamer(lean=not docs)
 
     def generate(self) -> str:
         flags, type_name, member_name = self._get_common_elms()
@@ -281,17 +337,26 @@ class DispPropertyGenerator:
             )
         return code
 
+    def to_table_entry(self) -> tuple[Any, ...]:
+        """Returns the member table entry, see `comtypes._member_tables`."""
+        return _to_table_entry("DISPPROPERTY", *self._get_common_elms())
+
     def _get_common_elms(self) -> tuple[list[_IdlFlagType], str, str]:
         idlflags: list[_IdlFlagType] = []
         idlflags.append(dispid(self._m.dispid))
         idlflags.extend(self._m.idlflags)
-        if __debug__ and self._m.doc:
+        if __debug__ and self._docs and self._m.doc:
             idlflags.insert(1, helpstring(self._m.doc))
         type_name = self._to_type_name(self._m.typ)
         return (idlflags, type_name, self._m.name)
 
 
 class TypeNamer:
+    def __init__(self, lean: bool = False) -> None:
+        # Types of other typelibs are referred to in their modules of the
+        # same profile.
+        self.lean = lean
+
     def __call__(self, t: Any) -> str:
         # Return a string, containing an expression which can be used
         # to refer to the type. Assumes the 'from ctypes import *'
@@ -331,7 +396,7 @@ class TypeNamer:
         elif isinstance(t, typedesc.External):
             # t.symbol_name - symbol to generate
             # t.tlib - the ITypeLib pointer to the typelibrary containing the symbols definition
-            modname = name_wrapper_module(t.tlib)
+            modname = name_wrapper_module(t.tlib, self.lean)
             return f"{modname}.{t.symbol_name}"
         return t.name
 
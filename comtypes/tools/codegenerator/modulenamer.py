@@ -3,16 +3,22 @@ from typing import Optional
 import comtypes
 from comtypes import typeinfo
 
+# Appended to the names of the modules of the lean profile, so that they
+# are never used in place of the full ones, or the other way round.
+LEAN_SUFFIX = "_lean"
 
-def name_wrapper_module(tlib: typeinfo.ITypeLib) -> str:
+
+def name_wrapper_module(tlib: typeinfo.ITypeLib, lean: bool = False) -> str:
     """Determine the name of a typelib wrapper module"""
     libattr = tlib.GetLibAttr()
     guid = str(libattr.guid)[1:-1].replace("-", "_")
     modname = f"_{guid}_{libattr.lcid}_{libattr.wMajorVerNum}_{libattr.wMinorVerNum}"
+    if lean:
+        modname += LEAN_SUFFIX
     return f"comtypes.gen.{modname}"
 
 
-def name_friendly_module(tlib: typeinfo.ITypeLib) -> Optional[str]:
+def name_friendly_module(tlib: typeinfo.ITypeLib, lean: bool = False) -> Optional[str]:
     """Determine the friendly-name of a typelib module.
     If cannot get friendly-name from typelib, returns `None`.
     """
@@ -20,4 +26,6 @@ def name_friendly_module(tlib: typeinfo.ITypeLib) -> Optional[str]:
         modulename = tlib.GetDocumentation(-1)[0]
     except comtypes.COMError:
         return
+    if lean:
+        modulename += LEAN_SUFFIX
     return f"comtypes.gen.{modulename}"
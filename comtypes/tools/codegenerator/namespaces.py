@@ -260,6 +260,27 @@ class EnumerationNamespaces:
             blocks.append("\n".join(lines))
         return "\n\n".join(blocks)
 
+    def to_aliases(self) -> str:
+        """Returns the definitions of the enumeration types, without their
+        members, which `get_constants` returns.
+
+        Examples:
+            >>> enums = EnumerationNamespaces()
+            >>> enums.add('Foo', 'ham', 1)
+            >>> enums.add('Bar', 'bacon', 3)
+            >>> print(enums.to_aliases())
+            Foo = c_int  # enum
+            Bar = c_int  # enum
+            >>> enums.get_constants()
+            [('ham', 1), ('bacon', 3)]
+        """
+        return "\n".join(f"{enum_name} = c_int  # enum" for enum_name in self.data)
+
+    def get_constants(self) -> list[tuple[str, int]]:
+        """Returns the names and values of all members, in the order that
+        `to_constants` defines them."""
+        return [member for members in self.data.values() for member in members]
+
     def to_intflags(self) -> str:
         blocks = []
         for enum_name, members in self._iter_items():
@@ -0,0 +1,72 @@
+import io
+import shutil
+import tempfile
+from typing import IO, Optional
+
+# Size of the in-memory buffer of `SpooledCodeWriter`, in characters.
+SPOOL_MAX_SIZE = 1 << 20
+
+
+class SpooledCodeWriter(io.TextIOBase):
+    """A write-only text stream for generated code.
+
+    Written text is buffered in memory.  When `checkpoint` is called and more
+    than 'max_size' characters are buffered, they are moved to a temporary
+    file in a single write, so the memory used stays bounded for large
+    modules.  `copy_to` streams the whole content to another file without
+    assembling it into a single string.
+    """
+
+    def __init__(self, max_size: int = SPOOL_MAX_SIZE) -> None:
+        super().__init__()
+        self.max_size = max_size
+        self._file: Optional[IO[str]] = None
+        self._reset_buffer()
+
+    def _reset_buffer(self) -> None:
+        self._buffer = io.StringIO()
+        # The code generator calls `print(..., file=stream)` many thousand
+        # times, so let it call the method of the buffer directly.
+        self.write = self._buffer.write  # type: ignore
+
+    def writable(self) -> bool:
+        return True
+
+    def checkpoint(self) -> None:
+        """Move the buffered text to the temporary file, if there is more
+        than 'max_size' characters of it."""
+        if self._buffer.tell() > self.max_size:
+            if self._file is None:
+                self._file = tempfile.TemporaryFile(
+                    "w+", encoding="utf-8", newline="", prefix="comtypes-"
+                )
+            self._file.write(self._buffer.getvalue())
+            self._reset_buffer()
+
+    @property
+    def spooled(self) -> bool:
+        """Whether text has been moved to a temporary file."""
+        return self._file is not None
+
+    def copy_to(self, ofi: IO[str]) -> None:
+        """Write the text written so far to 'ofi'."""
+        if self._file is not None:
+            self._file.flush()
+            self._file.seek(0)
+            shutil.copyfileobj(self._file, ofi)
+            self._file.seek(0, io.SEEK_END)
+        ofi.write(self._buffer.getvalue())
+
+    def getvalue(self) -> str:
+        """Return the text written so far."""
+        output = io.StringIO()
+        self.copy_to(output)
+        return output.getvalue()
+
+    def close(self) -> None:
+        """Discard the text and remove the temporary file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._buffer.close()
+        super().close()
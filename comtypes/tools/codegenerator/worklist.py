@@ -0,0 +1,36 @@
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+
+class Worklist:
+    """The type descriptions that remain to be generated, in the order they
+    were added.
+
+    Generating an item may require others to be generated afterwards, like
+    the `_methods_` of an interface that is only referred to by a pointer.
+    These are added here instead of being generated right away, which could
+    recurse endlessly.  An item is added at most once, so all items are
+    generated in a single pass; those that were generated in the meantime
+    are skipped by the code generator.
+    """
+
+    def __init__(self) -> None:
+        self._queue: deque[Any] = deque()
+        self._seen: set[Any] = set()
+
+    def add(self, item: Any) -> None:
+        if item not in self._seen:
+            self._seen.add(item)
+            self._queue.append(item)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.add(item)
+
+    def pop(self) -> Any:
+        """Remove and return the item that was added first."""
+        return self._queue.popleft()
+
+    def __len__(self) -> int:
+        return len(self._queue)
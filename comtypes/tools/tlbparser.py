@@ -111,6 +111,9 @@ COMTYPES = {
 class Parser:
     tlib: typeinfo.ITypeLib
     items: dict[str, Any]
+    # Pointer and SAFEARRAY types by VARTYPE and element type.  A typelib
+    # refers to the same ones in many places, which can share them.
+    derived_types: dict[tuple[int, Any], Any]
 
     def make_type(self, tdesc: typeinfo.TYPEDESC, tinfo: typeinfo.ITypeInfo) -> Any:
         if tdesc.vt in COMTYPES:
@@ -126,7 +129,11 @@ class Parser:
                 )
             return typ
         elif tdesc.vt == automation.VT_PTR:
-            return PTR(self.make_type(tdesc._.lptdesc[0], tinfo))
+            typ = self.make_type(tdesc._.lptdesc[0], tinfo)
+            key = (automation.VT_PTR, typ)
+            if key not in self.derived_types:
+                self.derived_types[key] = PTR(typ)
+            return self.derived_types[key]
         elif tdesc.vt == automation.VT_USERDEFINED:
             try:
                 ti = tinfo.GetRefTypeInfo(tdesc._.hreftype)
@@ -151,7 +158,11 @@ class Parser:
             return result
         elif tdesc.vt == automation.VT_SAFEARRAY:
             # SAFEARRAY(<type>), see Don Box pp.331f
-            return midlSAFEARRAY(self.make_type(tdesc._.lptdesc[0], tinfo))
+            typ = self.make_type(tdesc._.lptdesc[0], tinfo)
+            key = (automation.VT_SAFEARRAY, typ)
+            if key not in self.derived_types:
+                self.derived_types[key] = midlSAFEARRAY(typ)
+            return self.derived_types[key]
         raise NotImplementedError(tdesc.vt)
 
     ################################################################
@@ -684,12 +695,14 @@ class TlbFileParser(Parser):
         # XXX DOESN'T LOOK CORRECT: We should NOT register the typelib.
         self.tlib = typeinfo.LoadTypeLibEx(path)  # , regkind=typeinfo.REGKIND_REGISTER)
         self.items = {}
+        self.derived_types = {}
 
 
 class TypeLibParser(Parser):
     def __init__(self, tlib):
         self.tlib = tlib
         self.items = {}
+        self.derived_types = {}
 
 
 ################################################################
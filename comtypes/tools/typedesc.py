@@ -2,6 +2,7 @@
 # in typedesc_base
 
 import ctypes
+import sys
 from collections.abc import Sequence
 from typing import Any, Optional
 from typing import Union as _UnionT
@@ -26,6 +27,8 @@ class TypeLib:
 
 
 class Constant:
+    __slots__ = ("name", "typ", "value", "doc")
+
     def __init__(
         self,
         name: str,
@@ -33,7 +36,7 @@ class Constant:
         value: Any,
         doc: Optional[str],
     ) -> None:
-        self.name = name
+        self.name = sys.intern(name)
         self.typ = typ
         self.value = value
         self.doc = doc
@@ -63,6 +66,8 @@ class External:
 
 
 class SAFEARRAYType:
+    __slots__ = ("typ", "align", "size")
+
     def __init__(self, typ: Any) -> None:
         self.typ = typ
         self.align = self.size = ctypes.sizeof(ctypes.c_void_p) * 8
@@ -70,6 +75,8 @@ class SAFEARRAYType:
 
 class ComMethod:
     # custom COM method, parsed from typelib
+    __slots__ = ("invkind", "name", "returns", "idlflags", "memid", "doc", "arguments")
+
     def __init__(
         self,
         invkind: int,
@@ -80,7 +87,7 @@ class ComMethod:
         doc: Optional[str],
     ) -> None:
         self.invkind = invkind
-        self.name = name
+        self.name = sys.intern(name)
         self.returns = returns
         self.idlflags = idlflags
         self.memid = memid
@@ -90,11 +97,13 @@ class ComMethod:
     def add_argument(
         self, typ: Any, name: str, idlflags: list[str], default: Optional[Any]
     ) -> None:
-        self.arguments.append((typ, name, idlflags, default))
+        self.arguments.append((typ, sys.intern(name), idlflags, default))
 
 
 class DispMethod:
     # dispatchable COM method, parsed from typelib
+    __slots__ = ("dispid", "invkind", "name", "returns", "idlflags", "doc", "arguments")
+
     def __init__(
         self,
         dispid: int,
@@ -106,7 +115,7 @@ class DispMethod:
     ) -> None:
         self.dispid = dispid
         self.invkind = invkind
-        self.name = name
+        self.name = sys.intern(name)
         self.returns = returns
         self.idlflags = idlflags
         self.doc = doc
@@ -115,27 +124,33 @@ class DispMethod:
     def add_argument(
         self, typ: Any, name: str, idlflags: list[str], default: Optional[Any]
     ) -> None:
-        self.arguments.append((typ, name, idlflags, default))
+        self.arguments.append((typ, sys.intern(name), idlflags, default))
 
 
 class DispProperty:
     # dispatchable COM property, parsed from typelib
+    __slots__ = ("dispid", "name", "typ", "idlflags", "doc")
+
     def __init__(
         self, dispid: int, name: str, typ: Any, idlflags: list[str], doc: Optional[Any]
     ) -> None:
         self.dispid = dispid
-        self.name = name
+        self.name = sys.intern(name)
         self.typ = typ
         self.idlflags = idlflags
         self.doc = doc
 
 
 class DispInterfaceHead:
+    __slots__ = ("itf",)
+
     def __init__(self, itf: "DispInterface") -> None:
         self.itf = itf
 
 
 class DispInterfaceBody:
+    __slots__ = ("itf",)
+
     def __init__(self, itf: "DispInterface") -> None:
         self.itf = itf
 
@@ -169,11 +184,15 @@ class DispInterface:
 
 
 class ComInterfaceHead:
+    __slots__ = ("itf",)
+
     def __init__(self, itf: "ComInterface") -> None:
         self.itf = itf
 
 
 class ComInterfaceBody:
+    __slots__ = ("itf",)
+
     def __init__(self, itf: "ComInterface") -> None:
         self.itf = itf
 
@@ -1,13 +1,18 @@
 # typedesc.py - classes representing C type descriptions
+#
+# A type library may have hundreds of thousands of fields, arguments and
+# types, so the most numerous classes use `__slots__`, and their names are
+# interned; the same parameter and member names occur over and over.
+import sys
 from typing import Any, Optional, SupportsInt
 from typing import Union as _UnionT
 
-import comtypes
-
 
 class Argument:
     "a Parameter in the argument list of a callable (Function, Method, ...)"
 
+    __slots__ = ("atype", "name")
+
     def __init__(self, atype, name):
         self.atype = atype
         self.name = name
@@ -108,16 +113,18 @@ class Method(_HasArgs):
 
 
 class FundamentalType:
+    __slots__ = ("name", "size", "align")
     location = None
 
     def __init__(self, name, size, align):
-        self.name = name
+        self.name = sys.intern(name)
         if name != "void":
             self.size = int(size)
             self.align = int(align)
 
 
 class PointerType:
+    __slots__ = ("typ", "size", "align")
     location = None
 
     def __init__(self, typ, size, align):
@@ -127,14 +134,16 @@ class PointerType:
 
 
 class Typedef:
+    __slots__ = ("name", "typ")
     location = None
 
     def __init__(self, name, typ):
-        self.name = name
+        self.name = sys.intern(name)
         self.typ = typ
 
 
 class ArrayType:
+    __slots__ = ("typ", "min", "max")
     location = None
 
     def __init__(self, typ: Any, min: int, max: int) -> None:
@@ -144,6 +153,7 @@ class ArrayType:
 
 
 class StructureHead:
+    __slots__ = ("struct",)
     location = None
 
     def __init__(self, struct: "_Struct_Union_Base") -> None:
@@ -151,6 +161,7 @@ class StructureHead:
 
 
 class StructureBody:
+    __slots__ = ("struct",)
     location = None
 
     def __init__(self, struct: "_Struct_Union_Base") -> None:
@@ -224,16 +235,20 @@ class Union(_Struct_Union_Base):
 
 
 class Field:
+    __slots__ = ("name", "typ", "bits", "offset")
+
     def __init__(
         self, name: str, typ: Any, bits: Optional[Any], offset: SupportsInt
     ) -> None:
-        self.name = name
+        self.name = sys.intern(name)
         self.typ = typ
         self.bits = bits
         self.offset = int(offset)
 
 
 class CvQualifiedType:
+    __slots__ = ("typ", "const", "volatile")
+
     def __init__(self, typ, const, volatile):
         self.typ = typ
         self.const = const
@@ -254,8 +269,10 @@ class Enumeration:
 
 
 class EnumValue:
+    __slots__ = ("name", "value", "enumeration")
+
     def __init__(self, name: str, value: int, enumeration: Enumeration) -> None:
-        self.name = name
+        self.name = sys.intern(name)
         self.value = value
         self.enumeration = enumeration
 